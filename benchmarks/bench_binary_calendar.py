@@ -0,0 +1,97 @@
+"""Start-up cost of a consumer: parsing the CSV outputs into dicts versus memory-mapping the binary calendar.
+
+    python -m benchmarks.bench_binary_calendar --years 50 --lookups 200000
+"""
+import csv
+import time
+import random
+import argparse
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from src.model import read_day_data_csv, write_day_data_csv
+from src.proper_of_time import compute_years
+from src.binary_calendar import CalendarFile, read_citations_csv, write_calendar
+
+
+def load_csv_dicts(directory: Path, years) -> dict:
+    # What a consumer does today: every row of every year into a dict keyed by date
+    days = {}
+    for year in years:
+        with open(directory / f"day_data_{year}.csv", newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                days[row["date"]] = row
+        citations = directory / f"daily_bible_citations_{year}.csv"
+        if citations.exists():
+            with open(citations, newline="", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    days[row["Date"]]["citation"] = row["BibleCitationShort"]
+    return days
+
+
+def best_of(func, repeat):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark binary calendar loading")
+    parser.add_argument("--years", type=int, default=50, help="Years in the dataset (2026 parsed, the rest computed)")
+    parser.add_argument("--lookups", type=int, default=200_000, help="Random lookups by date")
+    parser.add_argument("--repeat", type=int, default=5, help="Loads timed; the best is reported")
+    parser.add_argument("--data-dir", default="data", help="Directory with DAY_DATA.csv and the 2026 citations")
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir)
+    years = list(range(2026, 2026 + args.years))
+    computed = compute_years(years[1:])
+    records = {2026: read_day_data_csv(data_dir / "DAY_DATA.csv"), **computed}
+    citations_2026 = data_dir / "daily_bible_citations_2026.csv"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for year in years:
+            write_day_data_csv(records[year], tmp / f"day_data_{year}.csv")
+        (tmp / citations_2026.name).write_bytes(citations_2026.read_bytes())
+        binary = tmp / "calendars.litcal"
+        sizes, write_s = best_of(lambda: write_calendar(binary, {
+            y: (records[y], read_citations_csv(citations_2026) if y == 2026 else {}) for y in years}), 1)
+        csv_bytes = sum(p.stat().st_size for p in tmp.glob("*.csv"))
+        print(f"{len(years)} years: CSV {csv_bytes / 1e6:.2f} MB, binary {sizes['bytes'] / 1e6:.2f} MB "
+              f"({sizes['strings']:,} interned strings), packed in {write_s * 1000:.1f} ms")
+
+        def open_binary():
+            calendar = CalendarFile(binary)
+            calendar.day(date(2026, 1, 1))
+            return calendar
+
+        dicts, csv_s = best_of(lambda: load_csv_dicts(tmp, years), args.repeat)
+        _, open_s = best_of(lambda: open_binary().close(), args.repeat)
+        calendar = open_binary()
+        print("\n== load ==")
+        print(f"{'CSV → dicts':<24} {csv_s * 1000:>9.2f} ms")
+        print(f"{'mmap open + first day':<24} {open_s * 1000:>9.2f} ms   ({csv_s / open_s:,.0f}x faster)")
+
+        rng = random.Random(2026)
+        first, last = date(years[0], 1, 1).toordinal(), date(years[-1], 12, 31).toordinal()
+        dates = [date.fromordinal(rng.randint(first, last)) for _ in range(args.lookups)]
+        keys = [d.isoformat() for d in dates]
+        print(f"\n== {args.lookups:,} random lookups ==")
+        _, dict_s = best_of(lambda: [dicts[k]["liturgical_color"] for k in keys], 1)
+        _, color_s = best_of(lambda: [calendar.color(d) for d in dates], 1)
+        _, day_s = best_of(lambda: [calendar.day(d) for d in dates], 1)
+        print(f"{'dict color':<24} {args.lookups / dict_s:>12,.0f}/s")
+        print(f"{'mmap color':<24} {args.lookups / color_s:>12,.0f}/s")
+        print(f"{'mmap full DayRecord':<24} {args.lookups / day_s:>12,.0f}/s")
+        calendar.close()
+        # Dicts hold every row; the map holds nothing until a page is touched
+        print(f"\nCSV dicts kept {len(dicts):,} rows in memory; the binary file is paged in on demand")
+
+
+if __name__ == "__main__":
+    main()
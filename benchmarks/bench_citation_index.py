@@ -0,0 +1,97 @@
+"""Lookup latency of the citation index over many years, against scanning the citation CSVs.
+
+    python -m benchmarks.bench_citation_index --years 100
+"""
+import csv
+import time
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+from benchmarks.bench_sqlite_export import shifted_citations
+from src.utils.citation_index import CitationIndex, chapters_in, index_path_for, lectionary_numbers, normalize_book
+
+LOOKUPS = [("book", "Jn", 1), ("book", "1 Sm", None), ("lectionary", "205", None), ("psalter", "III", None)]
+
+
+def scan_csvs(paths, kind, key, chapter):
+    # What the query costs today: read every CSV and parse every line
+    dates = []
+    for path in paths:
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                line = row["SourceLine"]
+                if kind == "book":
+                    hit = any(normalize_book(b) == normalize_book(key) and chapter in (None, c) for b, c in chapters_in(line))
+                elif kind == "lectionary":
+                    hit = key in lectionary_numbers(line)
+                else:
+                    hit = f"Pss {key}" in line
+                if hit:
+                    dates.append(row["Date"])
+    return dates
+
+
+def lookup(index, kind, key, chapter):
+    if kind == "book":
+        return index.dates_for(key, chapter)
+    if kind == "lectionary":
+        return index.dates_for_lectionary(key)
+    return index.dates_for_psalter(key)
+
+
+def median_time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the citation index")
+    parser.add_argument("--years", type=int, default=100, help="Years of citations (2026 readings re-dated)")
+    parser.add_argument("--repeat", type=int, default=200, help="Runs per lookup; the median is reported")
+    parser.add_argument("--data-dir", default="data", help="Directory with daily_bible_citations_2026.csv")
+    args = parser.parse_args()
+
+    years = list(range(2026, 2026 + args.years))
+    with open(Path(args.data_dir) / "daily_bible_citations_2026.csv", newline="", encoding="utf-8") as f:
+        citations = list(csv.DictReader(f))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csvs, index_files = [], []
+        build_s = 0.0
+        for year in years:
+            rows = shifted_citations(citations, year)
+            path = tmp / f"daily_bible_citations_{year}.csv"
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=["Date", "BibleCitationShort", "SourceLine"])
+                writer.writeheader()
+                writer.writerows(rows)
+            start = time.perf_counter()
+            CitationIndex.from_citations(rows).save(index_path_for(path))
+            build_s += time.perf_counter() - start
+            csvs.append(path)
+            index_files.append(index_path_for(path))
+
+        size = sum(p.stat().st_size for p in index_files)
+        index, load_s = median_time(lambda: CitationIndex.load(*index_files), 3)
+        print(f"{len(years)} years: index built in {build_s * 1000:.0f} ms during the pass, "
+              f"{size / 1e6:.2f} MB on disk, loaded in {load_s * 1000:.0f} ms")
+
+        print(f"\n== lookups (index: median of {args.repeat}) ==")
+        print(f"{'query':<22} {'index':>10} {'CSV scan':>10} {'dates':>7}")
+        for kind, key, chapter in LOOKUPS:
+            label = f"{kind} {key}" + (f" {chapter}" if chapter else "")
+            dates, index_s = median_time(lambda: lookup(index, kind, key, chapter), args.repeat)
+            scanned, scan_s = median_time(lambda: scan_csvs(csvs, kind, key, chapter), 1)
+            assert sorted(set(scanned)) == dates, label
+            print(f"{label:<22} {index_s * 1000:>8.3f}ms {scan_s * 1000:>8.0f}ms {len(dates):>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Throughput of the structured citation parser over every citation of a multi-year batch.
+
+    python -m benchmarks.bench_citation_parser --years 50
+"""
+import re
+import csv
+import time
+import argparse
+from pathlib import Path
+
+from benchmarks.bench_sqlite_export import shifted_citations
+from src.utils.citation_parser import parse_citation_line, short_citation
+
+# The pattern shorten_bible_citation used before the structured parser
+LEGACY_PATTERN = re.compile(r"([1-3]?\s?[A-Za-z]+\s*\d+)")
+
+
+def legacy_short(line: str) -> str:
+    return " / ".join(m.strip() for m in LEGACY_PATTERN.findall(line))
+
+
+def timed(func, lines):
+    start = time.perf_counter()
+    for line in lines:
+        func(line)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark citation parsing")
+    parser.add_argument("--years", type=int, default=50, help="Years in the batch (2026 readings re-dated)")
+    parser.add_argument("--data-dir", default="data", help="Directory with daily_bible_citations_2026.csv")
+    args = parser.parse_args()
+
+    with open(Path(args.data_dir) / "daily_bible_citations_2026.csv", newline="", encoding="utf-8") as f:
+        citations = list(csv.DictReader(f))
+    lines = [row["SourceLine"] for year in range(2026, 2026 + args.years) for row in shifted_citations(citations, year)]
+    print(f"{args.years} years: {len(lines):,} citation lines, {len(set(lines)):,} distinct")
+
+    unmemoized = parse_citation_line.__wrapped__
+    parse_citation_line.cache_clear()
+    rows = [
+        ("legacy regex (short only)", timed(legacy_short, lines)),
+        ("structured, no memo", timed(unmemoized, lines)),
+        ("structured, LRU memo", timed(parse_citation_line, lines)),
+        ("short form, LRU memo", timed(short_citation, lines)),
+    ]
+    info = parse_citation_line.cache_info()
+
+    print(f"\n{'parser':<28} {'total':>10} {'lines/s':>12}")
+    for label, seconds in rows:
+        print(f"{label:<28} {seconds * 1000:>8.1f}ms {len(lines) / seconds:>12,.0f}")
+    references = sum(len(parse_citation_line(line)) for line in lines)
+    print(f"\n{references:,} references parsed; memo {info.hits:,} hits / {info.misses:,} misses "
+          f"({info.currsize:,} of {info.maxsize:,} slots)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Memory and time of the typed DayRecord handoff versus the old write-then-reread of DAY_DATA.
+
+    python -m benchmarks.bench_day_model --day-data data/DAY_DATA.csv --years 50
+"""
+import csv
+import time
+import argparse
+import tempfile
+import tracemalloc
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from src.model import DayRecord, read_day_data_csv, write_day_data_csv
+from src.build import generate_liturgical_calendar, generate_weekly_index, generate_us_holidays
+
+
+def replicate_years(template, years):
+    """Re-date a one-year template onto consecutive years by day of year."""
+    records = []
+    for year in range(2026, 2026 + years):
+        start = date(year, 1, 1)
+        days_in_year = (date(year + 1, 1, 1) - start).days
+        for doy, record in enumerate(template[:days_in_year]):
+            records.append(record.copy(date=start + timedelta(days=doy)))
+    return records
+
+
+def measure_memory(func):
+    """Bytes still held by func()'s result, and the peak while building it."""
+    tracemalloc.start()
+    result = func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current, peak
+
+
+def measure_time(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def read_string_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        return [row for row in reader]
+
+
+def legacy_handoff(records, out_dir):
+    # What main() used to do: write DAY_DATA, read it back as strings, and have
+    # each of the three generators strptime every date again
+    path = out_dir / "legacy_day_data.csv"
+    write_day_data_csv(records, path)
+    rows = read_string_rows(path)
+    for _ in range(3):
+        for row in rows:
+            datetime.strptime(row[0], "%Y-%m-%d")
+    return rows
+
+
+def typed_handoff(records, out_dir):
+    write_day_data_csv(records, out_dir / "typed_day_data.csv")
+    for _ in range(3):
+        for record in records:
+            record.date
+    return records
+
+
+def run_generators(records, out_dir):
+    generate_liturgical_calendar(records, out_dir / "calendar.csv")
+    generate_weekly_index(records, out_dir / "weekly.csv")
+    generate_us_holidays(records, out_dir / "holidays.csv")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the typed day model")
+    parser.add_argument("--day-data", default="data/DAY_DATA.csv", help="One-year DAY_DATA CSV used as template")
+    parser.add_argument("--years", type=int, default=50, help="Size of the multi-year batch")
+    args = parser.parse_args()
+
+    template = read_day_data_csv(Path(args.day_data))
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(tmp)
+        for label, years in [("1 year", 1), (f"{args.years} years", args.years)]:
+            records = replicate_years(template, years)
+            csv_path = out_dir / "batch_day_data.csv"
+            write_day_data_csv(records, csv_path)
+
+            str_mem, _ = measure_memory(lambda: read_string_rows(csv_path))
+            rec_mem, _ = measure_memory(lambda: read_day_data_csv(csv_path))
+            _, legacy_peak = measure_memory(lambda: legacy_handoff(records, out_dir))
+            _, typed_peak = measure_memory(lambda: typed_handoff(records, out_dir))
+            legacy_s = measure_time(lambda: legacy_handoff(records, out_dir))
+            typed_s = measure_time(lambda: typed_handoff(records, out_dir))
+            gen_s = measure_time(lambda: run_generators(records, out_dir))
+
+            print(f"\n== {label}: {len(records)} days ==")
+            print(f"{'resident day data':<26} string rows {str_mem / 1024:>8.0f} KiB   DayRecords {rec_mem / 1024:>8.0f} KiB")
+            print(f"{'handoff time':<26} reread      {legacy_s * 1000:>8.1f} ms    typed      {typed_s * 1000:>8.1f} ms")
+            print(f"{'handoff peak memory':<26} reread      {legacy_peak / 1024:>8.0f} KiB   typed      {typed_peak / 1024:>8.0f} KiB")
+            print(f"{'3 generators on records':<26} {gen_s * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
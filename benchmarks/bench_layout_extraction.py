@@ -0,0 +1,94 @@
+"""Full-page extract_text() against layout extraction of the calendar grid: extraction
+time, text handed to the parsers, parse time, and whether both give the same datasets.
+
+    python -m benchmarks.bench_layout_extraction --input-pdf USCCB_2026_Feast_Calendar_CLEAN.pdf --repeat 5
+
+Exits 1 when the day records or citations of the two modes differ.
+"""
+import io
+import time
+import argparse
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from src.build import extract_day_data
+from src.utils.daily_bible_citation import extract_daily_bible_citations
+from src.utils.page_layout import extract_page
+from src.utils.page_text import TextPages
+from src.utils.tokenizer import classify_line
+
+MODES = {"text": False, "layout": True}
+
+
+def extract_all(pdf_path: Path, layout: bool) -> tuple:
+    """Page texts of a freshly opened PDF and the seconds spent producing them."""
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        start = time.perf_counter()
+        texts = [extract_page(page, layout) for page in pdf.pages]
+        return texts, time.perf_counter() - start
+
+
+def parse(texts, year: int, out_dir: Path) -> tuple:
+    """(day records, citations) of the page texts, and the seconds each parser took."""
+    start = time.perf_counter()
+    days = extract_day_data(None, year, pages=TextPages(texts))
+    day_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        citations = extract_daily_bible_citations(None, out_dir / "citations.csv", pages=TextPages(texts), year=year)
+    return days, citations, day_seconds, time.perf_counter() - start
+
+
+def classify_seconds(texts) -> float:
+    lines = [line.strip() for text in texts for line in (text or "").splitlines() if line.strip()]
+    start = time.perf_counter()
+    for line in lines:
+        classify_line(line)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark layout extraction against extract_text()")
+    parser.add_argument("--input-pdf", required=True, help="Path to the USCCB calendar PDF")
+    parser.add_argument("--year", type=int, default=2026)
+    parser.add_argument("--repeat", type=int, default=3, help="Best of this many runs for every timing")
+    args = parser.parse_args(argv)
+    pdf_path = Path(args.input_pdf)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, layout in MODES.items():
+            runs = [extract_all(pdf_path, layout) for _ in range(args.repeat)]
+            texts = runs[0][0]
+            parses = [parse(texts, args.year, Path(tmp)) for _ in range(args.repeat)]
+            results[name] = {
+                "texts": texts,
+                "extract": min(seconds for _, seconds in runs),
+                "days": parses[0][0],
+                "citations": parses[0][1],
+                "day_parse": min(p[2] for p in parses),
+                "citation_parse": min(p[3] for p in parses),
+                "classify": min(classify_seconds(texts) for _ in range(args.repeat)),
+            }
+
+    print(f"{len(results['text']['texts'])} pages, best of {args.repeat}\n")
+    print(f"{'mode':<7} {'extract':>9} {'chars':>8} {'lines':>6} {'classify':>9} {'days':>9} {'citations':>10}")
+    for name, r in results.items():
+        chars = sum(len(text or "") for text in r["texts"])
+        lines = sum(len((text or "").splitlines()) for text in r["texts"])
+        print(f"{name:<7} {r['extract']:>8.2f}s {chars:>8} {lines:>6} {r['classify'] * 1000:>7.1f}ms "
+              f"{r['day_parse'] * 1000:>7.1f}ms {r['citation_parse'] * 1000:>8.1f}ms")
+
+    text, layout = results["text"], results["layout"]
+    print(f"\nextraction {text['extract'] / layout['extract']:.2f}x, "
+          f"parsing {(text['day_parse'] + text['citation_parse']) / (layout['day_parse'] + layout['citation_parse']):.2f}x")
+    if text["days"] != layout["days"] or text["citations"] != layout["citations"]:
+        raise SystemExit("❌ Layout extraction changes the day records or citations")
+    print(f"✅ Same {len(text['days'])} day records and {len(text['citations'])} citations in both modes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Throughput of process-pool page extraction from 1 to N workers.
+
+    python -m benchmarks.bench_parallel_extraction --input-pdf USCCB_2026_Feast_Calendar_CLEAN.pdf --max-workers 4
+"""
+import os
+import time
+import argparse
+from pathlib import Path
+
+from src.utils.page_text import extract_pages_parallel
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel pdfplumber page extraction")
+    parser.add_argument("--input-pdf", required=True, help="Path to the USCCB calendar PDF")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--first-page", type=int, default=0, help="0-based first page to extract")
+    args = parser.parse_args()
+
+    pdf_path = Path(args.input_pdf)
+    import pdfplumber
+    with pdfplumber.open(pdf_path) as pdf:
+        page_indexes = list(range(args.first_page, len(pdf.pages)))
+
+    print(f"{len(page_indexes)} pages, {os.cpu_count()} CPUs available\n")
+    print(f"{'workers':>7} {'seconds':>8} {'pages/s':>8} {'speedup':>8}")
+    baseline = None
+    reference = None
+    for workers in range(1, args.max_workers + 1):
+        start = time.perf_counter()
+        results = extract_pages_parallel(pdf_path, page_indexes, workers)
+        elapsed = time.perf_counter() - start
+
+        if reference is None:
+            reference = results
+        elif results != reference:
+            raise SystemExit(f"❌ Output with {workers} workers differs from the serial run")
+
+        baseline = baseline or elapsed
+        print(f"{workers:>7} {elapsed:>8.2f} {len(page_indexes) / elapsed:>8.1f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
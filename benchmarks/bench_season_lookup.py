@@ -0,0 +1,105 @@
+"""Date → season/week lookups: bisect over the boundary table versus the old comparison chain.
+
+    python -m benchmarks.bench_season_lookup --lookups 2000000
+"""
+import time
+import random
+import argparse
+from datetime import date, timedelta
+
+from src.seasons import SeasonIndex
+from src.utils.calendar_rules import easter_date
+
+
+def legacy_anchors(year):
+    easter = easter_date(year)
+    christmas = date(year, 12, 25)
+    return {
+        "easter": easter,
+        "ash_wednesday": easter - timedelta(days=46),
+        "pentecost": easter + timedelta(days=49),
+        "christmas": christmas,
+        "advent_start": christmas - timedelta(days=(christmas.weekday() + 22)),
+    }
+
+
+def legacy_season(d, a):
+    # The chain generate_weekly_index used before the boundary table
+    year = d.year
+    if d >= a["advent_start"] and d <= a["christmas"]:
+        return "Advent"
+    elif d >= date(year, 12, 25) and d <= date(year + 1, 1, 9):
+        return "Christmas"
+    elif d >= date(year, 1, 5) and d < a["ash_wednesday"]:
+        return "Ordinary Time"
+    elif d >= a["ash_wednesday"] and d < a["easter"]:
+        return "Lent"
+    elif d >= a["easter"] and d <= a["pentecost"]:
+        return "Easter"
+    return "Ordinary Time"
+
+
+def legacy_weekly_labels(week_starts, anchors):
+    # Season per week plus the quadratic "weeks already in this season" scan
+    weeks = []
+    for week_start in week_starts:
+        season = legacy_season(week_start, anchors[week_start.year])
+        season_weeks = [w for w in weeks if w[0] == season]
+        weeks.append((season, len(season_weeks) + 1))
+    return weeks
+
+
+def indexed_weekly_labels(week_starts, index):
+    return [index.liturgical_week_for(week_start) for week_start in week_starts]
+
+
+def lookup_all(func, dates):
+    # Results are dropped so the timing is the lookup, not list growth and GC
+    for d in dates:
+        func(d)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark season lookups")
+    parser.add_argument("--lookups", type=int, default=2_000_000, help="Random dates to look up")
+    parser.add_argument("--first-year", type=int, default=1900)
+    parser.add_argument("--last-year", type=int, default=2100)
+    args = parser.parse_args()
+
+    rng = random.Random(2026)
+    first = date(args.first_year, 1, 1).toordinal()
+    last = date(args.last_year, 12, 31).toordinal()
+    dates = [date.fromordinal(rng.randint(first, last)) for _ in range(args.lookups)]
+
+    index, build_s = timed(lambda: SeasonIndex(args.first_year, args.last_year))
+    anchors, anchors_s = timed(lambda: {y: legacy_anchors(y) for y in range(args.first_year, args.last_year + 1)})
+    print(f"Boundary table: {len(index)} rows for {args.last_year - args.first_year + 1} years built in {build_s * 1000:.1f} ms "
+          f"(legacy anchors {anchors_s * 1000:.1f} ms)")
+
+    _, legacy_s = timed(lambda: lookup_all(lambda d: legacy_season(d, anchors[d.year]), dates))
+    _, season_s = timed(lambda: lookup_all(index.season_for, dates))
+    _, week_s = timed(lambda: lookup_all(index.liturgical_week_for, dates))
+    print(f"\n== {len(dates):,} random lookups ==")
+    print(f"{'comparison chain (season)':<30} {legacy_s:>7.2f}s  {len(dates) / legacy_s:>12,.0f}/s")
+    print(f"{'bisect season_for':<30} {season_s:>7.2f}s  {len(dates) / season_s:>12,.0f}/s")
+    print(f"{'bisect liturgical_week_for':<30} {week_s:>7.2f}s  {len(dates) / week_s:>12,.0f}/s")
+
+    # Weekly index: one lookup per Monday; the legacy week count rescans every stored week
+    for years in (1, 10, 50):
+        start = date(args.first_year, 1, 1)
+        monday = start - timedelta(days=start.weekday())
+        week_starts = [monday + timedelta(weeks=n) for n in range(years * 52)]
+        _, legacy_s = timed(lambda: legacy_weekly_labels(week_starts, anchors))
+        _, indexed_s = timed(lambda: indexed_weekly_labels(week_starts, index))
+        print(f"weekly labels, {years:>2} years ({len(week_starts):>5} weeks): legacy {legacy_s * 1000:>9.1f} ms   "
+              f"indexed {indexed_s * 1000:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Ingest time and query latency of the SQLite export for a multi-year build, against scanning the CSVs.
+
+    python -m benchmarks.bench_sqlite_export --years 100
+"""
+import csv
+import time
+import sqlite3
+import argparse
+import tempfile
+import statistics
+from datetime import date
+from pathlib import Path
+
+from src import seasons
+from src.model import write_day_data_csv
+from src.proper_of_time import compute_years
+from src.sqlite_export import export_sqlite
+
+QUERIES = {
+    "Marian feasts in Lent": (
+        "SELECT d.date, d.feast_primary_name FROM days d WHERE d.season = 'Lent' AND d.rowid IN "
+        "(SELECT rowid FROM days_fts WHERE days_fts MATCH 'mary OR marian OR lady')"
+    ),
+    "readings with Mt 5": (
+        "SELECT date, citation_short FROM citations WHERE id IN "
+        "(SELECT rowid FROM citations_fts WHERE citations_fts MATCH '\"Mt 5\"')"
+    ),
+    "solemnities, one year": "SELECT date, feast_primary_name FROM days WHERE year = 2030 AND feast_rank = 'Solemnity'",
+    "red days, all years": "SELECT COUNT(*) FROM days WHERE liturgical_color = 'Red'",
+    "one date": "SELECT * FROM days WHERE date = '2040-12-25'",
+}
+
+
+def shifted_citations(rows, year):
+    """The 2026 readings re-dated into another year, so every year has citations to search."""
+    shifted = []
+    for row in rows:
+        d = date.fromisoformat(row["Date"])
+        try:
+            shifted.append({**row, "Date": d.replace(year=year).isoformat()})
+        except ValueError:
+            continue  # Feb 29
+    return shifted
+
+
+def scan_csvs(directory: Path, years):
+    # What the query costs today: load every CSV and filter in Python
+    marian, mt5 = [], []
+    for year in years:
+        with open(directory / f"day_data_{year}.csv", newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                name = row["feast_primary_name"].lower()
+                if ("mary" in name or "marian" in name or "lady" in name) and \
+                        seasons.season_for(date.fromisoformat(row["date"])) == "Lent":
+                    marian.append(row["date"])
+        with open(directory / f"daily_bible_citations_{year}.csv", newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                if "Mt 5" in row["BibleCitationShort"]:
+                    mt5.append(row["Date"])
+    return marian, mt5
+
+
+def latency(conn, sql, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = conn.execute(sql).fetchall()
+        times.append(time.perf_counter() - start)
+    return rows, statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SQLite export")
+    parser.add_argument("--years", type=int, default=100, help="Years exported (from 2026 on, computed)")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query; the median is reported")
+    parser.add_argument("--data-dir", default="data", help="Directory with daily_bible_citations_2026.csv")
+    args = parser.parse_args()
+
+    years = list(range(2026, 2026 + args.years))
+    with open(Path(args.data_dir) / "daily_bible_citations_2026.csv", newline="", encoding="utf-8") as f:
+        citations = list(csv.DictReader(f))
+    records = compute_years(years)
+    datasets = [{"year": y, "source": "computed", "day_data": records[y], "citations": shifted_citations(citations, y)}
+                for y in years]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        db = tmp / "calendar.sqlite"
+        counts = export_sqlite(db, datasets)
+        rows = counts["days"] + counts["citations"]
+        print(f"Ingest: {counts['years']} years, {counts['days']:,} days + {counts['citations']:,} citations "
+              f"in {counts['seconds'] * 1000:.0f} ms ({rows / counts['seconds']:,.0f} rows/s), "
+              f"{db.stat().st_size / 1e6:.1f} MB")
+
+        for y in years:
+            write_day_data_csv(records[y], tmp / f"day_data_{y}.csv")
+            with open(tmp / f"daily_bible_citations_{y}.csv", "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=["Date", "BibleCitationShort", "SourceLine"])
+                writer.writeheader()
+                writer.writerows(datasets[y - years[0]]["citations"])
+
+        conn = sqlite3.connect(db)
+        print(f"\n== query latency (median of {args.repeat}) ==")
+        for label, sql in QUERIES.items():
+            result, seconds = latency(conn, sql, args.repeat)
+            print(f"{label:<26} {seconds * 1000:>8.2f} ms  {len(result):>6} rows")
+        conn.close()
+
+        start = time.perf_counter()
+        marian, mt5 = scan_csvs(tmp, years)
+        scan_s = time.perf_counter() - start
+        print(f"{'CSV scan (first two)':<26} {scan_s * 1000:>8.2f} ms  {len(marian):>6} + {len(mt5)} rows")
+
+
+if __name__ == "__main__":
+    main()
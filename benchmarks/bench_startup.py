@@ -0,0 +1,58 @@
+"""Import time of every `python -m src` command in a fresh interpreter, against src.cli.IMPORT_BUDGET_MS.
+
+    python -m benchmarks.bench_startup --repeat 7
+
+Exits 1 when a command goes over its budget or imports pdfplumber before opening a PDF.
+"""
+import sys
+import json
+import argparse
+import subprocess
+
+from src.cli import COMMANDS, IMPORT_BUDGET_MS
+
+PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "from src.cli import load_command\n"
+    "load_command(sys.argv[1])\n"
+    "seconds = time.perf_counter() - start\n"
+    "import json\n"
+    "print(json.dumps({'ms': seconds * 1000, 'pdfplumber': 'pdfplumber' in sys.modules, 'modules': len(sys.modules)}))\n"
+)
+
+
+def measure(command: str, repeat: int) -> dict:
+    """Fastest of `repeat` fresh-interpreter imports; the best run is the least disturbed one."""
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", PROBE, command],
+                             check=True, capture_output=True, text=True).stdout
+        runs.append(json.loads(out))
+    return min(runs, key=lambda r: r["ms"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure command import times against their budgets")
+    parser.add_argument("--repeat", type=int, default=7, help="Fresh interpreters per command")
+    parser.add_argument("--command", action="append", choices=list(COMMANDS), help="Only these commands")
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'command':<20} {'import':>9} {'budget':>8} {'modules':>8}  pdfplumber")
+    for command in args.command or COMMANDS:
+        result = measure(command, args.repeat)
+        budget = IMPORT_BUDGET_MS[command]
+        over = result["ms"] > budget or result["pdfplumber"]
+        failures += over
+        print(f"{command:<20} {result['ms']:>7.1f}ms {budget:>6}ms {result['modules']:>8}  "
+              f"{'loaded' if result['pdfplumber'] else 'deferred'}{'  ❌ over budget' if over else ''}")
+
+    if failures:
+        print(f"\n❌ {failures} commands over their import budget")
+        raise SystemExit(1)
+    print("\n✅ Every command within its import budget")
+
+
+if __name__ == "__main__":
+    main()
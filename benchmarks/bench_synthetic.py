@@ -0,0 +1,69 @@
+"""Parser throughput on synthetic USCCB-style corpora: 1x, 10x and 100x years, plus pathological pages.
+
+    python -m benchmarks.bench_synthetic --years 1,10,100
+"""
+import io
+import time
+import argparse
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from src.utils.day_parser import iter_page_lines, parse_day_data
+from src.utils.daily_bible_citation import extract_daily_bible_citations
+from src.utils.page_text import TextPages
+from src.utils.synthetic_calendar import generate
+
+FIRST_YEAR = 2026
+
+
+def scenarios(sizes):
+    for n in sizes:
+        yield f"{n} years", n, {}
+    # Stress shapes at the middle size
+    n = sizes[len(sizes) // 2]
+    yield f"{n} years, noise 10%", n, {"noise": 0.1}
+    yield f"{n} years, mojibake 30%", n, {"mojibake_rate": 0.3}
+    yield f"{n} years, one page per year", n, {"days_per_page": 366}
+
+
+def parse_corpus(corpus, out_dir: Path):
+    days = citations = 0
+    start = time.perf_counter()
+    for year in corpus.days:
+        pages = TextPages(corpus.year_pages(year))
+        days += sum(1 for _ in parse_day_data(iter_page_lines(pages), year))
+    day_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        for year in corpus.days:
+            pages = TextPages(corpus.year_pages(year))
+            citations += len(extract_daily_bible_citations(None, out_dir / "c.csv", pages=pages, year=year))
+    return days, day_seconds, citations, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the parsers on generated calendar text")
+    parser.add_argument("--years", default="1,10,100", help="Comma-separated corpus sizes in years")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    sizes = [int(n) for n in args.years.split(",")]
+
+    print(f"{'corpus':<30} {'pages':>7} {'MB':>6} {'generate':>9} {'days':>8} {'day parse':>10} "
+          f"{'days/s':>9} {'citations':>9} {'cite parse':>10} {'cites/s':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, n, options in scenarios(sizes):
+            start = time.perf_counter()
+            corpus = generate(range(FIRST_YEAR, FIRST_YEAR + n), seed=args.seed, **options)
+            generate_seconds = time.perf_counter() - start
+            size = sum(len(page) for page in corpus.pages) / 1e6
+
+            days, day_seconds, citations, cite_seconds = parse_corpus(corpus, Path(tmp))
+            print(f"{label:<30} {len(corpus.pages):>7,} {size:>6.1f} {generate_seconds:>8.2f}s {days:>8,} "
+                  f"{day_seconds:>9.2f}s {days / day_seconds:>9,.0f} {citations:>9,} {cite_seconds:>9.2f}s "
+                  f"{citations / cite_seconds:>9,.0f}")
+
+
+if __name__ == "__main__":
+    main()
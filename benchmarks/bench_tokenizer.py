@@ -0,0 +1,92 @@
+"""Lines per second of classify_line() against the per-line re calls it replaced.
+
+    python -m benchmarks.bench_tokenizer --input-pdf USCCB_2026_Feast_Calendar_CLEAN.pdf
+"""
+import re
+import time
+import argparse
+from pathlib import Path
+
+from src.utils.page_text import PageTextProvider
+from src.utils.page_cache import PageTextCache, DEFAULT_CACHE_DIR
+from src.utils.tokenizer import classify_line
+
+
+def legacy_day_checks(line):
+    # Inner loop of the old extract_day_data: separator, footnote, day entry, rank
+    if re.match(r"^(?:[-=_]{3,})$", line.strip()):
+        return "SEPARATOR"
+    if re.match(r"^(Notes?|Footnotes?)[:\s]*$", line.strip(), re.IGNORECASE):
+        return "FOOTNOTE"
+    re.search(
+        r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\b",
+        line, re.IGNORECASE
+    )
+    if re.match(
+        r"^(\d{1,2})\s+(?:\w+\s+)?(.+?)\s+((?:white|red|green|violet|black|rose|gold)"
+        r"(?:\s*(?:/|or)\s*(?:white|red|green|violet|black|rose|gold))*)$",
+        line, re.IGNORECASE
+    ):
+        return "DAY"
+    if re.search(r"(Feast|Memorial|Solemnity|Optional Memorial)", line, re.IGNORECASE):
+        return "RANK"
+    return "OTHER"
+
+
+def legacy_citation_checks(line):
+    # Per-line checks of the old extract_daily_bible_citations
+    month = r"^(JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER)\s+2026"
+    if re.fullmatch(r"[-–—]+", line):
+        return "SEPARATOR"
+    if re.match(month, line, re.IGNORECASE):
+        return "MONTH_HEADER"
+    if re.match(r"^(\d{1,2})\s+(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\b", line, re.IGNORECASE):
+        return "DAY"
+    if re.match(r"^[A-Z][a-zA-Z0-9\s,:;—\-/]+/[A-Z]", line) or re.search(r"\([\d]+\)", line):
+        return "CITATION"
+    if re.search(r"[A-Z][a-z]+\s\d+:\d+[-–]\d+/", line):
+        return "CITATION"
+    if re.search(r"([A-Z][a-zA-Z0-9]+:?\d*[:\d,\-]*)", line):
+        return "OTHER"
+    return "OTHER"
+
+
+def legacy_both(line):
+    legacy_day_checks(line)
+    return legacy_citation_checks(line)
+
+
+def time_lines(func, lines, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for line in lines:
+            func(line)
+    elapsed = time.perf_counter() - start
+    return len(lines) * repeat / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the compiled line tokenizer")
+    parser.add_argument("--input-pdf", required=True, help="Path to the USCCB calendar PDF")
+    parser.add_argument("--repeat", type=int, default=50, help="Passes over the calendar lines")
+    args = parser.parse_args()
+
+    pdf_path = Path(args.input_pdf)
+    with PageTextProvider(pdf_path, cache=PageTextCache(pdf_path, DEFAULT_CACHE_DIR)) as pages:
+        lines = [line for i in range(len(pages)) for line in pages.lines(i)]
+
+    print(f"{len(lines)} lines × {args.repeat} passes\n")
+    results = {
+        "legacy day-data checks": time_lines(legacy_day_checks, lines, args.repeat),
+        "legacy citation checks": time_lines(legacy_citation_checks, lines, args.repeat),
+        "legacy both extractors": time_lines(legacy_both, lines, args.repeat),
+        "classify_line (shared)": time_lines(classify_line, lines, args.repeat),
+    }
+    for name, rate in results.items():
+        print(f"{name:<24} {rate:>12,.0f} lines/s")
+    speedup = results["classify_line (shared)"] / results["legacy both extractors"]
+    print(f"\nOne shared classification is {speedup:.1f}x the two legacy passes")
+
+
+if __name__ == "__main__":
+    main()
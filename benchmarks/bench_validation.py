@@ -0,0 +1,148 @@
+"""Column validation throughput per field type: compiled set-based checks versus the old per-cell check_type.
+
+    python -m benchmarks.bench_validation --rows 2000000
+"""
+import csv
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+from datetime import date, datetime
+
+from src.schema import SCHEMAS
+from src.validate import compile_field, compile_schema, validate_csv, validate_file
+
+
+def legacy_check_type(value, expected_type):
+    # check_type as it was before the schema compiler
+    if expected_type == "string":
+        return isinstance(value, str) and value.strip() != ""
+    if expected_type == "int":
+        return value.isdigit()
+    if expected_type == "date":
+        try:
+            datetime.strptime(value, "%Y-%m-%d")
+            return True
+        except Exception:
+            return False
+    if isinstance(expected_type, list):
+        return value in expected_type
+    return True
+
+
+def synthetic_column(spec, rows, rng):
+    """Values with the repetition of a multi-year dataset: at most a few hundred years of dates."""
+    if spec.startswith("date"):
+        start = date(1900, 1, 1).toordinal()
+        step = 7 if spec != "date" else 1
+        # date.fromordinal(7) is a Sunday, so this start keeps "date (Sun)" columns valid
+        start += (7 - start % 7) % 7 if step == 7 else 0
+        days = [date.fromordinal(start + n).isoformat() for n in range(0, 201 * 365, step)]
+        return [rng.choice(days) for _ in range(rows)]
+    if spec == "YYYY-MM":
+        months = [f"{y}-{m:02d}" for y in range(1900, 2101) for m in range(1, 13)]
+        return [rng.choice(months) for _ in range(rows)]
+    if spec == "int":
+        return [str(rng.randint(0, 200)) for _ in range(rows)]
+    if spec.startswith("string"):
+        names = [f"Feast {n}" for n in range(2000)]
+        return [rng.choice(names) for _ in range(rows)]
+    allowed = sorted(compile_field(spec).allowed)
+    return [rng.choice(allowed) for _ in range(rows)]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def write_day_data(path, rows, rng):
+    """A DAY_DATA-shaped CSV where every tenth row has an invalid feast_rank."""
+    schema = SCHEMAS["DAY_DATA.csv"]
+    header = list(schema["fields"])
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for n in range(rows):
+            row = [date.fromordinal(n + 1).isoformat(), "Weekday", "Solemnity [note]" if n % 10 == 0 else "Weekday",
+                   "Green", "0", "", "0", "0", str(n % 6 + 1), str(n % 7 + 1), str(n % 31 + 1), "1", "12"]
+            writer.writerow(row)
+    return header
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark schema validation")
+    parser.add_argument("--rows", type=int, default=2_000_000, help="Synthetic rows per field type")
+    parser.add_argument("--file-rows", type=int, default=300_000, help="Rows in the file for the streaming comparison")
+    args = parser.parse_args()
+
+    rng = random.Random(2026)
+    specs = {
+        "date": "date",
+        "date (weekday)": "date (Sun)",
+        "YYYY-MM": "YYYY-MM",
+        "int": "int",
+        "string": "string",
+        "flag 0|1": "0|1",
+        "range 1–31": "1–31",
+        "enum": SCHEMAS["DAY_DATA.csv"]["fields"]["feast_rank"],
+    }
+
+    print(f"== {args.rows:,} rows per field type ==")
+    print(f"{'field type':<16} {'per-cell':>10} {'compiled':>10} {'rows/s compiled':>18} {'speedup':>8}")
+    # The per-cell check_type returned True for every spec except string/int/date, so
+    # those rows time a check that never looked at the value
+    for label, spec in specs.items():
+        column = synthetic_column(spec, args.rows, rng)
+        check = compile_field(spec)
+        _, legacy_s = timed(lambda: [v for v in column if not legacy_check_type(v, spec)])
+        bad, compiled_s = timed(lambda: check.invalid_values(column))
+        assert not bad, (label, sorted(bad)[:5])
+        note = "" if spec in ("string", "int", "date") else "  (per-cell did not check)"
+        print(f"{label:<16} {legacy_s:>9.2f}s {compiled_s:>9.3f}s {args.rows / compiled_s:>18,.0f} "
+              f"{legacy_s / compiled_s:>7.1f}x{note}")
+
+    # Whole table: DAY_DATA columns for many years stacked, with every schema rule applied
+    schema = SCHEMAS["DAY_DATA.csv"]
+    compiled = compile_schema("DAY_DATA.csv")
+    header = list(schema["fields"])
+    # Every date distinct, the worst case for the set-based date check
+    years = min(9999, max(1, args.rows // 366))
+    dates = [date.fromordinal(n) for n in range(1, date(years, 12, 31).toordinal() + 1)]
+    columns = [[d.isoformat() for d in dates]]
+    for name in header[1:]:
+        columns.append(synthetic_column(schema["fields"][name], len(dates), rng))
+    issues, table_s = timed(lambda: compiled.validate_columns(header, columns))
+    cells = len(dates) * len(header)
+    print(f"\nDAY_DATA x {years} years: {len(dates):,} rows, {cells:,} cells in {table_s:.2f}s "
+          f"({cells / table_s:,.0f} cells/s, {len(issues)} issue groups)")
+
+    # Whole-file messages versus streamed, capped summaries on a file with many errors
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "DAY_DATA.csv"
+        write_day_data(path, args.file_rows, rng)
+        size_mb = path.stat().st_size / 1e6
+        print(f"\n== {args.file_rows:,}-row file ({size_mb:.0f} MB), invalid feast_rank every 10th row ==")
+        errors, whole_s, whole_peak = peak_memory(lambda: validate_csv(path, "DAY_DATA.csv"))
+        print(f"{'read whole, one message/row':<30} {whole_s:>6.2f}s  peak {whole_peak / 1e6:>7.1f} MB  {len(errors):,} messages")
+        for chunk_rows in (10_000, 50_000):
+            result, stream_s, stream_peak = peak_memory(lambda: validate_file(path, "DAY_DATA.csv", chunk_rows))
+            print(f"{f'streamed, chunks of {chunk_rows:,}':<30} {stream_s:>6.2f}s  peak {stream_peak / 1e6:>7.1f} MB  "
+                  f"{len(result['issues'])} summaries for {result['issue_count']:,} issues")
+
+
+if __name__ == "__main__":
+    main()
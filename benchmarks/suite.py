@@ -0,0 +1,345 @@
+"""Timing suite for every extractor and generator, with JSON baselines and a regression check.
+
+    python -m benchmarks.suite run --input-pdf USCCB_2026_Feast_Calendar_CLEAN.pdf --out benchmarks/baselines/local.json
+    python -m benchmarks.suite run --input-pdf USCCB_2026_Feast_Calendar_CLEAN.pdf --warm --compare benchmarks/baselines/local.json
+    python -m benchmarks.suite compare benchmarks/baselines/local.json new.json --threshold 10
+
+Each case runs in its own fresh process, so its peak RSS is its own. Cold runs
+(the default) extract every page with pdfplumber; --warm serves page text from
+memory so only parsing is timed. Rates are computed from the best of --repeat runs,
+after one untimed warm-up run.
+"""
+import io
+import os
+import sys
+import csv
+import json
+import time
+import platform
+import argparse
+import resource
+import tempfile
+import multiprocessing
+from datetime import datetime
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from src import build
+from src.model import read_day_data_csv
+from src.schema import SCHEMAS
+from src.validate import validate_csv
+from src.utils.page_cache import PageTextCache
+from src.utils.page_map import PageMap
+from src.utils.page_text import PageTextProvider
+from src.utils.daily_bible_citation import extract_daily_bible_citations
+
+BASELINE_FORMAT = 1
+CASES = [
+    "extract_day_data", "extract_day_data_split", "extract_daily_bible_citations", "extract_major_feasts",
+    "generate_weekly_index", "generate_liturgical_calendar", "generate_us_holidays", "validate_csv", "main",
+]
+RATES = ["pages", "lines", "rows"]
+
+
+# -------------------- MEASUREMENT -------------------- #
+
+def peak_rss_mb() -> float:
+    # ru_maxrss survives exec on Linux, so a spawned case would report the parent's peak;
+    # VmHWM belongs to this process image alone
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def count_rows(path: Path) -> int:
+    with open(path, newline="", encoding="utf-8") as f:
+        return sum(1 for _ in csv.reader(f)) - 1
+
+
+class CountingPages(PageTextProvider):
+    """A provider that remembers which pages a case read; given texts and their page map
+    it never opens the PDF."""
+
+    def __init__(self, pdf_path: Path, texts: dict = None, page_map: PageMap = None):
+        super().__init__(pdf_path)
+        self.read = set()
+        if texts is not None:
+            self._texts = dict(texts)
+            self._page_count = len(texts)
+        self._page_map = page_map
+
+    def _text(self, page_index):
+        self.read.add(page_index)
+        return super()._text(page_index)
+
+    def units(self) -> dict:
+        lines = sum(len((self._texts.get(i) or "").splitlines()) for i in self.read)
+        return {"pages": len(self.read), "lines": lines}
+
+
+def _case(name: str, pdf_path: Path, year: int, out: Path, texts, cache_dir):
+    """Callable for one run of a case; it returns the units that run processed."""
+    day_data = read_day_data_csv(Path("data") / "DAY_DATA.csv")
+    page_map = PageMap.from_dict(PageTextCache(pdf_path, cache_dir).page_map()) if texts is not None else None
+
+    def with_pages(func):
+        def run():
+            with CountingPages(pdf_path, texts, page_map) as pages:
+                rows = func(pages)
+                return {**pages.units(), "rows": rows}
+        return run
+
+    def generator(func, csv_name, *extra):
+        def run():
+            func(day_data, out / csv_name, *extra)
+            return {"rows": count_rows(out / csv_name)}
+        return run
+
+    def main():
+        # Cold: every page goes through pdfplumber into an emptied cache, as on a first build
+        pages_dir = cache_dir or out / "page-cache"
+        argv = [str(year), "--input-pdf", str(pdf_path), "--out-dir", str(out / "main"), "--force",
+                "--cache-dir", str(pages_dir)] + ([] if cache_dir else ["--rebuild-cache"])
+        saved, sys.argv = sys.argv, ["build"] + argv
+        try:
+            build.main()
+        finally:
+            sys.argv = saved
+        cache = PageTextCache(pdf_path, pages_dir)
+        page_count = cache.page_count() or 0
+        lines = sum(len((cache.get(i) or "").splitlines()) for i in range(page_count))
+        return {"pages": page_count, "lines": lines, "rows": sum(count_rows(p) for p in (out / "main").glob("*.csv"))}
+
+    def check():
+        errors = validate_csv(Path("data") / "DAY_DATA.csv", SCHEMAS["DAY_DATA.csv"])
+        return {"rows": count_rows(Path("data") / "DAY_DATA.csv"), "issues": len(errors)}
+
+    return {
+        "extract_day_data": with_pages(lambda pages: len(build.extract_day_data(pdf_path, year, pages=pages))),
+        "extract_day_data_split": with_pages(
+            lambda pages: len(build.extract_day_data_split(pdf_path, out / "day_data.csv", year, pages=pages))),
+        "extract_daily_bible_citations": with_pages(lambda pages: len(extract_daily_bible_citations(
+            pdf_path, out / f"daily_bible_citations_{year}.csv", pages=pages, year=year))),
+        "extract_major_feasts": with_pages(lambda pages: (
+            build.extract_major_feasts(pdf_path, out / f"major_feasts_{year}.csv", pages=pages),
+            count_rows(out / f"major_feasts_{year}.csv"))[1]),
+        "generate_weekly_index": generator(build.generate_weekly_index, f"weekly_index_{year}.csv", year),
+        "generate_liturgical_calendar": generator(build.generate_liturgical_calendar,
+                                                  f"liturgical_calendar_{year}_simple.csv"),
+        "generate_us_holidays": generator(build.generate_us_holidays, f"us_holidays_{year}.csv"),
+        "validate_csv": check,
+        "main": main,
+    }[name]
+
+
+def run_case(name: str, pdf_path: str, year: int, repeat: int, texts, cache_dir, min_time: float = 0.2) -> dict:
+    """Entry point of the per-case process.
+
+    Cases faster than min_time are looped until one timing covers min_time, the way
+    timeit's autorange does, so millisecond cases are not lost in timer noise.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        func = _case(name, Path(pdf_path), year, Path(tmp), texts, cache_dir)
+        # The extractors announce every file they write
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            units = func()
+            first = time.perf_counter() - start
+            loops = max(1, int(min_time / first)) if first < min_time else 1
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for _ in range(loops):
+                    func()
+                times.append((time.perf_counter() - start) / loops)
+    best = min(times)
+    result = {"seconds": round(best, 6), "runs": [round(t, 6) for t in times], "loops": loops,
+              "first_run_seconds": round(first, 6)}
+    for unit in RATES:
+        if units.get(unit):
+            result[unit] = units[unit]
+            result[f"{unit}_per_s"] = round(units[unit] / best, 1)
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def calibrate(repeat: int = 5) -> float:
+    """Seconds for a fixed pure-Python workload: how fast this machine is right now."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        total = 0
+        for i in range(300_000):
+            total += i % 7
+        best = min(best, time.perf_counter() - start)
+    return round(best, 6)
+
+
+def extract_all_pages(pdf_path: Path) -> tuple:
+    with PageTextProvider(pdf_path) as pages:
+        return {i: pages.text(i) for i in range(len(pages))}, pages.page_map()
+
+
+def run_suite(pdf_path: Path, year: int, repeat: int, warm: bool, cases=CASES, on_result=None) -> dict:
+    texts = cache_dir = None
+    tmp = tempfile.TemporaryDirectory()
+    if warm:
+        texts, page_map = extract_all_pages(pdf_path)
+        cache_dir = Path(tmp.name) / "page-cache"
+        # Fill the page cache main() reads from
+        cache = PageTextCache(pdf_path, cache_dir)
+        cache.set_page_count(len(texts))
+        cache.set_page_map(page_map.to_dict())
+        for i, text in texts.items():
+            cache.put(i, text)
+
+    results = {}
+    calibration = calibrate()
+    # A fresh interpreter per case: peak RSS must not carry over from the previous one
+    context = multiprocessing.get_context("spawn")
+    try:
+        for name in cases:
+            with context.Pool(1) as pool:
+                results[name] = pool.apply(run_case, (name, str(pdf_path), year, repeat, texts, cache_dir))
+            if on_result:
+                on_result(name, results[name])
+    finally:
+        tmp.cleanup()
+
+    return {
+        "format": BASELINE_FORMAT,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "pdf": Path(pdf_path).name,
+        "year": year,
+        "mode": "warm" if warm else "cold",
+        "repeat": repeat,
+        "calibration_seconds": round((calibration + calibrate()) / 2, 6),
+        "cases": results,
+    }
+
+
+# -------------------- COMPARISON -------------------- #
+
+def machine_factor(baseline: dict, current: dict) -> float:
+    """How much slower the machine ran the calibration loop for current than for baseline."""
+    return current["calibration_seconds"] / baseline["calibration_seconds"]
+
+
+def compare(baseline: dict, current: dict, threshold: float = 10.0, rss_threshold: float = None,
+            normalize: bool = False) -> list:
+    """Per-case rows of (case, metric, before, after, change %, regressed).
+
+    Time regresses when it grows by more than threshold percent and is also slower
+    than every baseline run (the baseline's own spread is noise, not a regression);
+    peak RSS regresses when it grows by more than rss_threshold percent (threshold
+    when not given). With normalize=True current times are divided by machine_factor
+    first, which cancels a machine that is uniformly busier than when the baseline ran.
+    """
+    rss_threshold = threshold if rss_threshold is None else rss_threshold
+    factor = machine_factor(baseline, current) if normalize else 1.0
+    rows = []
+    for name, after in current["cases"].items():
+        before = baseline["cases"].get(name)
+        if before is None:
+            continue
+        for metric, limit in (("seconds", threshold), ("peak_rss_mb", rss_threshold)):
+            if not before.get(metric):
+                continue
+            value = after[metric] / factor if metric == "seconds" else after[metric]
+            change = (value - before[metric]) / before[metric] * 100
+            regressed = change > limit
+            if metric == "seconds":
+                regressed = regressed and value > max(before.get("runs") or [0])
+            rows.append((name, metric, before[metric], round(value, 6), round(change, 1), regressed))
+    return rows
+
+
+def print_results(results: dict):
+    print(f"\n{'case':<32} {'best s':>9} {'pages/s':>9} {'lines/s':>10} {'rows/s':>11} {'peak RSS':>10}")
+    for name, r in results["cases"].items():
+        rates = [f"{r[f'{u}_per_s']:,.0f}" if f"{u}_per_s" in r else "-" for u in RATES]
+        print(f"{name:<32} {r['seconds']:>9.4f} {rates[0]:>9} {rates[1]:>10} {rates[2]:>11} {r['peak_rss_mb']:>7.1f} MB")
+
+
+def print_comparison(rows, threshold: float) -> int:
+    regressions = [r for r in rows if r[5]]
+    print(f"\n{'case':<32} {'metric':<12} {'before':>10} {'after':>10} {'change':>8}")
+    for name, metric, before, after, change, regressed in rows:
+        flag = "  ❌ regression" if regressed else ""
+        print(f"{name:<32} {metric:<12} {before:>10.4f} {after:>10.4f} {change:>+7.1f}%{flag}")
+    if regressions:
+        print(f"\n❌ {len(regressions)} regressions beyond the threshold ({threshold:g}% time)")
+    else:
+        print("\n✅ No regressions beyond the threshold")
+    return len(regressions)
+
+
+def load_baseline(path: Path) -> dict:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if data.get("format") != BASELINE_FORMAT:
+        raise SystemExit(f"❌ {path}: baseline format {data.get('format')}, expected {BASELINE_FORMAT}")
+    return data
+
+
+# -------------------- MAIN -------------------- #
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite with JSON baselines")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Time every case and optionally save or compare the results")
+    run.add_argument("--input-pdf", required=True, help="Path to the USCCB calendar PDF")
+    run.add_argument("--year", type=int, default=2026)
+    run.add_argument("--repeat", type=int, default=5, help="Timed runs per case; the best is kept")
+    run.add_argument("--warm", action="store_true", help="Serve page text from memory instead of pdfplumber")
+    run.add_argument("--case", action="append", choices=CASES, help="Only run these cases (repeatable)")
+    run.add_argument("--out", help="Write the results as a JSON baseline")
+    run.add_argument("--compare", help="Baseline JSON to compare the results against")
+    run.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent")
+    run.add_argument("--rss-threshold", type=float, help="Allowed peak RSS growth in percent (default: --threshold)")
+    run.add_argument("--normalize", action="store_true", help="Scale times by the calibration loop of both runs")
+
+    diff = commands.add_parser("compare", help="Compare two saved baselines")
+    diff.add_argument("baseline", help="Reference results")
+    diff.add_argument("current", help="New results")
+    diff.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent")
+    diff.add_argument("--rss-threshold", type=float, help="Allowed peak RSS growth in percent (default: --threshold)")
+    diff.add_argument("--normalize", action="store_true", help="Scale times by the calibration loop of both runs")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        baseline, current = load_baseline(args.baseline), load_baseline(args.current)
+    else:
+        baseline = load_baseline(args.compare) if args.compare else None
+        print(f"⏱️  {len(args.case or CASES)} cases, best of {args.repeat}, {'warm' if args.warm else 'cold'} page text")
+        current = run_suite(Path(args.input_pdf), args.year, args.repeat, args.warm, args.case or CASES,
+                            on_result=lambda name, r: print(f"   {name}: {r['seconds']:.4f}s"))
+        print_results(current)
+        if args.out:
+            Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+            Path(args.out).write_text(json.dumps(current, indent=2), encoding="utf-8")
+            print(f"\n💾 Baseline written to {args.out}")
+        if baseline is None:
+            return
+
+    if baseline["mode"] != current["mode"]:
+        print(f"⚠️  Comparing a {baseline['mode']} baseline with {current['mode']} results")
+    print(f"🖥️  Calibration loop {machine_factor(baseline, current):.2f}x the baseline's"
+          + (" (times normalized)" if args.normalize else ""))
+    rows = compare(baseline, current, args.threshold, args.rss_threshold, args.normalize)
+    if print_comparison(rows, args.threshold):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
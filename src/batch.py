@@ -0,0 +1,256 @@
+# ----------------------------------------------------------
+# Batch build: several years or editions built in parallel into one output tree
+# ----------------------------------------------------------
+import os
+import csv
+import json
+import time
+import hashlib
+import argparse
+from pathlib import Path
+from argparse import Namespace
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.build import build_year
+from src.proper_of_time import cross_check
+from src.sqlite_export import export_sqlite, load_output_dir
+from src.utils.page_cache import add_cache_arguments, page_cache_from_args
+
+
+# -------------------- JOB PLANNING -------------------- #
+
+def parse_job(spec: str) -> tuple:
+    """'2027=path/to/calendar.pdf' -> (2027, Path('path/to/calendar.pdf'))"""
+    year, sep, pdf = spec.partition("=")
+    if not sep or not year.strip().isdigit() or not pdf.strip():
+        raise argparse.ArgumentTypeError(f"Expected YEAR=PDF, got {spec!r}")
+    return int(year), Path(pdf.strip())
+
+
+def parse_year_range(spec: str) -> range:
+    """'2026-2030' or '2026' -> inclusive range of years"""
+    first, _, last = spec.partition("-")
+    try:
+        first, last = int(first), int(last or first)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected YEAR or FIRST-LAST, got {spec!r}")
+    if last < first:
+        raise argparse.ArgumentTypeError(f"Empty year range {spec!r}")
+    return range(first, last + 1)
+
+
+def plan_jobs(pairs, out_root: Path) -> list:
+    """One job per (year, pdf) pair, each with its own output directory.
+
+    A year normally builds into out_root/<year>; when several editions of the
+    same year are given they are told apart by the PDF name, and PDFs of the same
+    name also by a short hash of their resolved path. A pdf of None means the year
+    is computed from rules.
+    """
+    # The same file named two ways is one job
+    unique = {}
+    for year, pdf in pairs:
+        pdf = Path(pdf) if pdf else None
+        unique.setdefault((year, pdf.resolve() if pdf else None), (year, pdf))
+    pairs = sorted(unique.values(), key=lambda p: (p[0], str(p[1] or "")))
+    labels = {(year, pdf): pdf.stem if pdf else "computed" for year, pdf in pairs}
+    counts = Counter(year for year, _ in pairs)
+    label_counts = Counter((year, label) for (year, _), label in labels.items())
+
+    jobs = []
+    for year, pdf in pairs:
+        label = labels[year, pdf]
+        if label_counts[year, label] > 1:
+            path = str(pdf.resolve()) if pdf else ""
+            label = f"{label}-{hashlib.sha256(path.encode('utf-8')).hexdigest()[:8]}"
+        name = str(year) if counts[year] == 1 else f"{year}-{label}"
+        jobs.append({"year": year, "pdf": pdf, "out_dir": Path(out_root) / name})
+    return jobs
+
+
+# -------------------- WORKER -------------------- #
+
+def run_job(job: dict, cache_args: Namespace, jobs: int = 4, force: bool = False) -> dict:
+    """Build one year in a worker process; failures are reported, not raised.
+
+    Parsed years are cross-checked against the computed proper of time.
+    """
+    start = time.perf_counter()
+    pdf = job["pdf"]
+    try:
+        if pdf is not None and not pdf.exists():
+            raise FileNotFoundError(f"PDF not found: {pdf}")
+        summary = build_year(
+            job["year"], pdf, job["out_dir"],
+            cache=page_cache_from_args(cache_args, pdf) if pdf else None, jobs=jobs, force=force,
+            layout=getattr(cache_args, "layout", False), keep_values=("day_data",),
+        )
+        # The records just built, not the CSV on disk; only the summary goes back to the parent
+        day_data = summary.pop("values")["day_data"]
+        summary["ok"] = True
+        summary["cross_check"] = None
+        if pdf is not None:
+            check_start = time.perf_counter()
+            report = cross_check(day_data, job["year"], sample_size=5)
+            report["seconds"] = round(time.perf_counter() - check_start, 4)
+            summary["cross_check"] = report
+        return summary
+    except Exception as e:
+        return {
+            "year": job["year"],
+            "pdf": str(pdf) if pdf else None,
+            "out_dir": str(job["out_dir"]),
+            "ok": False,
+            "error": f"{type(e).__name__}: {e}",
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+
+
+# -------------------- BATCH -------------------- #
+
+def run_batch(jobs: list, out_root: Path, cache_args: Namespace, processes: int = None,
+              stage_jobs: int = 4, force: bool = False) -> dict:
+    """Build every job on a process pool and write the combined index under out_root."""
+    out_root = Path(out_root)
+    out_root.mkdir(parents=True, exist_ok=True)
+    processes = max(1, min(processes or os.cpu_count() or 1, len(jobs) or 1))
+
+    start = time.perf_counter()
+    results = []
+    if processes == 1:
+        for job in jobs:
+            results.append(run_job(job, cache_args, stage_jobs, force))
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [pool.submit(run_job, job, cache_args, stage_jobs, force) for job in jobs]
+            for future in as_completed(futures):
+                results.append(future.result())
+    wall_seconds = time.perf_counter() - start
+
+    results.sort(key=lambda r: (r["year"], r["pdf"] or ""))
+    index = {
+        "years": results,
+        "throughput": throughput_summary(results, wall_seconds, processes),
+    }
+    write_index(index, out_root)
+    return index
+
+
+def throughput_summary(results: list, wall_seconds: float, processes: int) -> dict:
+    built = [r for r in results if r["ok"]]
+    days = sum(r["days"] for r in built)
+    extractions = sum(r["page_stats"]["extractions"] for r in built)
+    busy_seconds = sum(r["seconds"] for r in results)
+    checks = [r["cross_check"] for r in built if r["cross_check"]]
+    return {
+        "processes": processes,
+        "years_built": len(built),
+        "years_computed": sum(1 for r in built if r["pdf"] is None),
+        "years_failed": len(results) - len(built),
+        "days": days,
+        "pages_extracted": extractions,
+        "years_cross_checked": len(checks),
+        "cross_check_mismatches": sum(c["name_mismatches"] + c["color_mismatches"] + sum(c["fields"].values()) for c in checks),
+        "cross_check_seconds": round(sum(c["seconds"] for c in checks), 4),
+        "wall_seconds": round(wall_seconds, 3),
+        "busy_seconds": round(busy_seconds, 3),
+        "years_per_minute": round(len(built) * 60 / wall_seconds, 2) if wall_seconds else 0.0,
+        "days_per_second": round(days / wall_seconds, 1) if wall_seconds else 0.0,
+        # Average number of years in flight; the speedup over a serial batch on idle cores
+        "concurrency": round(busy_seconds / wall_seconds, 2) if wall_seconds else 0.0,
+    }
+
+
+def write_index(index: dict, out_root: Path):
+    """index.json keeps the full summaries; index.csv lists one dataset file per row."""
+    with open(out_root / "index.json", "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+
+    with open(out_root / "index.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Year", "SourcePDF", "Dataset", "Path", "Status"])
+        for result in index["years"]:
+            if not result["ok"]:
+                writer.writerow([result["year"], result["pdf"], "", "", result["error"]])
+                continue
+            for dataset, paths in result["outputs"].items():
+                for path in paths:
+                    writer.writerow([result["year"], result["pdf"] or "computed", dataset, path, result["statuses"][dataset]])
+
+# -------------------- MAIN -------------------- #
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build liturgical calendar datasets for many years at once")
+    parser.add_argument("--job", action="append", type=parse_job, default=[], metavar="YEAR=PDF",
+                        help="Year and the calendar PDF for it; repeat for more years or editions")
+    parser.add_argument("--years", type=parse_year_range, metavar="FIRST-LAST",
+                        help="Range of years whose PDFs are found with --pdf-template")
+    parser.add_argument("--pdf-template", default="USCCB_{year}_Feast_Calendar_CLEAN.pdf",
+                        help="PDF path for each year of --years, e.g. pdfs/USCCB_{year}.pdf")
+    parser.add_argument("--compute-missing", action="store_true",
+                        help="Compute years of --years whose PDF does not exist instead of failing them")
+    parser.add_argument("--computed", type=parse_year_range, metavar="FIRST-LAST",
+                        help="Range of years to compute from rules, without any PDF")
+    parser.add_argument("--out-root", required=True, help="Directory that receives one folder per year")
+    add_cache_arguments(parser)
+    parser.add_argument("--processes", type=int, default=None, help="Years built at the same time (default: CPU count)")
+    parser.add_argument("--jobs", type=int, default=4, help="Independent build stages run at the same time per year")
+    parser.add_argument("--force", action="store_true", help="Rebuild every stage even if its inputs are unchanged")
+    parser.add_argument("--sqlite", metavar="DB", help="Also export every built year into this SQLite database")
+    args = parser.parse_args(argv)
+
+    pairs = list(args.job)
+    if args.years:
+        for year in args.years:
+            pdf = Path(args.pdf_template.format(year=year))
+            pairs.append((year, None if args.compute_missing and not pdf.exists() else pdf))
+    if args.computed:
+        pairs += [(year, None) for year in args.computed]
+    if not pairs:
+        parser.error("give at least one --job YEAR=PDF, a --years range or a --computed range")
+
+    out_root = Path(args.out_root)
+    jobs = plan_jobs(pairs, out_root)
+    cache_args = Namespace(cache_dir=args.cache_dir, no_cache=args.no_cache, rebuild_cache=args.rebuild_cache,
+                           layout=args.layout)
+
+    print("\n==============================")
+    print(f"📚 LITURGICAL CALENDAR BATCH ({len(jobs)} jobs)")
+    print("==============================\n")
+
+    index = run_batch(jobs, out_root, cache_args, args.processes, args.jobs, args.force)
+
+    print()
+    for result in index["years"]:
+        if result["ok"]:
+            ran = sum(1 for status in result["statuses"].values() if status == "ran")
+            source = "computed" if result["pdf"] is None else "parsed"
+            print(f"✅ {result['year']} ({source}): {result['days']} days, {ran} stages rebuilt in {result['seconds']:.2f}s → {result['out_dir']}")
+            check = result["cross_check"]
+            if check and (check["name_mismatches"] or check["color_mismatches"] or any(check["fields"].values())):
+                fields = ", ".join(f"{k} {v}" for k, v in check["fields"].items() if v)
+                print(f"   🔎 cross-check: {check['name_mismatches']} names, {check['color_mismatches']} colors differ from the computed calendar {fields}")
+        else:
+            print(f"❌ {result['year']}: {result['error']}")
+
+    t = index["throughput"]
+    print(
+        f"\n⏱️  {t['years_built']} years in {t['wall_seconds']:.2f}s on {t['processes']} processes "
+        f"({t['years_per_minute']} years/min, {t['days_per_second']} days/s, {t['pages_extracted']} pages extracted, "
+        f"concurrency {t['concurrency']})"
+    )
+    if t["years_cross_checked"]:
+        print(f"🔎 Cross-checked {t['years_cross_checked']} parsed years in {t['cross_check_seconds'] * 1000:.1f} ms, {t['cross_check_mismatches']} mismatches")
+    print(f"📂 Index: {(out_root / 'index.csv').resolve()}")
+    if args.sqlite:
+        built = [r["out_dir"] for r in index["years"] if r["ok"]]
+        counts = export_sqlite(Path(args.sqlite), (load_output_dir(d) for d in built))
+        print(f"🗃️  SQLite: {counts['years']} years, {counts['days']} days, {counts['citations']} citations "
+              f"in {counts['seconds']:.2f}s → {args.sqlite}")
+    if t["years_failed"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+# ----------------------------------------------------------
+# Binary calendar: fixed-width day records memory-mapped for O(1) lookup by date
+# ----------------------------------------------------------
+import csv
+import mmap
+import struct
+import argparse
+from datetime import date
+from pathlib import Path
+
+from src import metrics
+from src.model import DAY_DATA_FIELDS, DayRecord, as_day_records, read_day_data_csv
+
+MAGIC = b"LITCAL\x00\x01"
+FORMAT_VERSION = 1
+
+# Sections, 8-byte aligned: header, years, colors, ranks, one RECORD per day,
+# string offsets and the UTF-8 string blob (id 0 is "")
+HEADER = struct.Struct("<8sHHHHHHIIIII")
+YEAR_ENTRY = struct.Struct("<HHII")
+UINT32 = struct.Struct("<I")
+# ordinal, color, rank, flags, week_row, weekday_col, display_date_number, source_page,
+# feast name, holiday, citation
+RECORD = struct.Struct("<IBBBBBBHIII")
+
+HOLY_DAY = 1
+FIRST_FRIDAY = 2
+FIRST_SATURDAY = 4
+BELONGS_TO_MONTH = 8
+
+# Alternative readings for one day (e.g. Ascension Thursday vs. Sunday provinces)
+CITATION_SEPARATOR = " | "
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _flag(value) -> int:
+    return 1 if value not in ("", None, 0, "0") else 0
+
+
+# -------------------- WRITER -------------------- #
+
+class _StringTable:
+    def __init__(self):
+        self.ids = {"": 0}
+        self.strings = [""]
+
+    def intern(self, value) -> int:
+        value = value or ""
+        sid = self.ids.get(value)
+        if sid is None:
+            sid = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return sid
+
+
+def _codes(values) -> dict:
+    # Sorted so the same data always gives the same codes and the same bytes
+    return {value: code for code, value in enumerate(sorted(set(values)))}
+
+
+def write_calendar(path: Path, years: dict) -> dict:
+    """Write {year: (day_records, {date: citation})} to path; returns section sizes.
+
+    Citations may be a dict of date -> str or of date -> list of alternatives.
+    """
+    strings = _StringTable()
+    days = {year: as_day_records(records) for year, (records, _) in years.items()}
+    all_records = [r for year in sorted(days) for r in days[year]]
+    colors = _codes(r.liturgical_color or "" for r in all_records)
+    ranks = _codes(r.feast_rank or "" for r in all_records)
+    if len(colors) > 255 or len(ranks) > 255:
+        raise ValueError(f"Too many distinct colors ({len(colors)}) or ranks ({len(ranks)}) for one-byte codes")
+    color_ids = [strings.intern(c) for c in colors]
+    rank_ids = [strings.intern(r) for r in ranks]
+
+    year_entries = []
+    records = bytearray()
+    for year in sorted(days):
+        jan1 = date(year, 1, 1).toordinal()
+        day_count = date(year, 12, 31).toordinal() - jan1 + 1
+        slots = bytearray(RECORD.size * day_count)
+        citations = years[year][1] or {}
+        for r in days[year]:
+            if r.date.year != year:
+                raise ValueError(f"{r.date} listed under {year}")
+            citation = citations.get(r.date, "")
+            if isinstance(citation, (list, tuple)):
+                citation = CITATION_SEPARATOR.join(citation)
+            flags = (HOLY_DAY * _flag(r.is_holy_day_of_obligation) | FIRST_FRIDAY * _flag(r.is_first_friday)
+                     | FIRST_SATURDAY * _flag(r.is_first_saturday) | BELONGS_TO_MONTH * _flag(r.belongs_to_month))
+            try:
+                RECORD.pack_into(
+                    slots, (r.date.toordinal() - jan1) * RECORD.size,
+                    r.date.toordinal(), colors[r.liturgical_color or ""], ranks[r.feast_rank or ""], flags,
+                    int(r.week_row or 0), int(r.weekday_col or 0), int(r.display_date_number or 0), int(r.source_page or 0),
+                    strings.intern(r.feast_primary_name), strings.intern(r.us_holiday_name), strings.intern(citation),
+                )
+            except struct.error as e:
+                raise ValueError(f"{r.date}: value out of range for the binary format ({e})")
+        year_entries.append((year, day_count, jan1, len(records) // RECORD.size))
+        records += slots
+
+    encoded = [s.encode("utf-8") for s in strings.strings]
+    offsets, position = [], 0
+    for text in encoded:
+        offsets.append(position)
+        position += len(text)
+    offsets.append(position)
+
+    years_offset = _align(HEADER.size)
+    colors_offset = _align(years_offset + YEAR_ENTRY.size * len(year_entries))
+    ranks_offset = colors_offset + UINT32.size * len(color_ids)
+    records_offset = _align(ranks_offset + UINT32.size * len(rank_ids))
+    strings_offset = _align(records_offset + len(records))
+    blob_offset = strings_offset + UINT32.size * len(offsets)
+
+    buffer = bytearray(blob_offset + position)
+    HEADER.pack_into(
+        buffer, 0, MAGIC, FORMAT_VERSION, RECORD.size, len(year_entries), len(color_ids), len(rank_ids), 0,
+        len(encoded), colors_offset, records_offset, strings_offset, blob_offset,
+    )
+    for i, entry in enumerate(year_entries):
+        YEAR_ENTRY.pack_into(buffer, years_offset + i * YEAR_ENTRY.size, *entry)
+    struct.pack_into(f"<{len(color_ids)}I", buffer, colors_offset, *color_ids)
+    struct.pack_into(f"<{len(rank_ids)}I", buffer, ranks_offset, *rank_ids)
+    buffer[records_offset:records_offset + len(records)] = records
+    struct.pack_into(f"<{len(offsets)}I", buffer, strings_offset, *offsets)
+    buffer[blob_offset:] = b"".join(encoded)
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(buffer)
+    tmp.replace(path)
+    return {"years": len(year_entries), "records": len(records) // RECORD.size,
+            "strings": len(encoded), "bytes": len(buffer)}
+
+
+def read_citations_csv(input_csv) -> dict:
+    """{date: [citation, ...]} from a daily_bible_citations CSV, alternatives kept in file order."""
+    citations = {}
+    with open(input_csv, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            citations.setdefault(date.fromisoformat(row["Date"]), []).append(row["BibleCitationShort"])
+    return citations
+
+
+def citations_by_date(citations) -> dict:
+    """The same mapping built from the in-memory rows of extract_daily_bible_citations."""
+    by_date = {}
+    for row in citations or []:
+        by_date.setdefault(date.fromisoformat(row["Date"]), []).append(row["BibleCitationShort"])
+    return by_date
+
+
+def write_year(output_path: Path, year: int, day_data, citations=None):
+    """Binary artifact for one built year; citations are the extractor's rows, if any."""
+    sizes = write_calendar(output_path, {year: (day_data, citations_by_date(citations))})
+    metrics.log(f"✅ Binary calendar ({sizes['records']} days, {sizes['strings']} strings, {sizes['bytes']:,} bytes) → {output_path}")
+    return sizes
+
+
+# -------------------- READER -------------------- #
+
+class CalendarFile:
+    """Read-only, memory-mapped view of a binary calendar.
+
+    Nothing is parsed up front besides the header and the year table; records are
+    unpacked straight from the map and strings decoded on access.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        (magic, version, record_size, year_count, color_count, rank_count, _, self.string_count,
+         colors_offset, self._records_offset, self._strings_offset, self._blob_offset) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} binary calendar")
+
+        years_offset = _align(HEADER.size)
+        self._years = {}
+        for i in range(year_count):
+            year, day_count, jan1, first_record = YEAR_ENTRY.unpack_from(self._map, years_offset + i * YEAR_ENTRY.size)
+            self._years[year] = (jan1, day_count, first_record)
+        color_ids = struct.unpack_from(f"<{color_count}I", self._map, colors_offset)
+        rank_ids = struct.unpack_from(f"<{rank_count}I", self._map, colors_offset + UINT32.size * color_count)
+        self.colors = [self.string(i) for i in color_ids]
+        self.ranks = [self.string(i) for i in rank_ids]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._file is None:
+            return
+        self._view.release()
+        self._map.close()
+        self._file.close()
+        self._file = None
+
+    @property
+    def years(self) -> list:
+        return sorted(self._years)
+
+    def string(self, sid: int) -> str:
+        start, end = struct.unpack_from("<II", self._map, self._strings_offset + UINT32.size * sid)
+        return str(self._view[self._blob_offset + start:self._blob_offset + end], "utf-8")
+
+    def _offset(self, d: date):
+        entry = self._years.get(d.year)
+        if entry is None:
+            return None
+        jan1, _, first_record = entry
+        offset = self._records_offset + (first_record + d.toordinal() - jan1) * RECORD.size
+        # Ordinal 0 marks a day the source calendar did not list
+        return offset if UINT32.unpack_from(self._map, offset)[0] else None
+
+    def __contains__(self, d: date) -> bool:
+        return self._offset(d) is not None
+
+    def raw(self, d: date):
+        """The undecoded record tuple for a date (codes and string ids), or None."""
+        offset = self._offset(d)
+        return RECORD.unpack_from(self._map, offset) if offset is not None else None
+
+    def color(self, d: date) -> str:
+        offset = self._offset(d)
+        return self.colors[self._map[offset + 4]] if offset is not None else None
+
+    def citation(self, d: date) -> str:
+        record = self.raw(d)
+        return self.string(record[10]) if record else None
+
+    def day(self, d: date) -> DayRecord:
+        """The DayRecord stored for a date, or None when the date is not in the file."""
+        record = self.raw(d)
+        if record is None:
+            return None
+        ordinal, color, rank, flags, week_row, weekday_col, number, page, name, holiday, _ = record
+        return DayRecord(
+            date.fromordinal(ordinal), self.string(name), self.ranks[rank], self.colors[color],
+            int(bool(flags & HOLY_DAY)), self.string(holiday), int(bool(flags & FIRST_FRIDAY)),
+            int(bool(flags & FIRST_SATURDAY)), week_row, weekday_col, number,
+            int(bool(flags & BELONGS_TO_MONTH)), page,
+        )
+
+    def days(self, year: int):
+        """Every stored DayRecord of a year in date order."""
+        jan1, day_count, _ = self._years[year]
+        for ordinal in range(jan1, jan1 + day_count):
+            record = self.day(date.fromordinal(ordinal))
+            if record is not None:
+                yield record
+
+
+# -------------------- MAIN -------------------- #
+
+def pack_directories(directories, output_path: Path) -> dict:
+    """One multi-year file from build output directories (day_data.csv plus citations)."""
+    years = {}
+    for directory in map(Path, directories):
+        records = read_day_data_csv(directory / "day_data.csv")
+        year = records[len(records) // 2].date.year
+        citation_csvs = sorted(directory.glob("daily_bible_citations_*.csv"))
+        years[year] = (records, read_citations_csv(citation_csvs[0]) if citation_csvs else {})
+    return write_calendar(output_path, years)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pack build outputs into a binary calendar, or read one")
+    sub = parser.add_subparsers(dest="command", required=True)
+    pack = sub.add_parser("pack", help="Combine build output directories into one multi-year file")
+    pack.add_argument("directories", nargs="+", help="Directories holding day_data.csv (and citations)")
+    pack.add_argument("--out", required=True, help="Binary calendar to write")
+    show = sub.add_parser("show", help="Print the stored day for a date")
+    show.add_argument("calendar", help="Binary calendar file")
+    show.add_argument("date", type=date.fromisoformat, help="YYYY-MM-DD")
+    args = parser.parse_args(argv)
+
+    if args.command == "pack":
+        sizes = pack_directories(args.directories, Path(args.out))
+        print(f"✅ {sizes['years']} years, {sizes['records']} day slots, {sizes['bytes']:,} bytes → {args.out}")
+        return
+
+    with CalendarFile(args.calendar) as calendar:
+        record = calendar.day(args.date)
+        if record is None:
+            raise SystemExit(f"❌ {args.date} is not in {args.calendar} (years {calendar.years})")
+        for field in DAY_DATA_FIELDS:
+            print(f"{field:<26} {getattr(record, field)}")
+        print(f"{'citation':<26} {calendar.citation(args.date)}")
+
+
+if __name__ == "__main__":
+    main()
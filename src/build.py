@@ -1,14 +1,30 @@
 import re
 import csv
+import json
+import time
+import pickle
+import hashlib
 import argparse
-import pdfplumber
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from src import binary_calendar, metrics, model, proper_of_time, seasons, sqlite_export
+from src.model import as_day_records, write_day_data_csv
+from src.metrics import Metrics, add_metrics_arguments, metrics_from_args
+from src.pipeline import BuildGraph, Stage, source_fingerprint
+from src.seasons import SeasonIndex
+from src.utils import calendar_rules, citation_index, daily_bible_citation, day_parser, day_slots, tokenizer
+from src.utils.citation_index import index_path_for
 from src.utils.daily_bible_citation import extract_daily_bible_citations
+from src.utils.page_text import PageTextProvider, open_pages
+from src.utils.day_parser import PageMemo, iter_page_lines, parse_day_data, parse_day_pages
+from src.utils.page_cache import add_cache_arguments, file_sha256, page_cache_from_args
+from src.validate import RecordValidationError, check_records
 
 
 # -------------------- HELPER FUNCTIONS -------------------- #
 
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
 def next_month_name(current):
     months = [
         "January", "February", "March", "April", "May", "June",
@@ -31,234 +47,85 @@ def classify_feast(name):
 
 # -------------------- DAY DATA EXTRACTION -------------------- #
 
-def extract_day_data(pdf_path: Path, year: int = 2026, start_page: int = 12, end_page: int = None):
-    day_data = []
-    current_month = None
-    previous_day_num = 0
-    previous_date_obj = None
-
-    holy_days = {
-        "2026-01-01": "Mary, Mother of God",
-        "2026-05-14": "Ascension of the Lord",
-        "2026-08-15": "Assumption of the Blessed Virgin Mary",
-        "2026-11-01": "All Saints",
-        "2026-12-08": "Immaculate Conception",
-        "2026-12-25": "Christmas"
-    }
-
-    us_holidays = {
-        "2026-01-01": "New Year's Day",
-        "2026-07-04": "Independence Day",
-        "2026-11-26": "Thanksgiving Day",
-        "2026-12-25": "Christmas Day"
-    }
-
-    last_feast_name = ""
-    last_rank = ""
-    last_color = ""
-    last_is_holy_day = 0
-    last_us_holiday = ""
-    last_is_first_friday = 0
-    last_is_first_saturday = 0
-
-    with pdfplumber.open(pdf_path) as pdf:
-        if end_page is None:
-            end_page = len(pdf.pages)
-
-        for page_num in range(start_page, end_page):
-            page = pdf.pages[page_num]
-            text = page.extract_text()
-            if not text:
-                continue
-            lines = [line.strip() for line in text.splitlines() if line.strip()]
-            if not lines:
-                continue
-
-            # Detect month at top
-            page_month = None
-            for line in lines[:5]:
-                month_match = re.search(
-                    r"\b(January|February|March|April|May|June|July|August|September|October|November|December)\b",
-                    line, re.IGNORECASE
-                )
-                if month_match:
-                    page_month = month_match.group(1).capitalize()
-                    break
-            if page_month:
-                current_month = page_month
-                print(f"📅 Page {page_num+1}: Detected month → {current_month}")
-
-            if not current_month:
-                continue
-
-            skip_rest_of_page = False
-
-            for i, line in enumerate(lines):
-                if re.match(r"^(?:[-=_]{3,})$", line.strip()):
-                    skip_rest_of_page = True
-                    break
-                if re.match(r"^(Notes?|Footnotes?)[:\s]*$", line.strip(), re.IGNORECASE):
-                    skip_rest_of_page = True
-                    break
-
-                # Match date + feast + color
-                match = re.match(
-                    r"^(\d{1,2})\s+(?:\w+\s+)?(.+?)\s+((?:white|red|green|violet|black|rose|gold)"
-                    r"(?:\s*(?:/|or)\s*(?:white|red|green|violet|black|rose|gold))*)$",
-                    line, re.IGNORECASE
-                )
-                if not match:
-                    continue
-
-                day_num, feast, color = match.groups()
-                day_num = int(day_num)
-                rank = ""
-
-                if i + 1 < len(lines):
-                    next_line = lines[i + 1]
-                    if re.search(r"(Feast|Memorial|Solemnity|Optional Memorial)", next_line, re.IGNORECASE):
-                        rank = next_line.strip()
-
-                if day_num < previous_day_num and not page_month:
-                    current_month = next_month_name(current_month)
-                previous_day_num = day_num
-
-                try:
-                    date_obj = datetime.strptime(f"{year} {current_month} {day_num}", "%Y %B %d")
-                    date_str = date_obj.strftime("%Y-%m-%d")
-                except ValueError:
-                    continue
-
-                if previous_date_obj:
-                    delta = (date_obj - previous_date_obj).days
-                    for d in range(1, delta):
-                        missing_date_obj = previous_date_obj + timedelta(days=d)
-                        missing_date_str = missing_date_obj.strftime("%Y-%m-%d")
-                        missing_row = [
-                            missing_date_str,
-                            last_feast_name,
-                            last_rank,
-                            last_color,
-                            last_is_holy_day,
-                            last_us_holiday,
-                            last_is_first_friday,
-                            last_is_first_saturday,
-                            (missing_date_obj.day - 1) // 7 + 1,
-                            ((missing_date_obj.weekday() + 1) % 7) + 1,
-                            missing_date_obj.day,
-                            1,
-                            page_num + 1
-                        ]
-                        day_data.append(missing_row)
-
-                previous_date_obj = date_obj
-                last_feast_name = feast.strip()
-                last_rank = rank
-                last_color = color.capitalize()
-                last_is_holy_day = 1 if date_str in holy_days else 0
-                last_us_holiday = us_holidays.get(date_str, "")
-                last_is_first_friday = 1 if ((date_obj.weekday() + 1) % 7 + 1 == 6 and day_num <= 7) else 0
-                last_is_first_saturday = 1 if ((date_obj.weekday() + 1) % 7 + 1 == 7 and day_num <= 7) else 0
-
-                weekday_num = date_obj.weekday()
-                weekday_col = ((weekday_num + 1) % 7) + 1
-                week_row = (day_num - 1) // 7 + 1
-
-                row = [
-                    date_str,
-                    feast.strip(),
-                    rank,
-                    color.capitalize(),
-                    last_is_holy_day,
-                    last_us_holiday,
-                    last_is_first_friday,
-                    last_is_first_saturday,
-                    week_row,
-                    weekday_col,
-                    day_num,
-                    1,
-                    page_num + 1
-                ]
-                day_data.append(row)
-
-            if skip_rest_of_page:
-                previous_date_obj = None
-                previous_day_num = 0
-                last_feast_name = ""
-                last_rank = ""
-                last_color = ""
-                last_is_holy_day = 0
-                last_us_holiday = ""
-                last_is_first_friday = 0
-                last_is_first_saturday = 0
-                continue
-
+def extract_day_data(pdf_path: Path, year: int = 2026, start_page: int = None, end_page: int = None, pages=None,
+                     memo: PageMemo = None):
+    # Without an explicit range, only the grid pages of the page map are read; with a
+    # memo they are parsed page by page and unchanged pages are spliced in from it
+    with open_pages(pdf_path, pages) as pages:
+        page_indexes = pages.page_map().grid_pages(year) if start_page is None else None
+        if memo is not None:
+            if page_indexes is None:
+                page_indexes = range(start_page, len(pages) if end_page is None else end_page)
+            return parse_day_pages(pages, page_indexes, year, memo).rows()
+        return list(parse_day_data(iter_page_lines(pages, start_page or 0, end_page, page_indexes), year))
+
+DAY_PAGE_MEMO = "day_pages.pkl"
+
+def day_memo_salt(year: int, layout: bool = False) -> str:
+    # Spliced rows are only valid for the parser code and settings that produced them
+    code = [source_fingerprint(obj) for obj in (day_parser, tokenizer, calendar_rules, model)]
+    return hashlib.sha256(json.dumps([year, layout, code]).encode("utf-8")).hexdigest()
+
+def extract_day_data_split(pdf_path: Path, output_csv: Path, year: int = 2026, pages=None, check=None,
+                           page_memo: Path = None):
+    # One streaming pass; month headers are honoured where they appear, so the
+    # March 30-31 rows on the APRIL page no longer need a second pass or patching.
+    # page_memo is where the rows of every page are kept for the next edition's build
+    with metrics.phase("parse"):
+        if page_memo is None:
+            day_data = extract_day_data(pdf_path, year, pages=pages)
+        else:
+            with open_pages(pdf_path, pages) as pages:
+                memo = PageMemo.load(page_memo, day_memo_salt(year, getattr(pages, "layout", False)))
+                day_data = extract_day_data(pdf_path, year, pages=pages, memo=memo)
+            memo.save(page_memo)
+    if check:
+        with metrics.phase("check"):
+            check(output_csv.name, day_data)
+
+    # Write day_data.csv; the records themselves are what later stages consume
+    with metrics.phase("write"):
+        write_day_data_csv(day_data, output_csv)
+
+    metrics.log(f"✅ DAY DATA rows → {output_csv}")
     return day_data
 
-def extract_day_data_split(pdf_path: Path, output_csv: Path, year: int = 2026):
-    data1 = extract_day_data(pdf_path, year, start_page=12, end_page=22)
-    data2 = extract_day_data(pdf_path, year, start_page=21, end_page=None)
-    all_data = data1 + data2
-
-    # Deduplicate
-    seen = set()
-    unique_data = []
-    for row in all_data:
-        date_str = row[0]
-        if date_str not in seen:
-            seen.add(date_str)
-            unique_data.append(row)
-
-    # Auto add March 30-31
-    for day_num, feast_name in [(30, "Monday of Holy Week"), (31, "Tuesday of Holy Week")]:
-        date_obj = datetime(year, 3, day_num)
-        date_str = date_obj.strftime("%Y-%m-%d")
-        if date_str not in seen:
-            weekday_num = date_obj.weekday()
-            weekday_col = ((weekday_num + 1) % 7) + 1
-            week_row = (day_num - 1) // 7 + 1
-            row = [
-                date_str, feast_name, "", "violet", 0, "", 0, 0, week_row, weekday_col, day_num, 1, 23
-            ]
-            unique_data.append(row)
-            seen.add(date_str)
-
-    unique_data.sort(key=lambda r: datetime.strptime(r[0], "%Y-%m-%d"))
-
-    # Write day_data.csv
-    with open(output_csv, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            "date", "feast_primary_name", "feast_rank", "liturgical_color",
-            "is_holy_day_of_obligation", "us_holiday_name", "is_first_friday",
-            "is_first_saturday", "week_row", "weekday_col", "display_date_number",
-            "belongs_to_month", "source_page"
-        ])
-        writer.writerows(unique_data)
-
-    print(f"✅ DAY DATA rows → {output_csv}")
+def compute_day_data(output_csv: Path, year: int, check=None):
+    # Years without a PDF get the rule-based proper of time instead
+    with metrics.phase("compute"):
+        day_data = proper_of_time.compute_year(year)
+    if check:
+        with metrics.phase("check"):
+            check(output_csv.name, day_data)
+    with metrics.phase("write"):
+        write_day_data_csv(day_data, output_csv)
+    metrics.log(f"✅ DAY DATA rows (computed) → {output_csv}")
+    return day_data
 
 # -------------------- LITURGICAL CALENDAR -------------------- #
 
-def generate_liturgical_calendar(day_data, output_csv):
+def generate_liturgical_calendar(day_data, output_csv, check=None):
+    header = ["Date", "DayOfMonth", "DayOfWeek", "LiturgicalColor"]
     rows = []
-    for row in day_data:
-        date_obj = datetime.strptime(row[0], "%Y-%m-%d")
-        rows.append([row[0], date_obj.day, date_obj.strftime("%A"), row[3]])
-    with open(output_csv, "w", newline="", encoding="utf-8") as f:
+    for record in as_day_records(day_data):
+        rows.append([record.date.isoformat(), record.date.day, WEEKDAY_NAMES[record.date.weekday()], record.liturgical_color])
+    if check:
+        with metrics.phase("check"):
+            check(output_csv.name, rows, header)
+    with metrics.phase("write"), open(output_csv, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
-        writer.writerow(["Date", "DayOfMonth", "DayOfWeek", "LiturgicalColor"])
+        writer.writerow(header)
         writer.writerows(rows)
-    print(f"✅ Liturgical calendar saved: {output_csv}")
+    metrics.log(f"✅ Liturgical calendar saved: {output_csv}")
 
 # -------------------- MAJOR FEASTS -------------------- #
 
-def extract_major_feasts(pdf_path: Path, output_csv: Path):
+def extract_major_feasts(pdf_path: Path, output_csv: Path, pages=None, check=None):
+    header = ["FeastDate", "FeastName", "Category"]
     feasts = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page_num in [8, 9]:
-            page = pdf.pages[page_num]
-            lines = [line.strip() for line in page.extract_text().splitlines() if line.strip()]
+    with metrics.phase("parse"), open_pages(pdf_path, pages) as pages:
+        for page_num in pages.page_map().feast_list_pages():
+            lines = pages.lines(page_num)
             current_date = ""
             current_name = ""
             for line in lines:
@@ -275,71 +142,35 @@ def extract_major_feasts(pdf_path: Path, output_csv: Path):
             if current_date and current_name:
                 feasts.append([current_date, current_name, classify_feast(current_name)])
 
-    with open(output_csv, "w", newline="", encoding="utf-8") as f:
+    if check:
+        with metrics.phase("check"):
+            check(output_csv.name, feasts, header)
+    with metrics.phase("write"), open(output_csv, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
-        writer.writerow(["FeastDate", "FeastName", "Category"])
+        writer.writerow(header)
         writer.writerows(feasts)
-    print(f"✅ Major feasts saved: {output_csv}")
+    metrics.log(f"✅ Major feasts saved: {output_csv}")
+    return [dict(zip(header, row)) for row in feasts]
 
 # -------------------- WEEKLY INDEX -------------------- #
 
-def generate_weekly_index(day_data, output_csv):
-    import csv
-    from datetime import datetime, timedelta
-
-    # Compute liturgical season and week label
-    def easter_date(year):
-        # Anonymous Gregorian algorithm
-        a = year % 19
-        b = year // 100
-        c = year % 100
-        d = b // 4
-        e = b % 4
-        f = (b + 8) // 25
-        g = (b - f + 1) // 3
-        h = (19*a + b - d - g + 15) % 30
-        i = c // 4
-        k = c % 4
-        l = (32 + 2*e + 2*i - h - k) % 7
-        m = (a + 11*h + 22*l) // 451
-        month = (h + l - 7*m + 114) // 31
-        day = ((h + l - 7*m + 114) % 31) + 1
-        return datetime(year, month, day)
-
-    year = 2026
-    easter = easter_date(year)
-    ash_wednesday = easter - timedelta(days=46)
-    pentecost = easter + timedelta(days=49)
-    christmas = datetime(year, 12, 25)
-    advent_start = christmas - timedelta(days=(christmas.weekday() + 22))  # 4 Sundays before Christmas
-    baptism_of_lord = datetime(year, 1, 11)
+def generate_weekly_index(day_data, output_csv, year: int = None, check=None):
+    day_data = as_day_records(day_data)
+    # Season and week label come from the boundary table of the calendar's own year
+    if year is None:
+        year = day_data[len(day_data) // 2].date.year
+    season_index = SeasonIndex(year, year)
 
     weeks = {}
-    for row in day_data:
-        date_obj = datetime.strptime(row[0], "%Y-%m-%d")
+    for record in day_data:
+        date_obj = record.date
         week_start = date_obj - timedelta(days=date_obj.weekday())
         week_end = week_start + timedelta(days=6)
         key = week_start.strftime("%Y-%m-%d")
         if key in weeks:
             continue
 
-        # Determine season
-        if week_start >= advent_start and week_start <= christmas:
-            season = "Advent"
-        elif week_start >= datetime(year, 12, 25) and week_start <= datetime(year + 1, 1, 9):
-            season = "Christmas"
-        elif week_start >= datetime(year, 1, 5) and week_start < ash_wednesday:
-            season = "Ordinary Time"
-        elif week_start >= ash_wednesday and week_start < easter:
-            season = "Lent"
-        elif week_start >= easter and week_start <= pentecost:
-            season = "Easter"
-        else:
-            season = "Ordinary Time"
-
-        # Week number in season
-        season_weeks = [w for w in weeks.values() if w["Season"] == season]
-        lit_week_num = len(season_weeks) + 1
+        season, lit_week_num = season_index.liturgical_week_for(week_start)
         lit_week_label = f"Week {lit_week_num} of {season}"
 
         # Correct WeekLabel with full month/day for start and end
@@ -357,90 +188,302 @@ def generate_weekly_index(day_data, output_csv):
 
     # Sort weeks by start date
     sorted_weeks = sorted(weeks.values(), key=lambda x: x["WeekStart"])
+    if check:
+        with metrics.phase("check"):
+            check(output_csv.name, sorted_weeks)
 
     # Write to CSV
-    with open(output_csv, "w", newline="", encoding="utf-8") as f:
+    with metrics.phase("write"), open(output_csv, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=list(sorted_weeks[0].keys()))
         writer.writeheader()
         writer.writerows(sorted_weeks)
 
-    print(f"✅ Weekly index saved: {output_csv}")
+    metrics.log(f"✅ Weekly index saved: {output_csv}")
+    return sorted_weeks
 
 
 # -------------------- US HOLIDAYS -------------------- #
 
-def generate_us_holidays(day_data, output_csv):
+def generate_us_holidays(day_data, output_csv, check=None):
+    header = ["Date", "HolidayName", "IsFederalHoliday"]
     rows = []
-    for row in day_data:
-        if row[5]:
-            rows.append([row[0], row[5], 1])
-    with open(output_csv, "w", newline="", encoding="utf-8") as f:
+    for record in as_day_records(day_data):
+        if record.us_holiday_name:
+            rows.append([record.date.isoformat(), record.us_holiday_name, 1])
+    if check:
+        with metrics.phase("check"):
+            check(output_csv.name, rows, header)
+    with metrics.phase("write"), open(output_csv, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
-        writer.writerow(["Date", "HolidayName", "IsFederalHoliday"])
+        writer.writerow(header)
         writer.writerows(rows)
-    print(f"✅ US holidays saved: {output_csv}")
+    metrics.log(f"✅ US holidays saved: {output_csv}")
+    return [dict(zip(header, row)) for row in rows]
 
-# -------------------- MAIN -------------------- #
+# -------------------- BUILD GRAPH -------------------- #
 
-def main():
-    parser = argparse.ArgumentParser(description="Extract multiple liturgical calendar datasets")
-    parser.add_argument("year", type=int, default=2026)
-    parser.add_argument("--input-pdf", required=True, help="Path to cleaned USCCB Feast Calendar PDF")
-    parser.add_argument("--out-dir", required=True, help="Output directory for generated CSV files")
-    args = parser.parse_args()
+def build_graph(year: int, pdf_path: Path, out_dir: Path, pages, validate: bool = False) -> BuildGraph:
+    """Declare every dataset as a stage; only the PDF stages read the PDF, everything
+    else depends on the day records alone. Without a PDF the day records are computed
+    and the PDF-only datasets are left out. With validate=True each stage checks its
+    rows against SCHEMAS before writing and raises RecordValidationError instead."""
+    # Only needed once a build runs, so `python -m src build --help` starts without them
+    from src.utils import page_map
+    from src.utils.page_layout import LAYOUT_FORMAT
 
-    year = args.year
-    pdf_path = Path(args.input_pdf)
-    out_dir = Path(args.out_dir)
-    out_dir.mkdir(exist_ok=True, parents=True)
-
-    # Define output paths
     day_data_csv = out_dir / "day_data.csv"
     bible_citations_csv = out_dir / f"daily_bible_citations_{year}.csv"
     liturgical_calendar_csv = out_dir / f"liturgical_calendar_{year}_simple.csv"
     major_feasts_csv = out_dir / f"major_feasts_{year}.csv"
     weekly_index_csv = out_dir / f"weekly_index_{year}.csv"
     us_holidays_csv = out_dir / f"us_holidays_{year}.csv"
+    binary_path = out_dir / f"calendar_{year}.litcal"
+    sqlite_path = out_dir / f"calendar_{year}.sqlite"
+    # Validated runs get their own fingerprints, so turning validation on reruns
+    # (and so checks) stages that were built without it
+    check = check_records if validate else None
+    extra = {"validate": True} if validate else {}
+    params = {"year": year, **extra}
+    # Layout extraction gives the PDF stages other input text, so they get their own fingerprints
+    source = {"layout": LAYOUT_FORMAT} if pages is not None and pages.layout else {}
+
+    graph = BuildGraph(out_dir / ".build")
+    if pdf_path is None:
+        graph.add(Stage(
+            "day_data",
+            lambda: compute_day_data(day_data_csv, year, check=check),
+            outputs=[day_data_csv], params=params, persist=True,
+            code=[compute_day_data, proper_of_time, calendar_rules, model],
+        ))
+    else:
+        graph.add(Stage(
+            "day_data",
+            lambda: extract_day_data_split(pdf_path, day_data_csv, year, pages=pages, check=check,
+                                           page_memo=out_dir / ".build" / DAY_PAGE_MEMO),
+            inputs=[pdf_path], outputs=[day_data_csv], params={**params, **source}, persist=True,
+            code=[extract_day_data, extract_day_data_split, day_parser, day_slots, page_map, tokenizer, calendar_rules,
+                  model],
+        ))
+        graph.add(Stage(
+            "bible_citations",
+            lambda: extract_daily_bible_citations(pdf_path, bible_citations_csv, pages=pages, year=year, check=check),
+            inputs=[pdf_path], outputs=[bible_citations_csv, index_path_for(bible_citations_csv)],
+            params={**params, **source}, persist=True, code=[daily_bible_citation, citation_index, page_map, tokenizer],
+        ))
+        graph.add(Stage(
+            "major_feasts",
+            lambda: extract_major_feasts(pdf_path, major_feasts_csv, pages=pages, check=check),
+            inputs=[pdf_path], outputs=[major_feasts_csv], params={**extra, **source}, persist=True,
+            code=[extract_major_feasts, classify_feast, page_map],
+        ))
+    graph.add(Stage(
+        "liturgical_calendar",
+        lambda day_data: generate_liturgical_calendar(day_data, liturgical_calendar_csv, check=check),
+        deps=["day_data"], outputs=[liturgical_calendar_csv], params=extra,
+        code=[generate_liturgical_calendar, WEEKDAY_NAMES],
+    ))
+    graph.add(Stage(
+        "weekly_index",
+        lambda day_data: generate_weekly_index(day_data, weekly_index_csv, year, check=check),
+        deps=["day_data"], outputs=[weekly_index_csv], params=params, persist=True,
+        code=[generate_weekly_index, seasons, proper_of_time.year_anchors, calendar_rules.easter_date],
+    ))
+    graph.add(Stage(
+        "us_holidays",
+        lambda day_data: generate_us_holidays(day_data, us_holidays_csv, check=check),
+        deps=["day_data"], outputs=[us_holidays_csv], params=extra, persist=True,
+        code=[generate_us_holidays],
+    ))
+    # Day records and citations in one memory-mappable file for consumers
+    graph.add(Stage(
+        "binary_calendar",
+        lambda day_data, bible_citations=None: binary_calendar.write_year(binary_path, year, day_data, bible_citations),
+        deps=["day_data"] if pdf_path is None else ["day_data", "bible_citations"],
+        outputs=[binary_path], params=params, code=[binary_calendar],
+    ))
+    # Every dataset of the year in one queryable database, handed over as stage values
+    csv_stages = [name for name in graph.stages if name not in ("binary_calendar",)]
+    graph.add(Stage(
+        "sqlite",
+        lambda day_data, bible_citations=None, weekly_index=None, major_feasts=None, us_holidays=None, **_:
+            sqlite_export.write_year(sqlite_path, year, day_data, bible_citations,
+                                     source="computed" if pdf_path is None else "pdf",
+                                     weeks=weekly_index, major_feasts=major_feasts, us_holidays=us_holidays),
+        deps=csv_stages, outputs=[sqlite_path], params=params, code=[sqlite_export, seasons],
+    ))
+    return graph
+
+# -------------------- BUILD ONE YEAR -------------------- #
+
+NO_PAGE_STATS = {"requests": 0, "extractions": 0, "hits": 0, "carried_over": 0, "extract_seconds": 0.0,
+                 "saved_seconds": 0.0}
+PDF_STAGES = ("day_data", "bible_citations", "major_feasts")
+
+def saved_value(graph: BuildGraph, name: str):
+    """The value a stage pickled in the previous build, or None."""
+    try:
+        with open(graph.state_dir / f"{name}.pkl", "rb") as f:
+            return pickle.load(f)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        return None
+
+def pdf_edition_sha256(pdf_path: Path, cache=None) -> str:
+    return cache.pdf_hash if cache is not None else file_sha256(pdf_path)
+
+def build_year(year: int, pdf_path: Path, out_dir: Path, cache=None, workers: int = 1, jobs: int = 4,
+               force: bool = False, validate: bool = False, run_metrics: Metrics = None,
+               layout: bool = False, keep_values=()) -> dict:
+    """Build every dataset of one calendar year into out_dir and return a summary.
+    With pdf_path=None the year is computed from rules instead of parsed; with
+    validate=True the first dataset that breaks its schema stops the build; with
+    layout=True pages are read through page_layout (pass a cache opened for that mode).
+    Stage timings and line counts go to run_metrics (a fresh recorder by default).
+    The values of the stages named in keep_values are returned under "values".
+
+    PDF builds keep a content hash of every page in .build/pages.json. When the PDF
+    is a new edition, pages whose hash is unchanged take their text from the cache of
+    the previous edition and their day records from the previous parse. Every build
+    after the first writes calendar_delta_<year>.json with the dates whose feast,
+    rank, color or citation changed (see src.calendar_delta)."""
+    from src import calendar_delta
+    from src.utils.page_hash import read_page_manifest
+
+    start = time.perf_counter()
+    pdf_path = Path(pdf_path) if pdf_path is not None else None
+    out_dir = Path(out_dir)
+    out_dir.mkdir(exist_ok=True, parents=True)
+    run_metrics = run_metrics or Metrics(quiet=metrics.current().quiet)
+
+    # One provider feeds every PDF stage, so each page is extracted once; the PDF
+    # is only opened if one of those stages is out of date
+    pages = PageTextProvider(pdf_path, cache=cache, workers=workers, layout=layout) if pdf_path else None
+    graph = build_graph(year, pdf_path, out_dir, pages, validate=validate)
+    if pages:
+        pdf_sha256 = pdf_edition_sha256(pdf_path, cache)
+        previous_pages = read_page_manifest(graph.state_dir)
+        previous_fields = calendar_delta.date_fields(saved_value(graph, "day_data"), saved_value(graph, "bible_citations"))
+        new_edition = previous_pages is not None and previous_pages["pdf_sha256"] != pdf_sha256
+        if force:
+            # A forced build parses every page again instead of splicing
+            (graph.state_dir / DAY_PAGE_MEMO).unlink(missing_ok=True)
+        if new_edition and cache is not None:
+            pages.carry_over(cache.edition(previous_pages["pdf_sha256"]), previous_pages["hashes"])
+    delta = None
+    try:
+        with metrics.use(run_metrics):
+            statuses = graph.run(jobs=jobs, force=force)
+            if pages:
+                delta = write_build_delta(year, out_dir, graph, pages, statuses, run_metrics,
+                                          pdf_sha256, previous_pages, previous_fields)
+    finally:
+        if pages:
+            pages.close()
+    page_stats = pages.stats() if pages else dict(NO_PAGE_STATS)
+    run_metrics.info.update(year=year, stages=graph.report, page_stats=page_stats)
+
+    return {
+        "year": year,
+        "pdf": str(pdf_path) if pdf_path else None,
+        "out_dir": str(out_dir),
+        "statuses": statuses,
+        "outputs": {name: [str(p) for p in stage.outputs] for name, stage in graph.stages.items()},
+        "days": len(graph.value("day_data")),
+        "page_stats": page_stats,
+        "cache_root": str(pages.cache.root) if pages and pages.cache else None,
+        "changed_dates": len(delta["dates"]) if delta else None,
+        "seconds": round(time.perf_counter() - start, 3),
+        "metrics": run_metrics.to_dict(),
+        "values": {name: graph.value(name) for name in keep_values},
+    }
+
+def write_build_delta(year, out_dir, graph, pages, statuses, run_metrics, pdf_sha256, previous_pages,
+                      previous_fields):
+    # The page manifest is refreshed whenever the PDF was read, so the next edition
+    # is compared with the pages these outputs came from. A first build has nothing
+    # to compare with: it records the manifest only, and returns None
+    from src import calendar_delta
+    from src.utils.page_hash import changed_pages, write_page_manifest
+
+    hashes = None
+    if any(statuses.get(name) == "ran" for name in PDF_STAGES) or previous_pages is None \
+            or previous_pages["pdf_sha256"] != pdf_sha256:
+        with metrics.phase("page_hash"):
+            hashes = pages.page_hashes()
+        write_page_manifest(graph.state_dir, pdf_sha256, hashes)
+    delta_path = calendar_delta.delta_path_for(out_dir, year)
+    if previous_pages is None:
+        delta_path.unlink(missing_ok=True)
+        return None
+    current_fields = calendar_delta.date_fields(graph.value("day_data"), graph.value("bible_citations"))
+    spliced = sum(n for path, n in run_metrics.counters.items() if path.endswith(".spliced_pages"))
+    page_summary = {
+        "changed": changed_pages(previous_pages["hashes"], hashes) if hashes is not None else [],
+        "carried_over": pages.carried_over,
+        "spliced": spliced,
+    }
+    delta = calendar_delta.write_delta(delta_path, year, previous_fields, current_fields, page_summary,
+                                       pdf_sha256, previous_pages["pdf_sha256"])
+    metrics.log(f"🔁 Delta: {len(delta['dates'])} dates changed, {len(page_summary['changed'])} pages changed "
+                f"→ {delta_path}")
+    return delta
 
-    print("\n==============================")
-    print(f"📘 LITURGICAL CALENDAR BUILDER ({year})")
-    print("==============================\n")
-
-    # 1️⃣ Extract and build the DAY DATA
-    print("🔍 Step 1: Extracting day data...")
-    extract_day_data_split(pdf_path, day_data_csv, year)
-
-    # 2️⃣ Use the day data to extract Bible citations
-    print("📖 Step 2: Extracting daily Bible citations...")
-    extract_daily_bible_citations(pdf_path, bible_citations_csv)
-
-    # 3️⃣ Load the day data into memory for other outputs
-    print("📅 Step 3: Loading day data for dependent outputs...")
-    day_data = []
-    with open(day_data_csv, newline="", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        next(reader)
-        for row in reader:
-            day_data.append(row)
-
-    # 4️⃣ Generate simplified liturgical calendar
-    print("🌈 Step 4: Generating simple liturgical calendar...")
-    generate_liturgical_calendar(day_data, liturgical_calendar_csv)
-
-    # 5️⃣ Extract major feasts
-    print("⭐ Step 5: Extracting major feasts...")
-    extract_major_feasts(pdf_path, major_feasts_csv)
-
-    # 6️⃣ Generate weekly index
-    print("📆 Step 6: Generating weekly index...")
-    generate_weekly_index(day_data, weekly_index_csv)
-
-    # 7️⃣ Generate US holidays
-    print("🇺🇸 Step 7: Generating US holidays...")
-    generate_us_holidays(day_data, us_holidays_csv)
-
-    print("\n✅ All datasets generated successfully!")
-    print(f"📂 Output folder: {out_dir.resolve()}")
+# -------------------- MAIN -------------------- #
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract multiple liturgical calendar datasets")
+    parser.add_argument("year", type=int, default=2026)
+    parser.add_argument("--input-pdf", help="Path to cleaned USCCB Feast Calendar PDF; omit to compute the year from rules")
+    parser.add_argument("--out-dir", required=True, help="Output directory for generated CSV files")
+    add_cache_arguments(parser)
+    parser.add_argument("--workers", type=int, default=1, help="Processes used to extract PDF pages in parallel")
+    parser.add_argument("--jobs", type=int, default=4, help="Independent build stages run at the same time")
+    parser.add_argument("--force", action="store_true", help="Rebuild every stage even if its inputs are unchanged")
+    parser.add_argument("--validate", action="store_true",
+                        help="Check every dataset against its schema before it is written and stop at the first failure")
+    add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+
+    year = args.year
+    pdf_path = Path(args.input_pdf) if args.input_pdf else None
+    out_dir = Path(args.out_dir)
+    # cProfile only sees the thread it was enabled in, so profiled builds run stages inline
+    jobs = 1 if args.cprofile else args.jobs
+
+    with metrics_from_args(args) as run_metrics:
+        run_metrics.log("\n==============================")
+        run_metrics.log(f"📘 LITURGICAL CALENDAR BUILDER ({year})")
+        run_metrics.log("==============================\n")
+
+        try:
+            summary = build_year(
+                year, pdf_path, out_dir, cache=page_cache_from_args(args, pdf_path) if pdf_path else None,
+                workers=args.workers, jobs=jobs, force=args.force, validate=args.validate, run_metrics=run_metrics,
+                layout=args.layout,
+            )
+        except RecordValidationError as e:
+            print(f"\n❌ {e.dataset} failed validation with {len(e.messages)} issues; nothing was written for it:")
+            for message in e.messages:
+                print(f"   - {message}")
+            raise SystemExit(1)
+
+        statuses = summary["statuses"]
+        ran = [name for name, status in statuses.items() if status == "ran"]
+        stats = summary["page_stats"]
+        run_metrics.log("\n✅ All datasets generated successfully!" + (" (validated against SCHEMAS)" if args.validate else ""))
+        run_metrics.log(f"🧮 Build graph: {len(ran)} stages rebuilt, {len(statuses) - len(ran)} up to date")
+        for name in ran:
+            phases = ", ".join(f"{child} {seconds:.3f}s" for child, seconds in run_metrics.children(name))
+            run_metrics.log(f"   ⏱️  {name}: {run_metrics.seconds(name):.3f}s" + (f" ({phases})" if phases else ""))
+        if stats["requests"]:
+            run_metrics.log(
+                f"📄 Page text: {stats['extractions']} extractions for {stats['requests']} page reads "
+                f"({stats['extract_seconds']:.2f}s in pdfplumber, ~{stats['saved_seconds']:.2f}s saved)"
+            )
+        if summary["cache_root"] and stats["requests"]:
+            run_metrics.log(f"🗄️  Page cache: {stats['cache_hits']} hits, {stats['cache_misses']} misses ({summary['cache_root']})")
+        if args.profile:
+            run_metrics.log(f"📊 Metrics: {args.profile}" + (f", cProfile: {args.cprofile}" if args.cprofile else ""))
+        run_metrics.log(f"📂 Output folder: {out_dir.resolve()}")
 
 if __name__ == "__main__":
     main()
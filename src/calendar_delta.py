@@ -0,0 +1,63 @@
+# ----------------------------------------------------------
+# Calendar delta: dates whose feast, rank, color or citation changed since the last build
+# ----------------------------------------------------------
+import json
+from pathlib import Path
+
+from src.model import as_day_records
+
+# Bump when the file layout changes; every changed field is listed as [old, new]
+DELTA_FORMAT = 1
+
+# Delta field → DayRecord attribute
+DAY_FIELDS = {"feast": "feast_primary_name", "rank": "feast_rank", "color": "liturgical_color"}
+CITATION_SEPARATOR = " | "
+
+
+def delta_path_for(out_dir: Path, year: int) -> Path:
+    return Path(out_dir) / f"calendar_delta_{year}.json"
+
+
+def date_fields(day_data, citations=None) -> dict:
+    """{ISO date: {"feast", "rank", "color", "citation"}} of one build's datasets.
+    Citations are the full reading lines; a date with several is joined in order."""
+    fields = {}
+    for record in as_day_records(day_data or []):
+        fields[record.date.isoformat()] = {name: getattr(record, attr) for name, attr in DAY_FIELDS.items()}
+    if citations is not None:
+        lines = {}
+        for citation in citations:
+            lines.setdefault(str(citation["Date"]), []).append(citation["SourceLine"])
+        for day in fields.values():
+            day["citation"] = None
+        for day, source_lines in lines.items():
+            fields.setdefault(day, dict.fromkeys(DAY_FIELDS))["citation"] = CITATION_SEPARATOR.join(source_lines)
+    return fields
+
+
+def compare(previous: dict, current: dict) -> dict:
+    """{date: {field: [old, new]}} of every field that differs; dates present in only
+    one build list all of their fields."""
+    changes = {}
+    for day in sorted(set(previous) | set(current)):
+        old, new = previous.get(day, {}), current.get(day, {})
+        changed = {name: [old.get(name), new.get(name)]
+                   for name in sorted(set(old) | set(new)) if old.get(name) != new.get(name)}
+        if changed:
+            changes[day] = changed
+    return changes
+
+
+def write_delta(path: Path, year: int, previous: dict, current: dict, pages: dict = None,
+                pdf_sha256: str = None, previous_pdf_sha256: str = None) -> dict:
+    """Write the delta of two date_fields() maps and return it."""
+    delta = {
+        "format": DELTA_FORMAT,
+        "year": year,
+        "pdf_sha256": pdf_sha256,
+        "previous_pdf_sha256": previous_pdf_sha256,
+        "pages": pages or {},
+        "dates": compare(previous, current),
+    }
+    Path(path).write_text(json.dumps(delta, indent=2, ensure_ascii=False), encoding="utf-8")
+    return delta
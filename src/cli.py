@@ -0,0 +1,56 @@
+# ----------------------------------------------------------
+# Entry point: python -m src <command>, importing only the chosen command's module
+# ----------------------------------------------------------
+import sys
+import importlib
+
+# command -> (module with main(argv), summary)
+COMMANDS = {
+    "build": ("src.build", "Build every dataset of one year, from a PDF or from rules"),
+    "batch": ("src.batch", "Build many years or editions in parallel"),
+    "extract-citations": ("src.utils.daily_bible_citation", "Extract the daily Bible citations of a PDF"),
+    "validate": ("src.validate", "Check dataset CSVs against their schemas"),
+    "export": ("src.sqlite_export", "Export build output directories into one SQLite database"),
+    "query": ("src.utils.citation_index", "Find dates by book and chapter, lectionary number or psalter week"),
+}
+
+# Milliseconds to import a command's module in a fresh interpreter, checked by
+# benchmarks/bench_startup.py. PDF commands may not pay for pdfplumber at import time either
+IMPORT_BUDGET_MS = {
+    "build": 150,
+    "batch": 150,
+    "extract-citations": 100,
+    "validate": 80,
+    "export": 80,
+    "query": 60,
+}
+
+
+def load_command(name: str):
+    module, _ = COMMANDS[name]
+    return importlib.import_module(module)
+
+
+def usage() -> str:
+    width = max(map(len, COMMANDS))
+    lines = ["usage: python -m src <command> [options]", "", "commands:"]
+    lines += [f"  {name:<{width}}  {summary}" for name, (_, summary) in COMMANDS.items()]
+    lines += ["", "Run python -m src <command> --help for the options of a command."]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return
+    name, rest = argv[0], argv[1:]
+    if name not in COMMANDS:
+        raise SystemExit(f"❌ Unknown command {name!r}\n\n{usage()}")
+    # argparse names the program after argv[0] when the command builds its parser
+    sys.argv[0] = f"python -m src {name}"
+    return load_command(name).main(rest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# ----------------------------------------------------------
+# Metrics: per-stage timings, counters and progress messages for the build
+# ----------------------------------------------------------
+import sys
+import json
+import time
+import cProfile
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+
+METRICS_FORMAT = 1
+
+
+# -------------------- RECORDER -------------------- #
+
+class Metrics:
+    """Wall time and call count per phase path, integer counters per path, and `info`
+    for anything else a report should carry (stage statuses, page-cache stats)."""
+
+    def __init__(self, quiet: bool = False):
+        self.quiet = quiet
+        self.info = {}
+        self.phases = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._start = time.perf_counter()
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the block as `name`, nested under the phases already open in this thread."""
+        stack = self._stack()
+        stack.append(name)
+        path = ".".join(stack)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            stack.pop()
+            with self._lock:
+                entry = self.phases.setdefault(path, {"seconds": 0.0, "calls": 0})
+                entry["seconds"] += seconds
+                entry["calls"] += 1
+
+    def count(self, name: str, n: int = 1):
+        """Add n to the counter `name` of the innermost open phase."""
+        path = ".".join(self._stack() + [name])
+        with self._lock:
+            self.counters[path] = self.counters.get(path, 0) + n
+
+    def add_counts(self, counts: dict):
+        for name, n in counts.items():
+            self.count(name, n)
+
+    def log(self, message: str = ""):
+        # One write per line under the lock: print() writes the text and the newline
+        # separately, and concurrent stages would interleave them
+        if not self.quiet:
+            with self._lock:
+                sys.stdout.write(f"{message}\n")
+                sys.stdout.flush()
+
+    def seconds(self, path: str) -> float:
+        return self.phases.get(path, {}).get("seconds", 0.0)
+
+    def children(self, path: str) -> list:
+        """(name, seconds) of the phases directly under `path`, slowest first."""
+        prefix = path + "."
+        found = [(p[len(prefix):], e["seconds"]) for p, e in self.phases.items()
+                 if p.startswith(prefix) and "." not in p[len(prefix):]]
+        return sorted(found, key=lambda item: -item[1])
+
+    def to_dict(self) -> dict:
+        """Phases with their total and self time (total minus nested phases), and counters."""
+        with self._lock:
+            phases = {path: dict(entry) for path, entry in self.phases.items()}
+            counters = dict(self.counters)
+        for path, entry in phases.items():
+            depth = path.count(".") + 1
+            nested = sum(
+                child["seconds"] for child_path, child in phases.items()
+                if child_path.startswith(path + ".") and child_path.count(".") == depth
+            )
+            entry["self_seconds"] = round(max(0.0, entry["seconds"] - nested), 6)
+            entry["seconds"] = round(entry["seconds"], 6)
+        return {
+            "format": METRICS_FORMAT,
+            "wall_seconds": round(time.perf_counter() - self._start, 6),
+            "phases": dict(sorted(phases.items())),
+            "counters": dict(sorted(counters.items())),
+            **self.info,
+        }
+
+    def save(self, path: Path):
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2, default=str), encoding="utf-8")
+
+
+# -------------------- ACTIVE RECORDER -------------------- #
+
+# Stages reach the recorder through current(), so it does not have to be threaded
+# through every extractor; batch workers are processes and each has its own
+_active = Metrics()
+
+
+def current() -> Metrics:
+    return _active
+
+
+@contextmanager
+def use(metrics: Metrics):
+    """Make `metrics` the active recorder for the duration of the block."""
+    global _active
+    previous, _active = _active, metrics
+    try:
+        yield metrics
+    finally:
+        _active = previous
+
+
+def phase(name: str):
+    return _active.phase(name)
+
+
+def count(name: str, n: int = 1):
+    _active.count(name, n)
+
+
+def log(message: str = ""):
+    _active.log(message)
+
+
+# -------------------- CLI -------------------- #
+
+def add_metrics_arguments(parser):
+    parser.add_argument("--quiet", action="store_true", help="Only report errors")
+    parser.add_argument("--profile", metavar="JSON", help="Write per-phase timings and counters to this file")
+    parser.add_argument("--cprofile", metavar="PROF",
+                        help="Also dump cProfile stats here (read with python -m pstats)")
+
+
+@contextmanager
+def metrics_from_args(args):
+    """Activate a Metrics for a CLI run and write the --profile / --cprofile files when it ends."""
+    metrics = Metrics(quiet=args.quiet)
+    profiler = cProfile.Profile() if args.cprofile else None
+    with use(metrics):
+        if profiler:
+            profiler.enable()
+        try:
+            yield metrics
+        finally:
+            if profiler:
+                profiler.disable()
+                profiler.dump_stats(args.cprofile)
+            if args.profile:
+                metrics.save(args.profile)
@@ -0,0 +1,84 @@
+# ----------------------------------------------------------
+# Day model: typed DAY_DATA rows shared by every generator
+# ----------------------------------------------------------
+import csv
+from datetime import date
+
+DAY_DATA_FIELDS = [
+    "date", "feast_primary_name", "feast_rank", "liturgical_color",
+    "is_holy_day_of_obligation", "us_holiday_name", "is_first_friday",
+    "is_first_saturday", "week_row", "weekday_col", "display_date_number",
+    "belongs_to_month", "source_page"
+]
+
+_INT_FIELDS = set(DAY_DATA_FIELDS[4:5] + DAY_DATA_FIELDS[6:])
+
+
+class DayRecord:
+    """One row of DAY_DATA with a real date and int flags, built once and shared by every generator."""
+
+    __slots__ = tuple(DAY_DATA_FIELDS)
+
+    def __init__(self, date, feast_primary_name="", feast_rank="", liturgical_color="",
+                 is_holy_day_of_obligation=0, us_holiday_name="", is_first_friday=0,
+                 is_first_saturday=0, week_row=0, weekday_col=0, display_date_number=0,
+                 belongs_to_month=1, source_page=0):
+        self.date = date
+        self.feast_primary_name = feast_primary_name
+        self.feast_rank = feast_rank
+        self.liturgical_color = liturgical_color
+        self.is_holy_day_of_obligation = is_holy_day_of_obligation
+        self.us_holiday_name = us_holiday_name
+        self.is_first_friday = is_first_friday
+        self.is_first_saturday = is_first_saturday
+        self.week_row = week_row
+        self.weekday_col = weekday_col
+        self.display_date_number = display_date_number
+        self.belongs_to_month = belongs_to_month
+        self.source_page = source_page
+
+    @classmethod
+    def from_row(cls, row):
+        """Build a record from a DAY_DATA CSV row (strings) or a legacy list row."""
+        values = list(row)
+        values[0] = values[0] if isinstance(values[0], date) else date.fromisoformat(values[0])
+        for i in range(4, len(values)):
+            if DAY_DATA_FIELDS[i] in _INT_FIELDS and values[i] != "":
+                values[i] = int(values[i])
+        return cls(*values)
+
+    def to_row(self) -> list:
+        return [self.date.isoformat()] + [getattr(self, f) for f in DAY_DATA_FIELDS[1:]]
+
+    def copy(self, **changes):
+        record = DayRecord(*(getattr(self, f) for f in DAY_DATA_FIELDS))
+        for field, value in changes.items():
+            setattr(record, field, value)
+        return record
+
+    def __eq__(self, other):
+        if not isinstance(other, DayRecord):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in DAY_DATA_FIELDS)
+
+    def __repr__(self):
+        return f"DayRecord({self.date.isoformat()}, {self.feast_primary_name!r}, {self.liturgical_color!r})"
+
+
+def as_day_records(day_data) -> list:
+    """Accept DayRecords as-is and convert legacy list/CSV rows."""
+    return [r if isinstance(r, DayRecord) else DayRecord.from_row(r) for r in day_data]
+
+
+def write_day_data_csv(records, output_csv):
+    with open(output_csv, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(DAY_DATA_FIELDS)
+        writer.writerows(r.to_row() for r in records)
+
+
+def read_day_data_csv(input_csv) -> list:
+    with open(input_csv, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        return [DayRecord.from_row(row) for row in reader]
@@ -0,0 +1,181 @@
+# ----------------------------------------------------------
+# Build graph: incremental, concurrent stages keyed by input and code fingerprints
+# ----------------------------------------------------------
+import json
+import time
+import pickle
+import inspect
+import hashlib
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from src import metrics
+from src.utils.page_cache import file_sha256
+
+
+# -------------------- FINGERPRINTS -------------------- #
+
+def source_fingerprint(obj) -> str:
+    """Hash of a function's or module's source, so editing its logic invalidates the stage."""
+    try:
+        source = inspect.getsource(obj)
+    except (OSError, TypeError):
+        source = repr(obj)
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+class Stage:
+    """One node of the build graph.
+
+    func receives the values of the stages named in `deps` as keyword arguments and
+    returns this stage's value. `inputs` are external files, `outputs` the files the
+    stage writes, and `code` the functions/modules whose source decides whether a
+    previous result can be reused. A stage with persist=True pickles its value so
+    downstream stages can run without re-running it.
+    """
+
+    def __init__(self, name, func, deps=(), inputs=(), outputs=(), code=(), params=None, persist=False):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.inputs = [Path(p) for p in inputs]
+        self.outputs = [Path(p) for p in outputs]
+        self.code = list(code) or [func]
+        self.params = params or {}
+        self.persist = persist
+
+
+class InlineExecutor:
+    """Executor that runs each task at submit time in the calling thread, so
+    single-threaded profilers such as cProfile see every stage."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def submit(self, func, *args):
+        future = Future()
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+# -------------------- BUILD GRAPH -------------------- #
+
+class BuildGraph:
+    """Dependency-aware incremental build: skips stages whose inputs did not change and
+    runs independent stages concurrently."""
+
+    def __init__(self, state_dir: Path):
+        self.state_dir = Path(state_dir)
+        self.manifest_path = self.state_dir / "manifest.json"
+        self.stages = {}
+        self.values = {}
+        self.report = {}
+
+    def add(self, stage: Stage):
+        for dep in stage.deps:
+            if dep not in self.stages:
+                raise ValueError(f"Stage {stage.name!r} depends on unknown stage {dep!r}")
+        self.stages[stage.name] = stage
+        return stage
+
+    def _load_manifest(self) -> dict:
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _value_path(self, name) -> Path:
+        return self.state_dir / f"{name}.pkl"
+
+    def _fingerprint(self, stage: Stage, output_fingerprints: dict) -> str:
+        digest = hashlib.sha256()
+        digest.update(stage.name.encode("utf-8"))
+        digest.update(json.dumps(stage.params, sort_keys=True, default=str).encode("utf-8"))
+        for obj in stage.code:
+            digest.update(source_fingerprint(obj).encode("utf-8"))
+        for path in stage.inputs:
+            digest.update(file_sha256(path).encode("utf-8"))
+        for dep in stage.deps:
+            digest.update(output_fingerprints[dep].encode("utf-8"))
+        return digest.hexdigest()
+
+    def _is_current(self, stage: Stage, fingerprint: str, previous: dict) -> bool:
+        if not previous or previous.get("fingerprint") != fingerprint:
+            return False
+        for path in stage.outputs:
+            if not path.exists() or file_sha256(path) != previous["outputs"].get(str(path)):
+                return False
+        return not stage.persist or self._value_path(stage.name).exists()
+
+    def value(self, name):
+        """Value of a stage, loaded from its pickle when the stage was skipped."""
+        if name not in self.values:
+            with open(self._value_path(name), "rb") as f:
+                self.values[name] = pickle.load(f)
+        return self.values[name]
+
+    def _run_stage(self, stage: Stage):
+        start = time.perf_counter()
+        with metrics.phase(stage.name):
+            # Skipped stages without persist=True have no value to hand on; depending on
+            # them still orders the run and feeds their outputs into the fingerprint
+            with metrics.phase("load_deps"):
+                kwargs = {dep: self.value(dep) for dep in stage.deps if dep in self.values or self.stages[dep].persist}
+            value = stage.func(**kwargs)
+            if stage.persist:
+                self.state_dir.mkdir(parents=True, exist_ok=True)
+                with metrics.phase("persist"), open(self._value_path(stage.name), "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return value, time.perf_counter() - start
+
+    def run(self, jobs: int = 4, force: bool = False) -> dict:
+        """Run every out-of-date stage; returns {stage: "ran" | "skipped"}.
+
+        With jobs=1 the stages run one at a time in the calling thread.
+        """
+        manifest = self._load_manifest() if not force else {}
+        new_manifest = {}
+        output_fingerprints = {}
+        done = set()
+        pending = list(self.stages.values())
+        running = {}
+
+        def finish(stage, fingerprint, status, seconds):
+            outputs = {str(p): file_sha256(p) for p in stage.outputs if p.exists()}
+            new_manifest[stage.name] = {"fingerprint": fingerprint, "outputs": outputs}
+            output_fingerprints[stage.name] = hashlib.sha256(
+                json.dumps([fingerprint if not outputs else None, outputs], sort_keys=True).encode("utf-8")
+            ).hexdigest()
+            self.report[stage.name] = {"status": status, "seconds": round(seconds, 3)}
+            done.add(stage.name)
+
+        with (ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else InlineExecutor()) as pool:
+            while pending or running:
+                ready = [s for s in pending if all(d in done for d in s.deps)]
+                for stage in ready:
+                    pending.remove(stage)
+                    fingerprint = self._fingerprint(stage, output_fingerprints)
+                    if self._is_current(stage, fingerprint, manifest.get(stage.name)):
+                        metrics.log(f"⏭️  {stage.name}: up to date")
+                        finish(stage, fingerprint, "skipped", 0.0)
+                        continue
+                    running[pool.submit(self._run_stage, stage)] = (stage, fingerprint)
+
+                if not running:
+                    continue
+                completed, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in completed:
+                    stage, fingerprint = running.pop(future)
+                    value, seconds = future.result()
+                    self.values[stage.name] = value
+                    finish(stage, fingerprint, "ran", seconds)
+
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(json.dumps(new_manifest, indent=2), encoding="utf-8")
+        return {name: info["status"] for name, info in self.report.items()}
@@ -0,0 +1,357 @@
+# ----------------------------------------------------------
+# Proper of time: the day model of any year computed from US calendar rules
+# ----------------------------------------------------------
+import time
+import argparse
+from calendar import isleap
+from collections import namedtuple
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+
+from src.model import DayRecord, read_day_data_csv, write_day_data_csv
+from src.utils.calendar_rules import easter_date, holy_days_for, us_holidays_for
+
+
+# -------------------- CELEBRATIONS -------------------- #
+
+# Precedence from the Table of Liturgical Days, lower wins
+TRIDUUM = 1
+PRIVILEGED = 2
+SOLEMNITY = 3
+LORD_FEAST = 5
+SUNDAY = 6
+FEAST = 7
+PRIVILEGED_WEEKDAY = 9
+WEEKDAY = 13
+
+Celebration = namedtuple("Celebration", ["precedence", "name", "rank", "color"])
+
+ORDINALS = [
+    "First", "Second", "Third", "Fourth", "Fifth", "Sixth", "Seventh", "Eighth", "Ninth", "Tenth",
+    "Eleventh", "Twelfth", "Thirteenth", "Fourteenth", "Fifteenth", "Sixteenth", "Seventeenth",
+    "Eighteenth", "Nineteenth", "Twentieth", "Twenty-First", "Twenty-Second", "Twenty-Third",
+    "Twenty-Fourth", "Twenty-Fifth", "Twenty-Sixth", "Twenty-Seventh", "Twenty-Eighth",
+    "Twenty-Ninth", "Thirtieth", "Thirty-First", "Thirty-Second", "Thirty-Third", "Thirty-Fourth"
+]
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+CHRISTMAS_WEEKDAY = Celebration(WEEKDAY, "Christmas Weekday", "", "White")
+ORDINARY_WEEKDAY = Celebration(WEEKDAY, "Weekday", "", "Green")
+LENTEN_WEEKDAY = Celebration(PRIVILEGED_WEEKDAY, "Lenten Weekday", "", "Violet")
+EASTER_WEEKDAY = Celebration(WEEKDAY, "Easter Weekday", "", "White")
+ADVENT_WEEKDAY = Celebration(WEEKDAY, "Advent Weekday", "", "Violet")
+LATE_ADVENT_WEEKDAY = Celebration(PRIVILEGED_WEEKDAY, "Advent Weekday", "", "Violet")
+
+# (month, day, celebration); solemnities are transferred when impeded, feasts are not
+FIXED_CELEBRATIONS = [
+    (1, 1, Celebration(SOLEMNITY, "SOLEMNITY OF MARY, THE HOLY MOTHER OF GOD", "Solemnity", "White")),
+    (2, 2, Celebration(LORD_FEAST, "The Presentation of the Lord", "Feast", "White")),
+    (3, 19, Celebration(SOLEMNITY, "SAINT JOSEPH, SPOUSE OF THE BLESSED VIRGIN MARY", "Solemnity", "White")),
+    (3, 25, Celebration(SOLEMNITY, "THE ANNUNCIATION OF THE LORD", "Solemnity", "White")),
+    (6, 24, Celebration(SOLEMNITY, "THE NATIVITY OF SAINT JOHN THE BAPTIST", "Solemnity", "White")),
+    (6, 29, Celebration(SOLEMNITY, "SAINTS PETER AND PAUL, APOSTLES", "Solemnity", "Red")),
+    (8, 6, Celebration(LORD_FEAST, "The Transfiguration of the Lord", "Feast", "White")),
+    (8, 15, Celebration(SOLEMNITY, "THE ASSUMPTION OF THE BLESSED VIRGIN MARY", "Solemnity", "White")),
+    (9, 14, Celebration(LORD_FEAST, "The Exaltation of the Holy Cross", "Feast", "Red")),
+    (11, 1, Celebration(SOLEMNITY, "ALL SAINTS", "Solemnity", "White")),
+    (11, 2, Celebration(SOLEMNITY, "The Commemoration of All the Faithful Departed", "", "Violet or white or black")),
+    (11, 9, Celebration(LORD_FEAST, "The Dedication of the Lateran Basilica", "Feast", "White")),
+    (12, 8, Celebration(SOLEMNITY, "THE IMMACULATE CONCEPTION OF THE BLESSED VIRGIN MARY", "Solemnity", "White")),
+]
+
+
+# -------------------- MOVABLE DATES -------------------- #
+
+Anchors = namedtuple("Anchors", [
+    "epiphany", "baptism", "ash_wednesday", "easter", "pentecost",
+    "advent_start", "christ_the_king", "holy_family", "christmas",
+])
+
+
+def year_anchors(year: int) -> Anchors:
+    jan2 = date(year, 1, 2)
+    # In the US, Epiphany is kept on the Sunday between Jan 2 and 8
+    epiphany = jan2 + timedelta(days=(6 - jan2.weekday()) % 7)
+    # Epiphany on Jan 7 or 8 pushes the Baptism to the Monday after
+    baptism = epiphany + timedelta(days=1 if epiphany.day >= 7 else 7)
+    easter = easter_date(year)
+    christmas = date(year, 12, 25)
+    advent_start = christmas - timedelta(days=christmas.weekday() + 22)
+    dec26 = date(year, 12, 26)
+    holy_family = dec26 + timedelta(days=(6 - dec26.weekday()) % 7)
+    if holy_family.year != year:
+        holy_family = date(year, 12, 30)
+    return Anchors(
+        epiphany, baptism, easter - timedelta(days=46), easter, easter + timedelta(days=49),
+        advent_start, advent_start - timedelta(days=7), holy_family, christmas,
+    )
+
+
+@lru_cache(maxsize=None)
+def _year_shape(jan1_weekday: int, leap: bool) -> tuple:
+    """Per-day grid fields, shared by every year that starts on the same weekday."""
+    shape = []
+    month_lengths = [31, 29 if leap else 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    weekday = jan1_weekday
+    for length in month_lengths:
+        for day in range(1, length + 1):
+            weekday_col = (weekday + 1) % 7 + 1
+            shape.append((
+                1 if (weekday_col == 6 and day <= 7) else 0,
+                1 if (weekday_col == 7 and day <= 7) else 0,
+                (day - 1) // 7 + 1,
+                weekday_col,
+                day,
+            ))
+            weekday = (weekday + 1) % 7
+    return tuple(shape)
+
+
+# -------------------- ENGINE -------------------- #
+
+def celebrations_for(year: int, anchors: Anchors = None) -> list:
+    """The winning Celebration of every day of the year, indexed by day of year - 1."""
+    a = anchors or year_anchors(year)
+    start = date(year, 1, 1)
+    days = [None] * (366 if isleap(year) else 365)
+
+    def doy(d):
+        return (d - start).days
+
+    def fill(first, last, celebration):
+        days[doy(first):doy(last) + 1] = [celebration] * ((last - first).days + 1)
+
+    def put(d, celebration):
+        if d.year == year:
+            days[doy(d)] = celebration
+
+    one = timedelta(days=1)
+    easter, ash, pentecost = a.easter, a.ash_wednesday, a.pentecost
+
+    # Seasonal weekdays
+    fill(start, a.baptism - one, CHRISTMAS_WEEKDAY)
+    fill(a.baptism + one, ash - one, ORDINARY_WEEKDAY)
+    fill(ash, easter - one, LENTEN_WEEKDAY)
+    fill(easter + one, pentecost - one, EASTER_WEEKDAY)
+    fill(pentecost + one, a.advent_start - one, ORDINARY_WEEKDAY)
+    fill(a.advent_start, date(year, 12, 16), ADVENT_WEEKDAY)
+    fill(date(year, 12, 17), date(year, 12, 24), LATE_ADVENT_WEEKDAY)
+    for n in range(2, 8):
+        name = f"{ORDINALS[n - 1]} Day within the Octave of the Nativity of the Lord"
+        put(date(year, 12, 24 + n), Celebration(PRIVILEGED_WEEKDAY, name, "", "White"))
+
+    # Sundays
+    baptism_week = a.baptism - timedelta(days=(a.baptism.weekday() + 1) % 7)
+    sunday = start + timedelta(days=(6 - start.weekday()) % 7)
+    while sunday.year == year:
+        if a.baptism < sunday < ash:
+            n = (sunday - baptism_week).days // 7 + 1
+            put(sunday, Celebration(SUNDAY, f"{ORDINALS[n - 1].upper()} SUNDAY IN ORDINARY TIME", "", "Green"))
+        elif ash < sunday < easter - timedelta(days=7):
+            n = (sunday - ash).days // 7 + 1
+            color = "Violet or rose" if n == 4 else "Violet"
+            put(sunday, Celebration(PRIVILEGED, f"{ORDINALS[n - 1].upper()} SUNDAY OF LENT", "", color))
+        elif easter < sunday < pentecost:
+            n = (sunday - easter).days // 7 + 1
+            put(sunday, Celebration(PRIVILEGED, f"{ORDINALS[n - 1].upper()} SUNDAY OF EASTER", "", "White"))
+        elif pentecost < sunday < a.advent_start:
+            n = 34 - (a.christ_the_king - sunday).days // 7
+            put(sunday, Celebration(SUNDAY, f"{ORDINALS[n - 1].upper()} SUNDAY IN ORDINARY TIME", "", "Green"))
+        elif a.advent_start <= sunday < a.christmas:
+            n = (sunday - a.advent_start).days // 7 + 1
+            color = "Violet or rose" if n == 3 else "Violet"
+            put(sunday, Celebration(PRIVILEGED, f"{ORDINALS[n - 1].upper()} SUNDAY OF ADVENT", "", color))
+        sunday += timedelta(days=7)
+
+    # Lent, Holy Week and the Easter octave
+    for n, weekday in enumerate(["Thursday", "Friday", "Saturday"], start=1):
+        put(ash + timedelta(days=n), Celebration(PRIVILEGED_WEEKDAY, f"{weekday} after Ash Wednesday", "", "Violet"))
+    put(ash, Celebration(PRIVILEGED, "Ash Wednesday", "", "Violet"))
+    put(easter - timedelta(days=7), Celebration(PRIVILEGED, "PALM SUNDAY OF THE PASSION OF THE LORD", "", "Red"))
+    for n in range(1, 4):
+        put(easter - timedelta(days=7 - n), Celebration(PRIVILEGED, f"{WEEKDAY_NAMES[n - 1]} of Holy Week", "", "Violet"))
+    put(easter - timedelta(days=3), Celebration(TRIDUUM, "Thursday of Holy Week (Holy Thursday)", "", "White"))
+    put(easter - timedelta(days=2), Celebration(TRIDUUM, "Friday of the Passion of the Lord (Good Friday)", "", "Red"))
+    put(easter - one, Celebration(TRIDUUM, "Holy Saturday", "", "White"))
+    put(easter, Celebration(TRIDUUM, "EASTER SUNDAY OF THE RESURRECTION OF THE LORD", "Solemnity", "White"))
+    for n in range(1, 7):
+        put(easter + timedelta(days=n), Celebration(PRIVILEGED, f"{WEEKDAY_NAMES[n - 1]} within the Octave of Easter", "", "White"))
+
+    # Movable solemnities and feasts
+    put(a.epiphany, Celebration(PRIVILEGED, "THE EPIPHANY OF THE LORD", "Solemnity", "White"))
+    put(a.baptism, Celebration(LORD_FEAST, "THE BAPTISM OF THE LORD", "Feast", "White"))
+    put(easter + timedelta(days=39), Celebration(PRIVILEGED, "THE ASCENSION OF THE LORD", "Solemnity", "White"))
+    put(pentecost, Celebration(PRIVILEGED, "PENTECOST SUNDAY", "Solemnity", "Red"))
+    put(pentecost + timedelta(days=7), Celebration(SOLEMNITY, "THE MOST HOLY TRINITY", "Solemnity", "White"))
+    put(pentecost + timedelta(days=14), Celebration(SOLEMNITY, "THE MOST HOLY BODY AND BLOOD OF CHRIST", "Solemnity", "White"))
+    put(pentecost + timedelta(days=19), Celebration(SOLEMNITY, "THE MOST SACRED HEART OF JESUS", "Solemnity", "White"))
+    put(a.christ_the_king, Celebration(SOLEMNITY, "OUR LORD JESUS CHRIST, KING OF THE UNIVERSE", "Solemnity", "White"))
+    put(a.christmas, Celebration(PRIVILEGED, "THE NATIVITY OF THE LORD (Christmas)", "Solemnity", "White"))
+    put(a.holy_family, Celebration(LORD_FEAST, "THE HOLY FAMILY OF JESUS, MARY AND JOSEPH", "Feast", "White"))
+
+    # Fixed-date celebrations, by precedence
+    for month, day, celebration in FIXED_CELEBRATIONS:
+        d = date(year, month, day)
+        if celebration.precedence < days[doy(d)].precedence:
+            put(d, celebration)
+        elif celebration.precedence == SOLEMNITY:
+            put(_transfer(d, days, doy, easter), celebration)
+    return days
+
+
+def _transfer(d: date, days: list, doy, easter: date) -> date:
+    """Next day free of higher celebrations; St Joseph in Holy Week moves before Palm Sunday."""
+    if d.month == 3 and d.day == 19 and easter - timedelta(days=7) <= d < easter:
+        return easter - timedelta(days=8)
+    d += timedelta(days=1)
+    while d.year == easter.year and days[doy(d)].precedence <= FEAST:
+        d += timedelta(days=1)
+    return d
+
+
+def compute_year(year: int, anchors: Anchors = None) -> list:
+    """DayRecords for every day of `year`, shaped like the records parsed from a PDF."""
+    start = date(year, 1, 1)
+    holy_days = holy_days_for(year)
+    us_holidays = us_holidays_for(year)
+    shape = _year_shape(start.weekday(), isleap(year))
+    records = []
+    for i, celebration in enumerate(celebrations_for(year, anchors)):
+        d = start + timedelta(days=i)
+        iso = d.isoformat()
+        first_friday, first_saturday, week_row, weekday_col, day = shape[i]
+        records.append(DayRecord(
+            d, celebration.name, celebration.rank, celebration.color,
+            1 if iso in holy_days else 0, us_holidays.get(iso, ""),
+            first_friday, first_saturday, week_row, weekday_col, day, 1, 0,
+        ))
+    return records
+
+
+def compute_years(years) -> dict:
+    """Batch form of compute_year: anchors for the whole range first, then one pass per year."""
+    anchors = {year: year_anchors(year) for year in years}
+    return {year: compute_year(year, anchors[year]) for year in anchors}
+
+
+# -------------------- CROSS-CHECK -------------------- #
+
+GRID_FIELDS = [
+    "is_holy_day_of_obligation", "us_holiday_name", "is_first_friday", "is_first_saturday",
+    "week_row", "weekday_col", "display_date_number",
+]
+
+
+def _normalize_name(name: str) -> str:
+    name = name.upper().strip()
+    if name.startswith("USA:"):
+        name = name[4:]
+    return " ".join(name.rstrip("0123456789 ,").split())
+
+
+def _printed_obligation(record):
+    # The PDF marks holy days on the rank, e.g. "Solemnity [not a Holyday of Obligation this year]"
+    rank = record.feast_rank.lower()
+    if "holyday of obligation" not in rank:
+        return record.is_holy_day_of_obligation
+    return 0 if "not a holyday" in rank else 1
+
+
+def _primary_color(color: str) -> str:
+    return color.replace(" or ", "/").split("/")[0].strip().lower()
+
+
+def cross_check(parsed, year: int, sample_size: int = 10) -> dict:
+    """Compare DayRecords parsed from a PDF with the computed calendar of `year`.
+
+    Grid fields are compared on every date, the holy-day flag against the obligation
+    printed on the rank where there is one; names and colors only where the computed
+    day is a Sunday, solemnity, feast of the Lord or privileged day, because saints'
+    days are not part of the proper of time.
+    """
+    computed = compute_year(year)
+    celebrations = celebrations_for(year)
+    start = date(year, 1, 1)
+    computed_by_date = {r.date: r for r in computed}
+    parsed_by_date = {r.date: r for r in parsed}
+    report = {
+        "year": year,
+        "days": len(parsed_by_date),
+        "missing_dates": sorted(d.isoformat() for d in computed_by_date.keys() - parsed_by_date.keys()),
+        "extra_dates": sorted(d.isoformat() for d in parsed_by_date.keys() - computed_by_date.keys()),
+        "fields": {field: 0 for field in GRID_FIELDS},
+        "proper_days": 0,
+        "name_mismatches": 0,
+        "color_mismatches": 0,
+        "samples": [],
+    }
+    for d in sorted(parsed_by_date.keys() & computed_by_date.keys()):
+        got, want = parsed_by_date[d], computed_by_date[d]
+        printed = {"is_holy_day_of_obligation": _printed_obligation(got)}
+        problems = [field for field in GRID_FIELDS if printed.get(field, getattr(got, field)) != getattr(want, field)]
+        for field in problems:
+            report["fields"][field] += 1
+
+        if celebrations[(d - start).days].precedence <= SUNDAY:
+            report["proper_days"] += 1
+            got_name, want_name = _normalize_name(got.feast_primary_name), _normalize_name(want.feast_primary_name)
+            if not (got_name and want_name.startswith(got_name)):
+                report["name_mismatches"] += 1
+                problems.append("name")
+            if _primary_color(got.liturgical_color) != _primary_color(want.liturgical_color):
+                report["color_mismatches"] += 1
+                problems.append("color")
+
+        if problems and len(report["samples"]) < sample_size:
+            report["samples"].append({
+                "date": d.isoformat(), "fields": problems,
+                "parsed": got.feast_primary_name, "computed": want.feast_primary_name,
+            })
+    return report
+
+
+# -------------------- MAIN -------------------- #
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute liturgical calendars from rules, without a PDF")
+    parser.add_argument("years", help="Year or FIRST-LAST range, e.g. 1900-2100")
+    parser.add_argument("--out-dir", help="Write day_data_<year>.csv for every year here")
+    parser.add_argument("--check", help="Parsed day_data CSV to cross-check against the computed year")
+    args = parser.parse_args(argv)
+
+    first, _, last = args.years.partition("-")
+    years = range(int(first), int(last or first) + 1)
+
+    start = time.perf_counter()
+    calendars = compute_years(years)
+    seconds = time.perf_counter() - start
+    days = sum(len(records) for records in calendars.values())
+    print(f"🧮 Computed {len(calendars)} years ({days} days) in {seconds:.3f}s ({days / seconds:,.0f} days/s)")
+
+    if args.out_dir:
+        out_dir = Path(args.out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for year, records in calendars.items():
+            write_day_data_csv(records, out_dir / f"day_data_{year}.csv")
+        print(f"📂 Output folder: {out_dir.resolve()}")
+
+    if args.check:
+        parsed = read_day_data_csv(Path(args.check))
+        year = parsed[len(parsed) // 2].date.year
+        start = time.perf_counter()
+        report = cross_check(parsed, year)
+        seconds = time.perf_counter() - start
+        print(
+            f"🔎 Cross-check {year}: {report['days']} days, {report['proper_days']} proper-of-time days, "
+            f"{report['name_mismatches']} name and {report['color_mismatches']} color mismatches ({seconds * 1000:.1f} ms)"
+        )
+        for field, count in report["fields"].items():
+            if count:
+                print(f"   ⚠️  {field}: {count} mismatches")
+        for sample in report["samples"]:
+            print(f"   {sample['date']} {', '.join(sample['fields'])}: {sample['parsed']!r} vs {sample['computed']!r}")
+
+
+if __name__ == "__main__":
+    main()
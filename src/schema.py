@@ -5,8 +5,10 @@ SCHEMAS = {
         "fields": {
             "date": "date",
             "feast_primary_name": "string",
-            "feast_rank": "enum[Solemnity|Feast|Memorial|Optional Memorial|Weekday|Sunday|blank]",
-            "liturgical_color": "enum[Green|White|Violet|Red|Rose|Dual]",
+            # The PDF notes the obligation on the rank of a holy day
+            "feast_rank": "enum[Solemnity|Solemnity [Holyday of Obligation]|Solemnity [not a Holyday of Obligation this year]"
+                          "|Feast|Memorial|Optional Memorial|Weekday|Sunday|blank]",
+            "liturgical_color": "enum[Green|White|Violet|Red|Rose|Black|Dual]",
             "is_holy_day_of_obligation": "0|1",
             "us_holiday_name": "string",
             "is_first_friday": "0|1",
@@ -40,7 +42,7 @@ SCHEMAS = {
         "fields": {
             "FeastDate": "string (e.g. Jan 4)",
             "FeastName": "string",
-            "Category": "enum[Solemnities|Marian|Saints]",
+            "Category": "enum[Solemnities of the Lord|Marian Feasts|Major Saints]",
         },
         "required": ["FeastDate", "FeastName", "Category"],
         "primary_key": ["FeastDate", "FeastName"],
@@ -54,7 +56,7 @@ SCHEMAS = {
             "WeekEnd": "date (Sun)",
             "WeekLabel": "string",
             "LiturgicalWeekLabel": "string",
-            "Season": "enum[Advent|Christmas|Lent|Easter|Ordinary]",
+            "Season": "enum[Advent|Christmas|Lent|Paschal Triduum|Easter|Ordinary Time]",
             "MonthForMiniCal": "YYYY-MM",
             "WeekNumberInYear": "1–53",
         },
@@ -71,7 +73,8 @@ SCHEMAS = {
             "SourceLine": "string",
         },
         "required": ["Date", "BibleCitationShort"],
-        "primary_key": ["Date"],
+        # Alternative readings (e.g. Ascension on Thursday or Sunday) are several rows for one date
+        "primary_key": ["Date", "SourceLine"],
         "row_count": {"min": 365, "max": 372},
         "allow_empty_rows": False,
     },
@@ -84,7 +87,7 @@ SCHEMAS = {
         },
         "required": ["Date", "HolidayName", "IsFederalHoliday"],
         "primary_key": ["Date"],
-        "row_count": {"min": 8, "max": 20},
+        "row_count": {"min": 4, "max": 20},
         "allow_empty_rows": False,
     },
 }
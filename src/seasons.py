@@ -0,0 +1,114 @@
+# ----------------------------------------------------------
+# Season index: date → season / liturgical week by bisect over the boundary table
+# ----------------------------------------------------------
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import date, timedelta
+from functools import lru_cache
+
+from src.proper_of_time import year_anchors
+
+ADVENT = "Advent"
+CHRISTMAS = "Christmas"
+ORDINARY_TIME = "Ordinary Time"
+LENT = "Lent"
+TRIDUUM = "Paschal Triduum"
+EASTER = "Easter"
+
+LiturgicalWeek = namedtuple("LiturgicalWeek", ["season", "week"])
+# Skips the keyword handling of LiturgicalWeek(...) on the hot lookup path
+_new_week = LiturgicalWeek._make
+
+DEFAULT_YEARS = (1900, 2100)
+
+
+def _sunday_on_or_before(ordinal: int) -> int:
+    # date.fromordinal(1) is a Monday, so ordinal % 7 == 0 on Sundays
+    return ordinal - ordinal % 7
+
+
+def year_boundaries(year: int) -> list:
+    """(start, season, origin, offset) rows for the seasons that begin in `year`.
+
+    The week of a day is offset + (Sunday on or before the day - origin) // 7, so
+    weeks start on Sunday; days between Ash Wednesday and the First Sunday of Lent
+    are week 0, and the weeks after Pentecost count back from Christ the King (34).
+    """
+    a = year_anchors(year)
+    one = timedelta(days=1)
+    christmas = _sunday_on_or_before(a.christmas.toordinal())
+    baptism_week = _sunday_on_or_before(a.baptism.toordinal())
+    return [
+        (a.baptism + one, ORDINARY_TIME, baptism_week, 1),
+        (a.ash_wednesday, LENT, (a.ash_wednesday + timedelta(days=4)).toordinal(), 1),
+        (a.easter - timedelta(days=3), TRIDUUM, (a.easter - timedelta(days=7)).toordinal(), 1),
+        (a.easter, EASTER, a.easter.toordinal(), 1),
+        (a.pentecost + one, ORDINARY_TIME, a.christ_the_king.toordinal(), 34),
+        (a.advent_start, ADVENT, a.advent_start.toordinal(), 1),
+        (a.christmas, CHRISTMAS, christmas, 1),
+    ]
+
+
+class SeasonIndex:
+    """Sorted season starts for a range of years, searched with bisect.
+
+    Covers Dec 25 of first_year - 1 through Dec 31 of last_year, so the Christmas
+    days at the start of first_year and a week that begins in late December of the
+    year before are both answerable.
+    """
+
+    def __init__(self, first_year: int, last_year: int):
+        rows = year_boundaries(first_year - 1)[-1:]
+        for year in range(first_year, last_year + 1):
+            rows.extend(year_boundaries(year))
+        self.first = rows[0][0]
+        self.last = date(last_year, 12, 31)
+        self._starts = [row[0].toordinal() for row in rows]
+        self._seasons = [row[1] for row in rows]
+        # offset + (sunday - origin) // 7 == (sunday - base) // 7 with base = origin - 7 * offset
+        self._bases = [row[2] - 7 * row[3] for row in rows]
+        self._last_ordinal = self.last.toordinal()
+
+    def __len__(self):
+        return len(self._starts)
+
+    def _segment(self, ordinal: int) -> int:
+        i = bisect_right(self._starts, ordinal) - 1
+        if i < 0 or ordinal > self._last_ordinal:
+            raise ValueError(f"{date.fromordinal(ordinal)} is outside {self.first} – {self.last}")
+        return i
+
+    def season_for(self, d: date) -> str:
+        return self._seasons[self._segment(d.toordinal())]
+
+    def liturgical_week_for(self, d: date) -> LiturgicalWeek:
+        ordinal = d.toordinal()
+        i = self._segment(ordinal)
+        week = (ordinal - ordinal % 7 - self._bases[i]) // 7
+        return _new_week((self._seasons[i], week))
+
+
+@lru_cache(maxsize=None)
+def default_index() -> SeasonIndex:
+    return SeasonIndex(*DEFAULT_YEARS)
+
+
+@lru_cache(maxsize=64)
+def _year_index(year: int) -> SeasonIndex:
+    return SeasonIndex(year, year)
+
+
+def index_for(d: date) -> SeasonIndex:
+    """The shared 1900–2100 index, or a one-year index for dates outside it."""
+    index = default_index()
+    if index.first <= d <= index.last:
+        return index
+    return _year_index(d.year)
+
+
+def season_for(d: date) -> str:
+    return index_for(d).season_for(d)
+
+
+def liturgical_week_for(d: date) -> LiturgicalWeek:
+    return index_for(d).liturgical_week_for(d)
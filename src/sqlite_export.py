@@ -0,0 +1,231 @@
+# ----------------------------------------------------------
+# SQLite export: the datasets of one or many years in one database, with FTS5
+# ----------------------------------------------------------
+import csv
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+from src import metrics, seasons
+from src.model import DAY_DATA_FIELDS, as_day_records, read_day_data_csv
+
+TABLES = """
+CREATE TABLE IF NOT EXISTS years (
+    year INTEGER PRIMARY KEY, source TEXT, out_dir TEXT
+);
+CREATE TABLE IF NOT EXISTS days (
+    date TEXT PRIMARY KEY, year INTEGER NOT NULL,
+    feast_primary_name TEXT, feast_rank TEXT, liturgical_color TEXT,
+    is_holy_day_of_obligation INTEGER, us_holiday_name TEXT,
+    is_first_friday INTEGER, is_first_saturday INTEGER,
+    week_row INTEGER, weekday_col INTEGER, display_date_number INTEGER,
+    belongs_to_month INTEGER, source_page INTEGER,
+    season TEXT, liturgical_week INTEGER
+);
+CREATE TABLE IF NOT EXISTS citations (
+    id INTEGER PRIMARY KEY, year INTEGER NOT NULL, date TEXT NOT NULL,
+    citation_short TEXT, source_line TEXT
+);
+CREATE TABLE IF NOT EXISTS weeks (
+    year INTEGER NOT NULL, week_start TEXT NOT NULL, week_end TEXT, week_label TEXT,
+    liturgical_week_label TEXT, season TEXT, month_for_mini_cal TEXT, week_number INTEGER,
+    PRIMARY KEY (year, week_start)
+);
+CREATE TABLE IF NOT EXISTS major_feasts (
+    year INTEGER NOT NULL, date TEXT, feast_date TEXT, feast_name TEXT, category TEXT
+);
+CREATE TABLE IF NOT EXISTS us_holidays (
+    year INTEGER NOT NULL, date TEXT NOT NULL, holiday_name TEXT, is_federal INTEGER
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS days_fts USING fts5(
+    feast_primary_name, content='days', content_rowid='rowid'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS citations_fts USING fts5(
+    source_line, citation_short, content='citations', content_rowid='id'
+);
+"""
+
+# Created after the bulk load, which is cheaper than maintaining them row by row
+INDEXES = """
+CREATE INDEX IF NOT EXISTS days_year ON days (year);
+CREATE INDEX IF NOT EXISTS days_season ON days (season);
+CREATE INDEX IF NOT EXISTS days_rank ON days (feast_rank);
+CREATE INDEX IF NOT EXISTS days_color ON days (liturgical_color);
+CREATE INDEX IF NOT EXISTS citations_date ON citations (date);
+CREATE INDEX IF NOT EXISTS citations_year ON citations (year);
+CREATE INDEX IF NOT EXISTS weeks_season ON weeks (season);
+CREATE INDEX IF NOT EXISTS major_feasts_date ON major_feasts (date);
+CREATE INDEX IF NOT EXISTS major_feasts_category ON major_feasts (category);
+CREATE INDEX IF NOT EXISTS us_holidays_date ON us_holidays (date);
+"""
+
+YEAR_TABLES = ["days", "citations", "weeks", "major_feasts", "us_holidays"]
+
+
+# -------------------- DATASETS -------------------- #
+
+def _read_csv(path: Path) -> list:
+    if not path.exists():
+        return []
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def _generated(directory: Path, year: int) -> dict:
+    # The generated datasets of an output directory, for the standalone export
+    return {
+        "weeks": _read_csv(directory / f"weekly_index_{year}.csv"),
+        "major_feasts": _read_csv(directory / f"major_feasts_{year}.csv"),
+        "us_holidays": _read_csv(directory / f"us_holidays_{year}.csv"),
+    }
+
+
+def load_output_dir(directory: Path) -> dict:
+    """One year's datasets from a build output directory."""
+    directory = Path(directory)
+    day_data = read_day_data_csv(directory / "day_data.csv")
+    year = day_data[len(day_data) // 2].date.year
+    citations_csv = directory / f"daily_bible_citations_{year}.csv"
+    return {
+        "year": year,
+        "source": "pdf" if citations_csv.exists() else "computed",
+        "out_dir": str(directory),
+        "day_data": day_data,
+        "citations": _read_csv(citations_csv),
+        **_generated(directory, year),
+    }
+
+
+def _feast_date(feast_date: str, year: int):
+    # "Jan 4" -> "2026-01-04"; unparseable labels keep a NULL date
+    try:
+        return datetime.strptime(f"{feast_date} {year}", "%b %d %Y").date().isoformat()
+    except ValueError:
+        return None
+
+
+def _day_rows(year: int, day_data):
+    for record in as_day_records(day_data):
+        d = record.date
+        season, week = seasons.liturgical_week_for(d)
+        yield (d.isoformat(), year) + tuple(getattr(record, f) for f in DAY_DATA_FIELDS[1:]) + (season, week)
+
+
+# -------------------- EXPORT -------------------- #
+
+def connect(db_path: Path):
+    # sqlite3 is only imported by the stages and commands that write a database
+    import sqlite3
+
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(TABLES)
+    return conn
+
+
+def export_sqlite(db_path: Path, datasets, batch_size: int = 5000, scratch: bool = False) -> dict:
+    """Load every dataset into db_path in one transaction and return row counts.
+
+    Rows of a year already in the database are replaced. Rows go in through
+    executemany in batches of batch_size, indexes are created after the load and
+    the FTS tables are rebuilt from their content tables once at the end.
+    scratch=True is for a fresh file that the caller swaps in only on success.
+    """
+    start = time.perf_counter()
+    conn = connect(db_path)
+    if scratch:
+        # Nothing else lives in a scratch file, so a crash loses nothing: skip the journal syncs
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA journal_mode = MEMORY")
+    counts = dict.fromkeys(YEAR_TABLES, 0)
+    years = []
+
+    def insert(sql, rows, table):
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                conn.executemany(sql, batch)
+                counts[table] += len(batch)
+                batch.clear()
+        if batch:
+            conn.executemany(sql, batch)
+            counts[table] += len(batch)
+
+    try:
+        with conn:
+            for dataset in datasets:
+                year = dataset["year"]
+                years.append(year)
+                for table in YEAR_TABLES:
+                    conn.execute(f"DELETE FROM {table} WHERE year = ?", (year,))
+                conn.execute("INSERT OR REPLACE INTO years VALUES (?, ?, ?)",
+                             (year, dataset.get("source"), dataset.get("out_dir")))
+                insert(f"INSERT INTO days VALUES ({', '.join('?' * 16)})", _day_rows(year, dataset["day_data"]), "days")
+                insert(
+                    "INSERT INTO citations (year, date, citation_short, source_line) VALUES (?, ?, ?, ?)",
+                    ((year, r["Date"], r["BibleCitationShort"], r.get("SourceLine")) for r in dataset.get("citations") or []),
+                    "citations",
+                )
+                insert(
+                    "INSERT INTO weeks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    ((year, r["WeekStart"], r["WeekEnd"], r["WeekLabel"], r.get("LiturgicalWeekLabel"), r["Season"],
+                      r.get("MonthForMiniCal"), int(r["WeekNumberInYear"])) for r in dataset.get("weeks") or []),
+                    "weeks",
+                )
+                insert(
+                    "INSERT INTO major_feasts VALUES (?, ?, ?, ?, ?)",
+                    ((year, _feast_date(r["FeastDate"], year), r["FeastDate"], r["FeastName"], r["Category"])
+                     for r in dataset.get("major_feasts") or []),
+                    "major_feasts",
+                )
+                insert(
+                    "INSERT INTO us_holidays VALUES (?, ?, ?, ?)",
+                    ((year, r["Date"], r["HolidayName"], int(r["IsFederalHoliday"])) for r in dataset.get("us_holidays") or []),
+                    "us_holidays",
+                )
+            # executescript would commit the open transaction, so run the statements inside it
+            for statement in INDEXES.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            conn.execute("INSERT INTO days_fts(days_fts) VALUES ('rebuild')")
+            conn.execute("INSERT INTO citations_fts(citations_fts) VALUES ('rebuild')")
+    finally:
+        conn.close()
+
+    counts["years"] = len(years)
+    counts["seconds"] = round(time.perf_counter() - start, 4)
+    return counts
+
+
+def write_year(db_path: Path, year: int, day_data, citations=None, source: str = "pdf",
+               weeks=None, major_feasts=None, us_holidays=None):
+    """Per-year database for the build graph, written next to the CSV outputs from
+    the stage values in memory (rows keyed like the CSV headers)."""
+    db_path = Path(db_path)
+    tmp = db_path.with_name(db_path.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    dataset = {"year": year, "source": source, "out_dir": str(db_path.parent), "day_data": day_data,
+               "citations": citations or [], "weeks": weeks or [], "major_feasts": major_feasts or [],
+               "us_holidays": us_holidays or []}
+    counts = export_sqlite(tmp, [dataset], scratch=True)
+    tmp.replace(db_path)
+    metrics.log(f"✅ SQLite export ({counts['days']} days, {counts['citations']} citations) → {db_path}")
+    return counts
+
+
+# -------------------- MAIN -------------------- #
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export build output directories into one SQLite database")
+    parser.add_argument("directories", nargs="+", help="Build output directories (each holding day_data.csv)")
+    parser.add_argument("--db", required=True, help="SQLite database to create or update")
+    args = parser.parse_args(argv)
+
+    counts = export_sqlite(Path(args.db), (load_output_dir(d) for d in args.directories))
+    rows = ", ".join(f"{counts[t]} {t}" for t in YEAR_TABLES)
+    print(f"✅ {counts['years']} years exported in {counts['seconds']:.2f}s ({rows}) → {args.db}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+from datetime import date, timedelta
+
+
+# ----------------------------------------------------------
+# Date rules that used to be pinned to 2026
+# ----------------------------------------------------------
+def easter_date(year: int) -> date:
+    # Anonymous Gregorian algorithm
+    a = year % 19
+    b = year // 100
+    c = year % 100
+    d = b // 4
+    e = b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19*a + b - d - g + 15) % 30
+    i = c // 4
+    k = c % 4
+    l = (32 + 2*e + 2*i - h - k) % 7
+    m = (a + 11*h + 22*l) // 451
+    month = (h + l - 7*m + 114) // 31
+    day = ((h + l - 7*m + 114) % 31) + 1
+    return date(year, month, day)
+
+
+def nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th weekday (Mon=0) of a month, e.g. nth_weekday(2026, 11, 3, 4) is Thanksgiving."""
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def holy_days_for(year: int) -> dict:
+    """Holy days of obligation keyed by ISO date, as kept in the US: Ascension on
+    Thursday, no obligation for Jan 1, Aug 15 or Nov 1 on a Saturday or Monday, and
+    the Immaculate Conception moved to Monday when Dec 8 is a Sunday."""
+    holy_days = {
+        (easter_date(year) + timedelta(days=39)).isoformat(): "Ascension of the Lord",
+        f"{year}-12-25": "Christmas"
+    }
+    for month, day, name in ((1, 1, "Mary, Mother of God"),
+                             (8, 15, "Assumption of the Blessed Virgin Mary"),
+                             (11, 1, "All Saints")):
+        if date(year, month, day).weekday() not in (0, 5):  # Monday, Saturday
+            holy_days[f"{year}-{month:02d}-{day:02d}"] = name
+    immaculate_conception = date(year, 12, 8)
+    if immaculate_conception.weekday() == 6:
+        immaculate_conception += timedelta(days=1)
+    holy_days[immaculate_conception.isoformat()] = "Immaculate Conception"
+    return dict(sorted(holy_days.items()))
+
+
+def us_holidays_for(year: int) -> dict:
+    return {
+        f"{year}-01-01": "New Year's Day",
+        f"{year}-07-04": "Independence Day",
+        nth_weekday(year, 11, 3, 4).isoformat(): "Thanksgiving Day",
+        f"{year}-12-25": "Christmas Day"
+    }
@@ -0,0 +1,189 @@
+import json
+import argparse
+from pathlib import Path
+from bisect import insort
+
+from src.utils.citation_parser import canonical_book, parse_citation_line
+
+# Bump when the JSON layout changes
+INDEX_FORMAT = 2
+
+
+# ----------------------------------------------------------
+# Helper: what a SourceLine refers to
+# ----------------------------------------------------------
+def normalize_book(book: str) -> str:
+    """'1 John', '1Jn' and '1 jn' are all '1 Jn'; unknown names are only lowercased."""
+    return canonical_book(book) or book.replace(" ", "").lower()
+
+
+def _chapters(citation):
+    # "Ex 14:15-15:1" reads chapters 14 and 15
+    return range(citation.chapter, citation.last_chapter + 1)
+
+
+def chapters_in(source_line: str):
+    """(book, chapter) pairs a SourceLine reads, in order."""
+    for c in parse_citation_line(source_line):
+        for chapter in _chapters(c):
+            yield c.book, chapter
+
+
+def lectionary_numbers(source_line: str) -> list:
+    return list(dict.fromkeys(c.lectionary for c in parse_citation_line(source_line) if c.lectionary))
+
+
+def psalter_week(source_line: str):
+    return next((c.psalter_week for c in parse_citation_line(source_line)), None)
+
+
+# ----------------------------------------------------------
+# Inverted index: book -> chapter -> dates, lectionary -> dates, psalter -> dates
+# ----------------------------------------------------------
+class CitationIndex:
+    """Dates per book and chapter, per lectionary number and per psalter week.
+
+    Dates are ISO strings kept sorted, so results across many years come back in
+    calendar order and every lookup is a couple of dict reads.
+    """
+
+    def __init__(self):
+        self.books = {}
+        self.lectionary = {}
+        self.psalter = {}
+
+    @staticmethod
+    def _add(mapping: dict, key, day: str):
+        dates = mapping.setdefault(key, [])
+        if not dates or dates[-1] < day:
+            dates.append(day)
+        elif day not in dates:
+            insort(dates, day)
+
+    def add(self, day: str, source_line: str):
+        citations = parse_citation_line(source_line)
+        for c in citations:
+            chapters = self.books.setdefault(c.book, {})
+            for chapter in _chapters(c):
+                self._add(chapters, chapter, day)
+            if c.lectionary:
+                self._add(self.lectionary, c.lectionary, day)
+        if citations and citations[0].psalter_week:
+            self._add(self.psalter, citations[0].psalter_week, day)
+
+    @classmethod
+    def from_citations(cls, citations):
+        """Index the rows of extract_daily_bible_citations (Date, SourceLine)."""
+        index = cls()
+        for row in citations:
+            index.add(row["Date"], row["SourceLine"])
+        return index
+
+    # ---------------- lookups ----------------
+    def dates_for(self, book: str, chapter: int = None) -> list:
+        chapters = self.books.get(normalize_book(book), {})
+        if chapter is not None:
+            return chapters.get(int(chapter), [])
+        return sorted({d for dates in chapters.values() for d in dates})
+
+    def dates_for_lectionary(self, number) -> list:
+        return self.lectionary.get(str(number), [])
+
+    def dates_for_psalter(self, week: str) -> list:
+        return self.psalter.get(week, [])
+
+    def chapters_of(self, book: str) -> list:
+        return sorted(self.books.get(normalize_book(book), {}))
+
+    # ---------------- persistence ----------------
+    def to_dict(self) -> dict:
+        return {
+            "format": INDEX_FORMAT,
+            "books": {
+                book: {str(c): d for c, d in sorted(chapters.items())}
+                for book, chapters in sorted(self.books.items())
+            },
+            "lectionary": dict(sorted(self.lectionary.items(), key=lambda kv: (len(kv[0]), kv[0]))),
+            "psalter": dict(sorted(self.psalter.items())),
+        }
+
+    def save(self, path: Path):
+        Path(path).write_text(json.dumps(self.to_dict(), indent=1), encoding="utf-8")
+
+    @staticmethod
+    def _merge_dates(mapping: dict, key, dates: list):
+        mine = mapping.get(key)
+        if not mine:
+            mapping[key] = list(dates)
+        elif mine[-1] < dates[0]:
+            # Years merged in order only ever append
+            mine.extend(dates)
+        else:
+            mapping[key] = sorted(set(mine).union(dates))
+
+    def merge(self, other: "CitationIndex"):
+        for book, chapters in other.books.items():
+            mine = self.books.setdefault(book, {})
+            for chapter, dates in chapters.items():
+                self._merge_dates(mine, chapter, dates)
+        for mapping, theirs in ((self.lectionary, other.lectionary), (self.psalter, other.psalter)):
+            for key, dates in theirs.items():
+                self._merge_dates(mapping, key, dates)
+        return self
+
+    @classmethod
+    def load(cls, *paths):
+        """One index over every listed index file (one per year, cheapest in year order)."""
+        index = cls()
+        for path in paths:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            if data.get("format") != INDEX_FORMAT:
+                raise ValueError(f"{path}: citation index format {data.get('format')}, expected {INDEX_FORMAT}")
+            part = cls()
+            for book, chapters in data["books"].items():
+                part.books[book] = {int(c): dates for c, dates in chapters.items()}
+            part.lectionary = data["lectionary"]
+            part.psalter = data["psalter"]
+            index.merge(part)
+        return index
+
+
+def index_path_for(citations_csv: Path) -> Path:
+    """daily_bible_citations_2026.csv -> daily_bible_citations_2026.index.json"""
+    citations_csv = Path(citations_csv)
+    return citations_csv.with_name(citations_csv.stem + ".index.json")
+
+
+# ----------------------------------------------------------
+# CLI Entry
+# ----------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Look up dates by book/chapter, lectionary number or psalter week")
+    parser.add_argument("paths", nargs="+", help="Citation index files or build output directories")
+    parser.add_argument("--book", help="Book name or abbreviation, e.g. 'Jn', 'John' or '1 Sm'")
+    parser.add_argument("--chapter", type=int, help="Chapter of --book")
+    parser.add_argument("--lectionary", help="Lectionary number, e.g. 205")
+    parser.add_argument("--psalter", help="Psalter week: I, II, III, IV or Prop")
+    args = parser.parse_args(argv)
+
+    files = []
+    for path in map(Path, args.paths):
+        files += sorted(path.glob("daily_bible_citations_*.index.json")) if path.is_dir() else [path]
+    index = CitationIndex.load(*files)
+
+    if args.book:
+        dates = index.dates_for(args.book, args.chapter)
+        label = f"{args.book} {args.chapter}" if args.chapter else args.book
+    elif args.lectionary:
+        dates, label = index.dates_for_lectionary(args.lectionary), f"lectionary {args.lectionary}"
+    elif args.psalter:
+        dates, label = index.dates_for_psalter(args.psalter), f"psalter week {args.psalter}"
+    else:
+        parser.error("give --book, --lectionary or --psalter")
+    print(f"{label}: {len(dates)} dates in {len(files)} index files")
+    for d in dates:
+        print(f"  {d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import re
+import argparse
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# ----------------------------------------------------------
+# Canonical book table: USCCB abbreviation -> full name and other spellings
+# ----------------------------------------------------------
+BOOKS = {
+    "Gn": ("Genesis", "Gen"), "Ex": ("Exodus", "Exod"), "Lv": ("Leviticus", "Lev"),
+    "Nm": ("Numbers", "Num"), "Dt": ("Deuteronomy", "Deut"), "Jos": ("Joshua", "Josh"),
+    "Jgs": ("Judges", "Judg"), "Ru": ("Ruth",), "1 Sm": ("1 Samuel", "1 Sam"), "2 Sm": ("2 Samuel", "2 Sam"),
+    "1 Kgs": ("1 Kings",), "2 Kgs": ("2 Kings",), "1 Chr": ("1 Chronicles",), "2 Chr": ("2 Chronicles",),
+    "Ezr": ("Ezra",), "Neh": ("Nehemiah",), "Tb": ("Tobit", "Tob"), "Jdt": ("Judith",),
+    "Est": ("Esther", "Esth"), "1 Mc": ("1 Maccabees", "1 Macc"), "2 Mc": ("2 Maccabees", "2 Macc"),
+    "Jb": ("Job",), "Ps": ("Psalm", "Psalms"), "Prv": ("Proverbs", "Prov"), "Eccl": ("Ecclesiastes", "Qoh"),
+    "Sg": ("Song of Songs", "Song"), "Wis": ("Wisdom",), "Sir": ("Sirach", "Ecclus"), "Is": ("Isaiah", "Isa"),
+    "Jer": ("Jeremiah",), "Lam": ("Lamentations",), "Bar": ("Baruch",), "Ez": ("Ezekiel", "Ezek"),
+    "Dn": ("Daniel", "Dan"), "Hos": ("Hosea",), "Jl": ("Joel",), "Am": ("Amos",), "Ob": ("Obadiah", "Obad"),
+    "Jon": ("Jonah",), "Mi": ("Micah", "Mic"), "Na": ("Nahum", "Nah"), "Hb": ("Habakkuk", "Hab"),
+    "Zep": ("Zephaniah", "Zeph"), "Hg": ("Haggai", "Hag"), "Zec": ("Zechariah", "Zech"), "Mal": ("Malachi",),
+    "Mt": ("Matthew", "Matt"), "Mk": ("Mark",), "Lk": ("Luke",), "Jn": ("John",), "Acts": ("Acts of the Apostles",),
+    "Rom": ("Romans",), "1 Cor": ("1 Corinthians",), "2 Cor": ("2 Corinthians",), "Gal": ("Galatians",),
+    "Eph": ("Ephesians",), "Phil": ("Philippians",), "Col": ("Colossians",), "1 Thes": ("1 Thessalonians", "1 Thess"),
+    "2 Thes": ("2 Thessalonians", "2 Thess"), "1 Tm": ("1 Timothy", "1 Tim"), "2 Tm": ("2 Timothy", "2 Tim"),
+    "Ti": ("Titus",), "Phlm": ("Philemon",), "Heb": ("Hebrews",), "Jas": ("James",), "1 Pt": ("1 Peter", "1 Pet"),
+    "2 Pt": ("2 Peter", "2 Pet"), "1 Jn": ("1 John",), "2 Jn": ("2 John",), "3 Jn": ("3 John",), "Jude": (),
+    "Rv": ("Revelation", "Rev"),
+}
+
+
+def _book_key(name: str) -> str:
+    return name.replace(" ", "").replace(".", "").lower()
+
+
+# Books of one chapter are cited by verse alone: "Jude 17, 20b-25", "2 Jn 4-9"
+ONE_CHAPTER_BOOKS = {"Ob", "Phlm", "2 Jn", "3 Jn", "Jude"}
+
+# Every spelling -> canonical abbreviation. "Pss" is deliberately absent: it marks the psalter week
+BOOK_ALIASES = {_book_key(name): abbr for abbr, names in BOOKS.items() for name in (abbr,) + names}
+
+
+def canonical_book(name: str) -> Optional[str]:
+    """'Genesis', 'Gen', 'Gn' -> 'Gn'; None for words that are not books."""
+    return BOOK_ALIASES.get(_book_key(name))
+
+
+# ----------------------------------------------------------
+# Parsed references
+# ----------------------------------------------------------
+class Citation(NamedTuple):
+    """One chapter reference of a SourceLine.
+
+    verses holds (first, last) pairs as printed, so "2:29-3:6" is chapter 2 with
+    ("29", "3:6"). reading numbers the '/'-separated readings of the line; alternate
+    marks references offered with "or". label is the book as printed.
+    """
+    book: str
+    chapter: int
+    verses: tuple
+    lectionary: Optional[str]
+    psalter_week: Optional[str]
+    label: str
+    reading: int
+    alternate: bool
+
+    @property
+    def last_chapter(self) -> int:
+        """Chapter the reference ends in, for ranges such as 14:15-15:1."""
+        ends = [int(last.split(":")[0]) for _, last in self.verses if ":" in last]
+        return max(ends, default=self.chapter)
+
+    def __str__(self):
+        verses = ", ".join(first if first == last else f"{first}-{last}" for first, last in self.verses)
+        return f"{self.label} {self.chapter}:{verses}" if verses else f"{self.label} {self.chapter}"
+
+
+# ----------------------------------------------------------
+# Tokenizer: one pass of one compiled pattern over the line
+# ----------------------------------------------------------
+_VERSE = r"\d+[a-z]?(?:-(?:\d+:)?\d+[a-z]?)?"
+# A comma continues the verse list unless a numbered book follows ("…, 1 Cor 2:1")
+_VERSES = rf"{_VERSE}(?:,\s*{_VERSE}(?!\s*[A-Z][a-z]))*"
+TOKEN_PATTERN = re.compile(
+    r"\((?P<paren>[^)]*)\)"
+    r"|\bPss\s+(?P<psalter>Prop|IV|III|II|I)\b"
+    rf"|(?P<book>(?:[1-3]\s?)?[A-Z][a-z]+\.?)\s*(?:(?P<chapter>\d+):(?P<verses>{_VERSES})|(?P<bare>{_VERSES}))"
+    rf"|(?P<cont>\d+):(?P<cont_verses>{_VERSES})"
+    r"|(?P<slash>/)"
+    r"|\b(?P<alt>or)\b(?P<alt_group>,)?"
+)
+# "(206)", or the number closing a note such as "(see Lectionary for Mass Supplement, 62)"
+LECTIONARY_NUMBER = re.compile(r"(?:^|.*,\s*)(\d+[A-Z]?)")
+
+
+def _verse_ranges(text: str) -> tuple:
+    ranges = []
+    for item in text.split(","):
+        first, _, last = item.strip().partition("-")
+        ranges.append((first, last or first))
+    return tuple(ranges)
+
+
+@lru_cache(maxsize=4096)
+def parse_citation_line(line: str) -> tuple:
+    """Every chapter reference in a SourceLine as Citation tuples, in order.
+
+    A parenthesised lectionary number applies to the references since the previous
+    parenthesis; the "Pss" week applies to the whole line. Readings recur across
+    cycles and years, so results are memoized.
+    """
+    found = []
+    pending = 0
+    book = label = None
+    reading = 0
+    alternate = alt_group = False
+    week = None
+
+    for m in TOKEN_PATTERN.finditer(line):
+        if m.group("paren") is not None:
+            number = LECTIONARY_NUMBER.fullmatch(m.group("paren").strip())
+            if not number:
+                continue  # "(second choice)"
+            lectionary = number.group(1)
+            for i in range(pending, len(found)):
+                found[i] = found[i]._replace(lectionary=lectionary)
+            pending = len(found)
+            reading += 1 if found and found[-1].reading == reading else 0
+            alt_group = False
+        elif m.group("psalter"):
+            week = m.group("psalter")
+        elif m.group("book"):
+            canonical = canonical_book(m.group("book"))
+            if canonical is None:
+                continue
+            book, label = canonical, m.group("book").rstrip(".")
+            if m.group("chapter"):
+                chapter, verses = int(m.group("chapter")), _verse_ranges(m.group("verses"))
+            elif book in ONE_CHAPTER_BOOKS:
+                chapter, verses = 1, _verse_ranges(m.group("bare"))
+            else:
+                # A whole chapter, "Ps 23"
+                chapter, verses = int(re.match(r"\d+", m.group("bare")).group()), ()
+            found.append(Citation(book, chapter, verses, None, None, label, reading, alternate or alt_group))
+            alternate = False
+        elif m.group("cont") and book:
+            verses = _verse_ranges(m.group("cont_verses"))
+            found.append(Citation(book, int(m.group("cont")), verses, None, None, label, reading, alternate or alt_group))
+            alternate = False
+        elif m.group("slash"):
+            if found and found[-1].reading == reading:
+                reading += 1
+        elif m.group("alt"):
+            alternate = True
+            alt_group = alt_group or bool(m.group("alt_group"))
+
+    if week:
+        found = [c._replace(psalter_week=week) for c in found]
+    return tuple(found)
+
+
+def short_citation(line: str) -> str:
+    """Distinct 'Book chapter' of each reading and of each alternative offered with "or".
+
+    An alternative from the same book keeps its own chapter ("Mt 14:22-36 or Mt 15:1-2");
+    further chapters inside one reading ("Zep 2:3; 3:12-13") are left to the full line.
+    """
+    short = []
+    previous = None
+    for c in parse_citation_line(line):
+        same_reading = previous is not None and c.reading == previous.reading
+        # Once inside an alternative, a further chapter of its book continues it
+        continued = same_reading and (not c.alternate or (previous.alternate and c.book == previous.book))
+        previous = c
+        if continued:
+            continue
+        text = f"{c.label} {c.chapter}"
+        if text not in short:
+            short.append(text)
+    return " / ".join(short)
+
+
+# ----------------------------------------------------------
+# CLI Entry
+# ----------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show how a citation line parses")
+    parser.add_argument("line", help='e.g. "1 Jn 2:29-3:6/Jn 1:29-34 (206) Pss I"')
+    args = parser.parse_args()
+    for citation in parse_citation_line(args.line):
+        flags = " (alternate)" if citation.alternate else ""
+        print(f"{citation.reading}: {citation.book:<6} {str(citation):<28} lectionary={citation.lectionary} "
+              f"psalter={citation.psalter_week}{flags}")
+    print(f"short: {short_citation(args.line)}")
@@ -1,18 +1,23 @@
 import re
 import csv
 import argparse
-import pdfplumber
 from pathlib import Path
 from datetime import datetime
+from src import metrics
+from src.utils.page_text import PageTextProvider, open_pages
+from src.utils.day_parser import MONTHS
+from src.utils.tokenizer import classify_line, DAY, MONTH_HEADER, SEPARATOR, FOOTNOTE, CITATION
+from src.utils.page_cache import add_cache_arguments, page_cache_from_args
+from src.metrics import add_metrics_arguments, metrics_from_args
+from src.utils.citation_index import CitationIndex, index_path_for
+from src.utils.citation_parser import short_citation
 
 # ----------------------------------------------------------
-# Helper: detect month and day patterns
+# Helper: line prefixes that never belong to a citation
 # ----------------------------------------------------------
-MONTH_PATTERN = re.compile(
-    r"^(JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER)\s+2026",
-    re.IGNORECASE,
-)
-DAY_PATTERN = re.compile(r"^(\d{1,2})\s+(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\b", re.IGNORECASE)
+SKIP_PREFIXES = ("-", "_____", "(")
+# Any capitalised word continues a citation that is already open
+CONTINUATION_PATTERN = re.compile(r"[A-Z][a-zA-Z0-9]")
 
 
 # ----------------------------------------------------------
@@ -40,62 +45,74 @@ def clean_text(text: str) -> str:
 # Helper: create a short version of the citation
 # ----------------------------------------------------------
 def shorten_bible_citation(full_text: str) -> str:
-    matches = re.findall(r"([1-3]?\s?[A-Za-z]+\s*\d+)", full_text)
-    if not matches:
-        return full_text.strip()
-    short = " / ".join([m.strip() for m in matches])
-    return short
+    short = short_citation(full_text)
+    return short or full_text.strip()
 
 
 # ----------------------------------------------------------
 # Extract citations for each date
 # ----------------------------------------------------------
-def extract_daily_bible_citations(pdf_path: Path, output_csv: Path):
+def extract_daily_bible_citations(pdf_path: Path, output_csv: Path, pages=None, year: int = 2026, check=None):
     citations = []
     current_month = None
     current_date = None
     buffer = []
     started = False
-    finished_year = False
-
-    with pdfplumber.open(pdf_path) as pdf:
-        for page_num, page in enumerate(pdf.pages, start=1):
-            if finished_year:
+    final_page = None
+    skip_page = None
+
+    counts = dict.fromkeys(
+        ["pages", "lines", "month_headers", "day_lines", "citation_lines", "continuation_lines", "ignored_lines", "unmatched_lines"], 0)
+
+    with metrics.phase("parse"), open_pages(pdf_path, pages) as pages:
+        # The citations sit in the day grid; the page map skips the front and back matter
+        page_indexes = pages.page_map().grid_pages(year)
+        pages.prefetch(page_indexes)
+        for page_num in page_indexes:
+            # December 31 owns the rest of its page and nothing after it
+            if final_page is not None:
                 break
 
-            text = page.extract_text()
+            text = pages.text(page_num)
             if not text:
                 continue
+            counts["pages"] += 1
 
             for line in text.splitlines():
                 line = clean_text(line.strip())
-                if not line or finished_year:
+                if not line:
                     continue
+                counts["lines"] += 1
+                kind, groups = classify_line(line)
 
                 if not started:
-                    if MONTH_PATTERN.match(line):
+                    if kind == MONTH_HEADER and groups[1] == year:
                         started = True
-                        current_month = line.split()[0].title()
-                        continue
+                        current_month = groups[0]
                     else:
-                        continue
-
-                if (
-                    line.startswith("-")
-                    or line.startswith("_____")
-                    or line.lower().startswith("pss prop")
-                    or line.startswith("(")
-                    or re.fullmatch(r"[-–—]+", line)
-                ):
+                        counts["ignored_lines"] += 1
+                    continue
+
+                # Footnotes run to the bottom of the page
+                if skip_page == page_num:
+                    counts["ignored_lines"] += 1
+                    continue
+                if kind == FOOTNOTE:
+                    counts["ignored_lines"] += 1
+                    skip_page = page_num
                     continue
 
-                m_month = MONTH_PATTERN.match(line)
-                if m_month:
-                    current_month = m_month.group(1).title()
+                if kind == SEPARATOR or line.startswith(SKIP_PREFIXES) or line[:8].lower() == "pss prop":
+                    counts["ignored_lines"] += 1
                     continue
 
-                m_day = DAY_PATTERN.match(line)
-                if m_day and current_month:
+                if kind == MONTH_HEADER:
+                    counts["month_headers"] += 1
+                    if groups[1] == year:
+                        current_month = groups[0]
+                    continue
+
+                if kind == DAY and groups[1] and current_month:
                     if current_date and buffer:
                         citation_text = " ".join(buffer).strip()
                         citations.append(
@@ -106,27 +123,28 @@ def extract_daily_bible_citations(pdf_path: Path, output_csv: Path):
                             }
                         )
                         buffer = []
+                    if final_page is not None:
+                        break
 
-                    day_num = int(m_day.group(1))
-                    month_num = datetime.strptime(current_month, "%B").month
-                    current_date = datetime(2026, month_num, day_num)
+                    counts["day_lines"] += 1
+                    day_num = groups[0]
+                    current_date = datetime(year, MONTHS.index(current_month) + 1, day_num)
 
                     if current_month == "December" and day_num == 31:
-                        finished_year = True
+                        final_page = page_num
                     continue
 
-                if re.match(r"^[A-Z][a-zA-Z0-9\s,:;—\-/]+/[A-Z]", line) or re.search(r"\([\d]+\)", line):
+                if kind == CITATION:
+                    counts["citation_lines"] += 1
                     buffer.append(line)
                     continue
 
-                if current_date and not buffer and re.search(r"[A-Z][a-z]+\s\d+:\d+[-–]\d+/", line):
+                if buffer and CONTINUATION_PATTERN.search(line):
+                    counts["continuation_lines"] += 1
                     buffer.append(line)
                     continue
 
-                if buffer and not DAY_PATTERN.match(line) and not MONTH_PATTERN.match(line):
-                    if re.search(r"([A-Z][a-zA-Z0-9]+:?\d*[:\d,\-]*)", line) and not re.fullmatch(r"[-–—]+", line):
-                        buffer.append(line)
-                        continue
+                counts["unmatched_lines"] += 1
 
         if current_date and buffer:
             citation_text = " ".join(buffer).strip()
@@ -139,37 +157,49 @@ def extract_daily_bible_citations(pdf_path: Path, output_csv: Path):
             )
 
     # ----------------------------------------------------------
-    # ✅ Manually add missing December 31, 2026 entry
+    # Write results to CSV, after an optional schema check
     # ----------------------------------------------------------
-    last_date = datetime(2026, 12, 31).strftime("%Y-%m-%d")
-    if not any(c["Date"] == last_date for c in citations):
-        citations.append(
-            {
-                "Date": last_date,
-                "BibleCitationShort": "1 Jn 2 / Jn 1",
-                "SourceLine": "1 Jn 2:18-21/Jn 1:1-18 (204) Pss Prop",
-            }
-        )
-        print("🩵 Added missing date: December 31, 2026")
-
-    # ----------------------------------------------------------
-    # Write results to CSV
-    # ----------------------------------------------------------
-    with open(output_csv, "w", newline="", encoding="utf-8") as f:
+    metrics.current().add_counts(counts)
+    if check:
+        with metrics.phase("check"):
+            check(Path(output_csv).name, citations)
+    with metrics.phase("write"), open(output_csv, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=["Date", "BibleCitationShort", "SourceLine"])
         writer.writeheader()
         writer.writerows(citations)
 
-    print(f"✅ Extracted {len(citations)} daily Bible citations to {output_csv}")
+    # Book/chapter, lectionary and psalter lookups, persisted beside the CSV
+    index_path = index_path_for(output_csv)
+    with metrics.phase("index"):
+        CitationIndex.from_citations(citations).save(index_path)
+
+    metrics.log(f"✅ Extracted {len(citations)} daily Bible citations to {output_csv} (index → {index_path.name})")
+    return citations
 
 
 # ----------------------------------------------------------
 # CLI Entry
 # ----------------------------------------------------------
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Extract daily Bible citations from USCCB 2026 Liturgical Calendar.")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract daily Bible citations from a USCCB Liturgical Calendar.")
+    parser.add_argument("--year", type=int, default=2026, help="Calendar year printed in the PDF's month headers")
     parser.add_argument("--input-pdf", required=True, help="Path to input PDF file")
-    parser.add_argument("--out", required=False, default="data/daily_bible_citations_2026.csv", help="Output CSV path")
+    parser.add_argument("--out", help="Output CSV path (default: data/daily_bible_citations_<year>.csv)")
+    add_cache_arguments(parser)
+    parser.add_argument("--workers", type=int, default=1, help="Processes used to extract PDF pages in parallel")
+    add_metrics_arguments(parser)
+
+    args = parser.parse_args(argv)
+    pdf_path = Path(args.input_pdf)
+    out = Path(args.out) if args.out else Path("data") / f"daily_bible_citations_{args.year}.csv"
+    cache = page_cache_from_args(args, pdf_path)
+    with metrics_from_args(args) as run_metrics, PageTextProvider(pdf_path, cache=cache, workers=args.workers,
+                                                                  layout=args.layout) as pages:
+        extract_daily_bible_citations(pdf_path, out, pages=pages, year=args.year)
+        run_metrics.info["page_stats"] = stats = pages.stats()
+        if pages.cache:
+            run_metrics.log(f"🗄️  Page cache: {stats['cache_hits']} hits, {stats['cache_misses']} misses")
+
 
-    args = parser.parse_args()
-    extract_daily_bible_citations(Path(args.input_pdf), Path(args.out))
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+import pickle
+import hashlib
+from pathlib import Path
+from datetime import date
+from src import metrics
+from src.model import DayRecord
+from src.utils.tokenizer import classify_line, DAY, RANK, MONTH_HEADER, SEPARATOR, FOOTNOTE
+from src.utils.calendar_rules import holy_days_for, us_holidays_for
+from src.utils.day_slots import DaySlots, day_fields
+
+MONTHS = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+]
+
+
+# ----------------------------------------------------------
+# Text sources → (page, line) events
+# ----------------------------------------------------------
+def iter_page_lines(pages, start_page: int = 0, end_page: int = None, page_indexes=None):
+    """Yield (page_index, line) for every non-empty line of a page-text provider, over
+    the given page_indexes or else the range start_page..end_page."""
+    if page_indexes is None:
+        page_indexes = range(start_page, len(pages) if end_page is None else end_page)
+    pages.prefetch(page_indexes)
+    for page_num in page_indexes:
+        for line in pages.lines(page_num):
+            yield page_num, line
+
+
+def iter_text_lines(page_texts, start_page: int = 0):
+    """Yield (page_index, line) events from plain page strings, e.g. cached text or fixtures."""
+    for page_num, text in enumerate(page_texts, start=start_page):
+        for line in (text or "").splitlines():
+            if line.strip():
+                yield page_num, line.strip()
+
+
+# ----------------------------------------------------------
+# Streaming day-data parser
+# ----------------------------------------------------------
+class DayDataParser:
+    """Resumable state machine that turns (page, line) events into DayRecords.
+
+    Month headers such as "APRIL 2026" switch the month where they appear and a drop
+    in the day number rolls over to the next month. A day row is held back for one
+    line so the rank printed underneath it can be attached, which makes feed() safe
+    to call across any number of pages, passes or sources. Only the days printed in
+    the PDF are yielded; assemble_day_data() places them in DaySlots and fills the
+    days the PDF skipped.
+    """
+
+    def __init__(self, year: int = 2026, holy_days: dict = None, us_holidays: dict = None):
+        self.year = year
+        self.holy_days = holy_days_for(year) if holy_days is None else holy_days
+        self.us_holidays = us_holidays_for(year) if us_holidays is None else us_holidays
+        self.current_month = None
+        self.previous_day_num = 0
+        self.previous_date_obj = None
+        self.pending = None
+        self.skip_page = None
+        self.finished = False
+        self.last_page = None
+        # Line accounting for the build metrics
+        self.counts = dict.fromkeys(
+            ["pages", "lines", "day_lines", "rank_lines", "month_headers", "ignored_lines", "unmatched_lines",
+             "gap_filled_days", "duplicate_days", "spliced_pages"], 0)
+
+    def _reset_page_state(self):
+        self.previous_date_obj = None
+        self.previous_day_num = 0
+
+    def feed(self, page_num: int, line: str):
+        """Consume one line and yield every row it completes."""
+        if self.finished:
+            return
+        line = line.strip()
+        kind, groups = classify_line(line)
+        counts = self.counts
+        counts["lines"] += 1
+        if page_num != self.last_page:
+            self.last_page = page_num
+            counts["pages"] += 1
+
+        rank = False
+        if self.pending is not None:
+            row, pending_page = self.pending
+            self.pending = None
+            if pending_page == page_num and kind == RANK:
+                row.feast_rank = line
+                rank = True
+                counts["rank_lines"] += 1
+            yield from self._emit(row)
+            if self.finished:
+                return
+
+        if self.skip_page is not None:
+            if page_num == self.skip_page:
+                counts["ignored_lines"] += 1
+                return
+            self.skip_page = None
+
+        if kind == MONTH_HEADER:
+            counts["month_headers"] += 1
+            if groups[1] == self.year:
+                self.current_month = groups[0]
+                self.previous_day_num = 0
+            return
+
+        if not self.current_month:
+            counts["ignored_lines"] += 1
+            return
+
+        if kind == SEPARATOR or kind == FOOTNOTE:
+            counts["ignored_lines"] += 1
+            self.skip_page = page_num
+            self._reset_page_state()
+            return
+
+        # Day entry: date + feast + color
+        if kind != DAY or groups[3] is None:
+            counts["unmatched_lines"] += not rank
+            return
+        day_num, _, feast, color = groups
+
+        if day_num < self.previous_day_num:
+            if self.current_month == MONTHS[-1]:
+                self.finished = True
+                return
+            self.current_month = MONTHS[MONTHS.index(self.current_month) + 1]
+        self.previous_day_num = day_num
+
+        try:
+            date_obj = date(self.year, MONTHS.index(self.current_month) + 1, day_num)
+        except ValueError:
+            counts["unmatched_lines"] += 1
+            return
+        if self.previous_date_obj and date_obj <= self.previous_date_obj:
+            counts["unmatched_lines"] += 1
+            return
+        counts["day_lines"] += 1
+        self.previous_date_obj = date_obj
+
+        row = DayRecord(date_obj, feast.strip(), "", color.capitalize(), source_page=page_num + 1,
+                        **day_fields(date_obj, self.holy_days, self.us_holidays))
+        self.pending = (row, page_num)
+
+    def _emit(self, row):
+        yield row
+        if row.date.month == 12 and row.date.day == 31:
+            self.finished = True
+
+    def close(self):
+        """Flush the row still waiting for its rank line."""
+        if self.pending is not None:
+            row, _ = self.pending
+            self.pending = None
+            yield from self._emit(row)
+
+    def page_state(self) -> tuple:
+        """Everything the rows of the next page depend on besides its own lines. Only
+        meaningful between pages, after close() has flushed the last row of a page (a
+        rank is never printed on another page than its day row)."""
+        return self.current_month, self.previous_day_num, self.previous_date_obj, self.finished
+
+    def restore_page_state(self, state: tuple):
+        self.current_month, self.previous_day_num, self.previous_date_obj, self.finished = state
+        self.pending = None
+        self.skip_page = None
+
+
+def fill_day_slots(slots: DaySlots, counts: dict) -> DaySlots:
+    """Fill the skipped days of parsed slots and report them with the parser's line counts."""
+    counts["gap_filled_days"] += slots.fill()
+    counts["duplicate_days"] += len(slots.duplicates)
+    run_metrics = metrics.current()
+    run_metrics.add_counts(counts)
+    run_metrics.info.setdefault("inferred_days", {})[str(slots.year)] = [day.isoformat() for day in slots.inferred()]
+    return slots
+
+
+def assemble_day_data(events, year: int = 2026, **kwargs) -> DaySlots:
+    """DaySlots of `year` from any iterable of (page, line) events, skipped days filled."""
+    parser = DayDataParser(year, **kwargs)
+    slots = DaySlots(year, parser.holy_days, parser.us_holidays)
+    for page_num, line in events:
+        for row in parser.feed(page_num, line):
+            slots.place(row)
+        if parser.finished:
+            break
+    for row in parser.close():
+        slots.place(row)
+    return fill_day_slots(slots, parser.counts)
+
+
+def parse_day_data(events, year: int = 2026, **kwargs):
+    """Generator of DayRecords, in date order, from any iterable of (page, line) events."""
+    yield from assemble_day_data(events, year, **kwargs).rows()
+
+
+# ----------------------------------------------------------
+# Page-at-a-time parsing with a memo of previous builds
+# ----------------------------------------------------------
+class PageMemo:
+    """Rows and end state of every page parsed, keyed by page index, page content hash
+    and the parser state the page started from.
+
+    A revised edition of the calendar changes a few pages; every other page starts
+    from the same state as in the previous build and so gives the same rows, which
+    are spliced in without reading the page. `salt` fingerprints the parser code and
+    settings; a memo saved under another salt is dropped.
+    """
+
+    def __init__(self, previous: dict = None, salt: str = ""):
+        self.previous = previous or {}
+        self.current = {}
+        self.salt = salt
+
+    @staticmethod
+    def key(page_num: int, page_hash: str, state: tuple) -> tuple:
+        return page_num, page_hash, hashlib.sha1(repr(state).encode("utf-8")).hexdigest()
+
+    def lookup(self, key):
+        return self.previous.get(key)
+
+    def record(self, key, rows: list, state: tuple):
+        self.current[key] = (rows, state)
+
+    def page_hashes(self) -> set:
+        return {page_hash for _, page_hash, _ in self.previous}
+
+    @classmethod
+    def load(cls, path: Path, salt: str = ""):
+        try:
+            with open(path, "rb") as f:
+                saved = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            saved = None
+        if not saved or saved.get("salt") != salt:
+            return cls(salt=salt)
+        return cls(saved["pages"], salt)
+
+    def save(self, path: Path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump({"salt": self.salt, "pages": self.current}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def parse_day_pages(pages, page_indexes, year: int = 2026, memo: PageMemo = None, **kwargs) -> DaySlots:
+    """DaySlots of the listed pages of a provider, parsed one page at a time. Pages
+    found in the memo are spliced in unread; every parsed page is recorded in it."""
+    memo = memo or PageMemo()
+    hashes = pages.page_hashes()
+    page_indexes = list(page_indexes)
+    known = memo.page_hashes()
+    pages.prefetch([i for i in page_indexes if hashes[i] not in known])
+
+    parser = DayDataParser(year, **kwargs)
+    slots = DaySlots(year, parser.holy_days, parser.us_holidays)
+    for page_num in page_indexes:
+        if parser.finished:
+            break
+        key = memo.key(page_num, hashes[page_num], parser.page_state())
+        saved = memo.lookup(key)
+        if saved is not None:
+            rows, state = saved
+            parser.restore_page_state(state)
+            parser.counts["spliced_pages"] += 1
+        else:
+            rows = []
+            for line in pages.lines(page_num):
+                rows.extend(parser.feed(page_num, line))
+                if parser.finished:
+                    break
+            rows.extend(parser.close())
+            state = parser.page_state()
+        memo.record(key, rows, state)
+        for row in rows:
+            slots.place(row)
+    return fill_day_slots(slots, parser.counts)
@@ -0,0 +1,102 @@
+# ----------------------------------------------------------
+# Day slots: one year's day records in a dense day-of-year array
+# ----------------------------------------------------------
+from datetime import date
+
+from src.utils.calendar_rules import holy_days_for, us_holidays_for
+
+# Slot origins, in order of precedence: a row only replaces one of lower precedence
+EMPTY = 0
+INFERRED = 1
+PARSED = 2
+
+
+def day_fields(day: date, holy_days: dict, us_holidays: dict) -> dict:
+    """The DayRecord fields that follow from the date alone: flags and grid position."""
+    date_str = day.isoformat()
+    weekday_col = ((day.weekday() + 1) % 7) + 1
+    return {
+        "is_holy_day_of_obligation": 1 if date_str in holy_days else 0,
+        "us_holiday_name": us_holidays.get(date_str, ""),
+        "is_first_friday": 1 if (weekday_col == 6 and day.day <= 7) else 0,
+        "is_first_saturday": 1 if (weekday_col == 7 and day.day <= 7) else 0,
+        "week_row": (day.day - 1) // 7 + 1,
+        "weekday_col": weekday_col,
+        "display_date_number": day.day,
+        "belongs_to_month": 1,
+    }
+
+
+def inferred_record(previous, day: date, source_page: int, holy_days: dict, us_holidays: dict):
+    """A skipped day carries the feast, rank and color printed before it, with its own date fields."""
+    return previous.copy(date=day, source_page=source_page, **day_fields(day, holy_days, us_holidays))
+
+
+class DaySlots:
+    """One slot per day of `year` (365 or 366) holding a DayRecord and its origin.
+
+    Precedence: a parsed row always beats an inferred one, and of two parsed rows
+    for the same day the first one placed stays; the later one (a day printed
+    again, e.g. carried onto the next page) is only listed in `duplicates`.
+    """
+
+    def __init__(self, year: int, holy_days: dict = None, us_holidays: dict = None):
+        self.year = year
+        self.holy_days = holy_days_for(year) if holy_days is None else holy_days
+        self.us_holidays = us_holidays_for(year) if us_holidays is None else us_holidays
+        self.start = date(year, 1, 1).toordinal()
+        size = date(year + 1, 1, 1).toordinal() - self.start
+        self.records = [None] * size
+        self.origins = [EMPTY] * size
+        self.duplicates = []
+
+    def __len__(self):
+        return len(self.records)
+
+    def index(self, day: date) -> int:
+        i = day.toordinal() - self.start
+        if not 0 <= i < len(self.records):
+            raise ValueError(f"{day.isoformat()} is not a day of {self.year}")
+        return i
+
+    def place(self, record, origin: int = PARSED) -> bool:
+        """Put a record in its day's slot unless the slot holds one of equal or higher precedence."""
+        i = self.index(record.date)
+        if origin <= self.origins[i]:
+            if origin == PARSED:
+                self.duplicates.append(record.date)
+            return False
+        self.records[i] = record
+        self.origins[i] = origin
+        return True
+
+    def fill(self) -> int:
+        """Fill every empty slot between two placed days from the day before the gap,
+        in one pass over the slots; an inferred day takes the page of the day that
+        closes its gap. Returns the number of slots filled."""
+        filled = 0
+        previous = None
+        gap_start = None
+        for i, origin in enumerate(self.origins):
+            if origin == EMPTY:
+                if previous is not None and gap_start is None:
+                    gap_start = i
+                continue
+            record = self.records[i]
+            if gap_start is not None:
+                for j in range(gap_start, i):
+                    day = date.fromordinal(self.start + j)
+                    self.records[j] = inferred_record(previous, day, record.source_page, self.holy_days, self.us_holidays)
+                    self.origins[j] = INFERRED
+                filled += i - gap_start
+                gap_start = None
+            previous = record
+        return filled
+
+    def inferred(self) -> list:
+        """Dates whose record was filled in rather than read from the PDF."""
+        return [date.fromordinal(self.start + i) for i, origin in enumerate(self.origins) if origin == INFERRED]
+
+    def rows(self) -> list:
+        """The placed records in date order; days before the first and after the last parsed day stay empty."""
+        return [record for record in self.records if record is not None]
@@ -0,0 +1,164 @@
+import os
+import json
+import zlib
+import shutil
+import hashlib
+from pathlib import Path
+
+
+# Bump when the on-disk layout changes; old entries are then simply never read again
+CACHE_FORMAT = 1
+DEFAULT_CACHE_DIR = Path(os.environ.get("LITCAL_CACHE_DIR", ".cache/page_text"))
+
+
+# ----------------------------------------------------------
+# Helper: content hash of a file
+# ----------------------------------------------------------
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _pdfplumber_version() -> str:
+    # importlib.metadata costs more to import than the lookup itself; only cache users pay
+    from importlib import metadata
+
+    try:
+        return metadata.version("pdfplumber")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def settings_key(extract_kwargs: dict = None) -> str:
+    """Short hash of everything besides the PDF bytes that affects extracted text."""
+    settings = {
+        "format": CACHE_FORMAT,
+        "pdfplumber": _pdfplumber_version(),
+        "extract_text": extract_kwargs or {},
+    }
+    blob = json.dumps(settings, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(blob).hexdigest()[:12]
+
+
+# ----------------------------------------------------------
+# Content-addressed page-text cache
+# ----------------------------------------------------------
+class PageTextCache:
+    """Persistent store of extracted page text keyed by PDF hash, page and extraction settings.
+
+    Layout: <cache_dir>/<pdf sha256>/<settings key>/<page>.zz holds the zlib-compressed
+    text of one page, and manifest.json records the page count so a warm run never
+    has to open the PDF.
+    """
+
+    def __init__(self, pdf_path: Path, cache_dir: Path = DEFAULT_CACHE_DIR, extract_kwargs: dict = None,
+                 pdf_hash: str = None):
+        self.cache_dir = Path(cache_dir)
+        self.extract_kwargs = extract_kwargs
+        self.pdf_hash = pdf_hash or file_sha256(pdf_path)
+        self.root = self.cache_dir / self.pdf_hash / settings_key(extract_kwargs)
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def _page_path(self, page_index: int) -> Path:
+        return self.root / f"{page_index:04d}.zz"
+
+    def _manifest_path(self) -> Path:
+        return self.root / "manifest.json"
+
+    def edition(self, pdf_hash: str):
+        """The cache of another edition (PDF hash) under the same directory and settings."""
+        return PageTextCache(None, self.cache_dir, self.extract_kwargs, pdf_hash=pdf_hash)
+
+    def _read_json(self, name: str):
+        try:
+            return json.loads((self.root / name).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_json(self, name: str, data):
+        self._write(self.root / name, json.dumps(data).encode("utf-8"))
+
+    def _write(self, path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def get(self, page_index: int):
+        """Return cached text for a page, or None on a miss."""
+        try:
+            data = self._page_path(page_index).read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return zlib.decompress(data).decode("utf-8")
+
+    def put(self, page_index: int, text: str):
+        self._write(self._page_path(page_index), zlib.compress((text or "").encode("utf-8"), 6))
+        self.writes += 1
+
+    def page_count(self):
+        try:
+            manifest = json.loads(self._manifest_path().read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        return manifest.get("page_count")
+
+    def set_page_count(self, count: int):
+        manifest = {"pdf_sha256": self.pdf_hash, "page_count": count}
+        self._write(self._manifest_path(), json.dumps(manifest).encode("utf-8"))
+
+    def page_map(self):
+        """The saved page-map dict of this PDF, or None."""
+        return self._read_json("page_map.json")
+
+    def set_page_map(self, data: dict):
+        self._write_json("page_map.json", data)
+
+    def page_hashes(self):
+        """The saved per-page content hashes of this PDF, or None."""
+        return self._read_json("page_hashes.json")
+
+    def set_page_hashes(self, data: dict):
+        self._write_json("page_hashes.json", data)
+
+    def clear(self):
+        """Drop every cached page for this PDF and settings."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def stats(self) -> dict:
+        return {"cache_hits": self.hits, "cache_misses": self.misses, "cache_writes": self.writes}
+
+
+# ----------------------------------------------------------
+# CLI helpers shared by build.py and daily_bible_citation.py
+# ----------------------------------------------------------
+def add_cache_arguments(parser):
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help="Directory for the extracted page-text cache")
+    parser.add_argument("--no-cache", action="store_true", help="Always extract pages with pdfplumber")
+    parser.add_argument("--rebuild-cache", action="store_true", help="Discard cached pages for this PDF and re-extract")
+    parser.add_argument("--layout", action="store_true",
+                        help="Read only the calendar grid from character positions instead of extract_text()")
+
+
+def layout_cache_kwargs(layout: bool) -> dict:
+    """Cache settings of a page-text mode; layout text is stored apart from extract_text() output."""
+    from src.utils.page_layout import LAYOUT_FORMAT
+
+    return {"layout": LAYOUT_FORMAT} if layout else None
+
+
+def page_cache_from_args(args, pdf_path: Path):
+    if args.no_cache:
+        return None
+    cache = PageTextCache(pdf_path, Path(args.cache_dir),
+                          extract_kwargs=layout_cache_kwargs(getattr(args, "layout", False)))
+    if args.rebuild_cache:
+        cache.clear()
+    return cache
@@ -0,0 +1,63 @@
+# ----------------------------------------------------------
+# Page hashes: one content hash per PDF page, so editions are compared page by page
+# ----------------------------------------------------------
+import json
+import hashlib
+from pathlib import Path
+
+# Bump when the hash covers something else; manifests of another format are ignored
+PAGE_HASH_FORMAT = 1
+PAGES_MANIFEST = "pages.json"
+
+
+def page_content_hash(page) -> str:
+    """Hash of a pdfplumber page's content streams and the fonts and XObjects it draws with."""
+    from pdfminer.pdftypes import PDFStream, resolve1
+
+    digest = hashlib.sha256()
+    for stream in page.page_obj.contents:
+        digest.update(resolve1(stream).get_data() or b"")
+    resources = resolve1(page.page_obj.resources) or {}
+    for kind in ("Font", "XObject"):
+        objects = resolve1(resources.get(kind)) or {}
+        for name in sorted(objects):
+            obj = resolve1(objects[name])
+            digest.update(f"{kind}/{name}".encode("utf-8"))
+            if isinstance(obj, PDFStream):
+                digest.update(obj.get_data() or b"")
+                continue
+            for key in ("BaseFont", "Encoding", "FirstChar", "Widths"):
+                digest.update(repr(resolve1(obj.get(key))).encode("utf-8"))
+            to_unicode = resolve1(obj.get("ToUnicode"))
+            if isinstance(to_unicode, PDFStream):
+                digest.update(to_unicode.get_data() or b"")
+    return digest.hexdigest()
+
+
+def text_page_hash(text: str) -> str:
+    """Stand-in hash for pages that only exist as text (fixtures, synthetic corpora)."""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+# ----------------------------------------------------------
+# The previous build's page manifest
+# ----------------------------------------------------------
+def read_page_manifest(state_dir: Path):
+    """{"pdf_sha256", "hashes"} of the edition last built into this state dir, or None."""
+    try:
+        manifest = json.loads((Path(state_dir) / PAGES_MANIFEST).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+    return manifest if manifest.get("format") == PAGE_HASH_FORMAT else None
+
+
+def write_page_manifest(state_dir: Path, pdf_sha256: str, hashes: list):
+    Path(state_dir).mkdir(parents=True, exist_ok=True)
+    manifest = {"format": PAGE_HASH_FORMAT, "pdf_sha256": pdf_sha256, "hashes": list(hashes)}
+    (Path(state_dir) / PAGES_MANIFEST).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+
+def changed_pages(previous_hashes, hashes) -> list:
+    """Indexes of the pages that are new or differ from the same page of the previous edition."""
+    previous_hashes = list(previous_hashes or [])
+    return [i for i, h in enumerate(hashes) if i >= len(previous_hashes) or previous_hashes[i] != h]
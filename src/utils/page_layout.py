@@ -0,0 +1,98 @@
+# ----------------------------------------------------------
+# Page layout: calendar grid text rebuilt from character positions
+# ----------------------------------------------------------
+
+# Bump when the rebuilt text changes; it keys the page cache and the stage fingerprints
+LAYOUT_FORMAT = 1
+
+# Points on a 612x792 calendar page
+GRID_TOP = 60.0         # running header sits at 36, month headers at 74
+GRID_BOTTOM = 735.0     # page numbers sit at 744
+DAY_COLUMN_RIGHT = 100.0  # day numbers start at 72, weekdays at 108
+ROW_TOLERANCE = 2.0     # superscript markers sit a little above their row
+WORD_GAP = 3.0          # a wider gap than this between glyphs reads as a space
+FIELD_GAP = 8.0         # a wider gap than this is a tab stop between columns
+# Footnotes sit under a short rule from x=72 to x=216
+RULE_X0, RULE_X1 = 72.0, 216.0
+
+FIELD_SEPARATOR = "\t"
+# Stands in for the footnotes cut off below the rule, so the parsers still stop there
+FOOTNOTE_RULE = "_____"
+
+
+def grid_bottom(page) -> float:
+    """Top of the footnote rule when the page has one, otherwise the footer line."""
+    rules = [
+        obj["top"] for obj in page.rects + page.lines
+        if abs(obj["x0"] - RULE_X0) < 2 and abs(obj["x1"] - RULE_X1) < 2 and obj["height"] < 1
+    ]
+    return min(rules, default=GRID_BOTTOM)
+
+
+def group_rows(chars) -> list:
+    """Chars grouped into rows by their top edge, each row in reading order."""
+    by_top = {}
+    for char in chars:
+        by_top.setdefault(round(char["top"]), []).append(char)
+    rows = []
+    for top in sorted(by_top):
+        if rows and top - rows[-1][0] <= ROW_TOLERANCE:
+            rows[-1][1].extend(by_top[top])
+        else:
+            rows.append([top, by_top[top]])
+    return [sorted(row, key=lambda char: char["x0"]) for _, row in rows]
+
+
+def row_fields(row) -> list:
+    """(x0, text) of each run of glyphs separated by tab stops; spaces inside a run are kept."""
+    fields = []
+    parts, start, right, space = [], None, None, False
+    for char in row:
+        text = char["text"]
+        if text.isspace():
+            space = True
+            continue
+        if right is not None:
+            gap = char["x0"] - right
+            if gap > FIELD_GAP:
+                fields.append((start, "".join(parts)))
+                parts, start = [], None
+            elif space or gap > WORD_GAP:
+                parts.append(" ")
+        if start is None:
+            start = char["x0"]
+        parts.append(text)
+        right, space = char["x1"], False
+    if parts:
+        fields.append((start, "".join(parts)))
+    return fields
+
+
+def format_row(fields) -> str:
+    """One text line; a row that starts with a number in the day column keeps its tab stops."""
+    if len(fields) > 1:
+        x0, first = fields[0]
+        if x0 < DAY_COLUMN_RIGHT and first.isdigit() and len(first) <= 2:
+            return FIELD_SEPARATOR.join(text for _, text in fields)
+    return " ".join(text for _, text in fields)
+
+
+def layout_text(page) -> str:
+    """Text of the grid band of a pdfplumber page, one line per row.
+
+    Pages without a single day row (front matter, the abbreviation and feast lists)
+    are not calendar grid and come back as extract_text() prints them.
+    """
+    bottom = grid_bottom(page)
+    grid = page.within_bbox((0, GRID_TOP, page.width, min(bottom, page.height)))
+    lines = [format_row(row_fields(row)) for row in group_rows(grid.chars)]
+    lines = [line for line in lines if line]
+    if not any(FIELD_SEPARATOR in line for line in lines):
+        return page.extract_text()
+    if bottom < GRID_BOTTOM:
+        lines.append(FOOTNOTE_RULE)
+    return "\n".join(lines)
+
+
+def extract_page(page, layout: bool = False) -> str:
+    return layout_text(page) if layout else page.extract_text()
@@ -0,0 +1,153 @@
+# ----------------------------------------------------------
+# Page map: which pages hold the day grid and the major-feast list
+# ----------------------------------------------------------
+import re
+
+from src.utils.page_layout import GRID_TOP, group_rows, row_fields
+from src.utils.tokenizer import classify_line, DAY, MONTH_HEADER
+
+# Bump when discovery changes; cached maps of another format are rediscovered
+PAGE_MAP_FORMAT = 1
+
+STRIP_BOTTOM = 110.0    # month header at 74, then the first one or two rows of the grid
+HEAD_LINES = 3          # lines of already extracted text that stand in for the strip
+
+GRID = "grid"
+FEAST_LIST = "feast_list"
+OTHER = "other"
+UNKNOWN = "unknown"     # the strip could not be read; such pages are walked by every extractor
+
+FEAST_LIST_TITLE = re.compile(r"^PROPER CALENDAR FOR THE DIOCESES\b", re.IGNORECASE)
+
+
+# ----------------------------------------------------------
+# Page kinds from the first lines of a page
+# ----------------------------------------------------------
+def classify_head(lines) -> tuple:
+    """(kind, "Month YYYY" headers) of a page from the lines of its header strip."""
+    kind, months = OTHER, []
+    for line in lines:
+        token, groups = classify_line(line)
+        if token == MONTH_HEADER:
+            kind = GRID
+            months.append(f"{groups[0]} {groups[1]}")
+        elif token == DAY and groups[1]:
+            kind = GRID
+        elif kind == OTHER and FEAST_LIST_TITLE.match(line):
+            kind = FEAST_LIST
+    return kind, months
+
+
+class PageMap:
+    """Kind of every page and the page that opens each "Month YYYY" header."""
+
+    def __init__(self, kinds, months):
+        self.kinds = list(kinds)
+        self.months = dict(months)
+
+    @classmethod
+    def discover(cls, heads):
+        """Map pages from their header strips; None marks a page whose strip could not be read.
+
+        A page with no text in its strip right after the feast list continues it, and
+        the grid runs unbroken, so a page between two grid pages whose strip holds
+        only a carried-over entry (rank, citations) is grid too.
+        """
+        kinds, months = [], {}
+        for page_index, head in enumerate(heads):
+            if head is None:
+                kinds.append(UNKNOWN)
+                continue
+            lines = [line.strip() for line in head.splitlines() if line.strip()]
+            kind, headers = classify_head(lines)
+            if kind == OTHER and not lines and kinds and kinds[-1] == FEAST_LIST:
+                kind = FEAST_LIST
+            kinds.append(kind)
+            for header in headers:
+                months.setdefault(header, page_index)
+        grid = [i for i, kind in enumerate(kinds) if kind == GRID]
+        if grid:
+            for i in range(grid[0], grid[-1]):
+                if kinds[i] == OTHER:
+                    kinds[i] = GRID
+        return cls(kinds, months)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def pages(self, kind: str) -> list:
+        return [i for i, k in enumerate(self.kinds) if k == kind or k == UNKNOWN]
+
+    def grid_pages(self, year: int = None) -> list:
+        """Day-grid pages, from the first month header of `year` on when the map has one."""
+        pages = self.pages(GRID)
+        starts = [page for header, page in self.months.items() if year is not None and header.endswith(f" {year}")]
+        if starts:
+            pages = [i for i in pages if i >= min(starts)]
+        return pages
+
+    def feast_list_pages(self) -> list:
+        return self.pages(FEAST_LIST)
+
+    def to_dict(self) -> dict:
+        return {"format": PAGE_MAP_FORMAT, "kinds": self.kinds, "months": self.months}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        if not data or data.get("format") != PAGE_MAP_FORMAT:
+            return None
+        return cls(data["kinds"], data["months"])
+
+
+def heads_from_texts(texts) -> list:
+    """Header strips approximated by the first lines of page text already in memory."""
+    heads = []
+    for text in texts:
+        lines = [line.strip() for line in (text or "").splitlines() if line.strip()]
+        heads.append("\n".join(lines[:HEAD_LINES]))
+    return heads
+
+
+# ----------------------------------------------------------
+# Header strips straight from pdfminer
+# ----------------------------------------------------------
+def read_header_strips(pdf, top: float = GRID_TOP, bottom: float = STRIP_BOTTOM) -> list:
+    """Text between `top` and `bottom` of every page of an open pdfplumber PDF, or None
+    for a page pdfminer cannot interpret. Pages draw their running header and page
+    number before the body, so glyphs outside the strip are skipped until the first
+    one inside it, and the page is abandoned at the first glyph below it after that."""
+    from pdfminer.converter import PDFLayoutAnalyzer
+    from pdfminer.pdfinterp import PDFPageInterpreter
+    from pdfminer.psexceptions import PSException
+
+    class StripDone(Exception):
+        pass
+
+    class StripDevice(PDFLayoutAnalyzer):
+        def __init__(self, rsrcmgr):
+            super().__init__(rsrcmgr, laparams=None)
+            self.chars = []
+
+        def render_char(self, *args, **kwargs):
+            advance = super().render_char(*args, **kwargs)
+            char = self.cur_item._objs[-1]
+            char_top = self.cur_item.y1 - char.y1
+            if top <= char_top <= bottom:
+                self.chars.append({"text": char.get_text(), "x0": char.x0, "x1": char.x1, "top": char_top})
+            elif char_top > bottom and self.chars:
+                raise StripDone
+            return advance
+
+    strips = []
+    for page in pdf.pages:
+        device = StripDevice(pdf.rsrcmgr)
+        try:
+            PDFPageInterpreter(pdf.rsrcmgr, device).process_page(page.page_obj)
+        except StripDone:
+            pass
+        except (PSException, TypeError, ValueError, KeyError):
+            strips.append(None)
+            continue
+        rows = [" ".join(text for _, text in row_fields(row)) for row in group_rows(device.chars)]
+        strips.append("\n".join(row for row in rows if row))
+    return strips
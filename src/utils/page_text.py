@@ -0,0 +1,318 @@
+import time
+import threading
+from contextlib import ExitStack, nullcontext
+from pathlib import Path
+
+from src import metrics
+
+# pdfplumber (with pdfminer and Pillow) is imported only once a PDF is opened, and
+# page_layout, page_map and page_hash only once a page is read, so commands that
+# never read a PDF start without them
+
+
+# ----------------------------------------------------------
+# Parallel extraction: each worker opens the PDF itself
+# ----------------------------------------------------------
+def _extract_page_slice(pdf_path: Path, page_indexes: list, layout: bool = False) -> list:
+    import pdfplumber
+    from src.utils.page_layout import extract_page
+
+    with pdfplumber.open(pdf_path) as pdf:
+        return [(i, extract_page(pdf.pages[i], layout)) for i in page_indexes]
+
+
+def extract_pages_parallel(pdf_path: Path, page_indexes, workers: int, layout: bool = False) -> list:
+    """Extract pages across a process pool and return (index, text) pairs in page order."""
+    page_indexes = sorted(page_indexes)
+    if not page_indexes:
+        return []
+    workers = max(1, min(workers, len(page_indexes)))
+    if workers == 1:
+        return _extract_page_slice(pdf_path, page_indexes, layout)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Interleave pages so every worker gets a similar mix of light and heavy pages
+    slices = [page_indexes[w::workers] for w in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = [pair for chunk in pool.map(_extract_page_slice, [pdf_path] * workers, slices, [layout] * workers)
+                   for pair in chunk]
+    results.sort(key=lambda pair: pair[0])
+    return results
+
+
+# ----------------------------------------------------------
+# Shared page-text provider
+# ----------------------------------------------------------
+class PageTextProvider:
+    """Open a PDF once and serve each page's text, extracting every page at most once.
+
+    With a PageTextCache attached, pages are read from disk first and the PDF is
+    only opened for pages the cache does not hold yet. With workers > 1, prefetch()
+    spreads the missing pages over a process pool. With layout=True pages are read
+    through page_layout.layout_text (the calendar grid only, day rows pre-split);
+    the cache must then have been opened with layout_cache_kwargs(). After
+    carry_over(), a page missing from the cache is first looked up by content hash
+    in the cache of a previous edition and only extracted when that edition had no
+    identical page.
+    """
+
+    def __init__(self, pdf_path: Path, cache=None, workers: int = 1, layout: bool = False):
+        self.pdf_path = Path(pdf_path)
+        self.cache = cache
+        self.workers = workers
+        self.layout = layout
+        self._stack = None
+        self._pdf = None
+        self._texts = {}
+        self._page_count = None
+        self._page_map = None
+        self._page_hashes = None
+        self._previous = None
+        # Build stages may read pages from several threads at once
+        self._lock = threading.RLock()
+        self.requests = 0
+        self.extractions = 0
+        self.carried_over = 0
+        self.extract_seconds = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _open(self):
+        if self._pdf is None:
+            import pdfplumber
+
+            self._stack = ExitStack()
+            self._pdf = self._stack.enter_context(pdfplumber.open(self.pdf_path))
+        return self._pdf
+
+    def close(self):
+        if self._stack is not None:
+            self._stack.close()
+        self._stack = None
+        self._pdf = None
+
+    def __len__(self):
+        with self._lock:
+            return self._len()
+
+    def _len(self):
+        if self._page_count is None:
+            count = self.cache.page_count() if self.cache else None
+            if count is None:
+                count = len(self._open().pages)
+                if self.cache:
+                    self.cache.set_page_count(count)
+            self._page_count = count
+        return self._page_count
+
+    def text(self, page_index: int) -> str:
+        """Return the extracted text of a 0-based page index."""
+        with self._lock:
+            return self._text(page_index)
+
+    def _text(self, page_index: int) -> str:
+        self.requests += 1
+        if page_index in self._texts:
+            return self._texts[page_index]
+
+        if self.cache:
+            with metrics.phase("page_cache"):
+                text = self.cache.get(page_index)
+            if text is not None:
+                self._texts[page_index] = text
+                return text
+
+        text = self._carried_over(page_index)
+        if text is not None:
+            self._texts[page_index] = text
+            return text
+
+        from src.utils.page_layout import extract_page
+
+        with metrics.phase("extract"):
+            page = self._open().pages[page_index]
+            start = time.perf_counter()
+            text = extract_page(page, self.layout)
+            self.extract_seconds += time.perf_counter() - start
+        self.extractions += 1
+        metrics.count("pages_extracted")
+
+        if self.cache:
+            self.cache.put(page_index, text)
+        self._texts[page_index] = text
+        return text
+
+    def prefetch(self, page_indexes):
+        """Extract every listed page not held in memory or on disk, in parallel when workers > 1."""
+        if self.workers <= 1:
+            return
+        with self._lock:
+            self._prefetch(page_indexes)
+
+    def _prefetch(self, page_indexes):
+        missing = []
+        for i in page_indexes:
+            if i in self._texts:
+                continue
+            text = self.cache.get(i) if self.cache else None
+            if text is None:
+                text = self._carried_over(i)
+            if text is None:
+                missing.append(i)
+            else:
+                self._texts[i] = text
+        if not missing:
+            return
+
+        start = time.perf_counter()
+        with metrics.phase("extract"):
+            results = extract_pages_parallel(self.pdf_path, missing, self.workers, self.layout)
+        self.extract_seconds += time.perf_counter() - start
+        self.extractions += len(results)
+        metrics.count("pages_extracted", len(results))
+        for i, text in results:
+            if self.cache:
+                self.cache.put(i, text)
+            self._texts[i] = text
+
+    def page_map(self):
+        """Where the day grid and feast list are, read once from each page's header strip
+        (or from the cache) and shared by every extractor."""
+        with self._lock:
+            if self._page_map is None:
+                self._page_map = self._discover_page_map()
+            return self._page_map
+
+    def _discover_page_map(self):
+        from src.utils.page_map import PageMap, read_header_strips
+
+        page_map = PageMap.from_dict(self.cache.page_map()) if self.cache else None
+        if page_map is not None:
+            return page_map
+        with metrics.phase("page_map"):
+            page_map = PageMap.discover(read_header_strips(self._open()))
+        metrics.count("pages_probed", len(page_map))
+        if self.cache:
+            self.cache.set_page_map(page_map.to_dict())
+        return page_map
+
+    def page_hashes(self) -> list:
+        """Content hash of every page (page_hash.page_content_hash), read once or from the cache."""
+        with self._lock:
+            if self._page_hashes is None:
+                self._page_hashes = self._read_page_hashes()
+            return self._page_hashes
+
+    def _read_page_hashes(self) -> list:
+        from src.utils.page_hash import PAGE_HASH_FORMAT, page_content_hash
+
+        saved = self.cache.page_hashes() if self.cache else None
+        if saved and saved.get("format") == PAGE_HASH_FORMAT:
+            return saved["hashes"]
+        with metrics.phase("page_hash"):
+            hashes = [page_content_hash(page) for page in self._open().pages]
+        if self.cache:
+            self.cache.set_page_hashes({"format": PAGE_HASH_FORMAT, "hashes": hashes})
+        return hashes
+
+    def carry_over(self, previous_cache, previous_hashes):
+        """Serve pages whose content hash matches a page of a previous edition from that
+        edition's cache (a PageTextCache opened with the same settings)."""
+        with self._lock:
+            self._previous = (previous_cache, {h: i for i, h in enumerate(previous_hashes)})
+
+    def _carried_over(self, page_index: int):
+        if self._previous is None:
+            return None
+        previous_cache, previous_pages = self._previous
+        previous_index = previous_pages.get(self.page_hashes()[page_index])
+        if previous_index is None:
+            return None
+        with metrics.phase("page_cache"):
+            text = previous_cache.get(previous_index)
+        if text is None:
+            return None
+        self.carried_over += 1
+        metrics.count("pages_carried_over")
+        if self.cache:
+            self.cache.put(page_index, text)
+        return text
+
+    def lines(self, page_index: int) -> list:
+        """Return the stripped, non-empty lines of a page."""
+        text = self.text(page_index)
+        if not text:
+            return []
+        return [line.strip() for line in text.splitlines() if line.strip()]
+
+    def stats(self) -> dict:
+        hits = self.requests - self.extractions
+        mean = self.extract_seconds / self.extractions if self.extractions else 0.0
+        stats = {
+            "requests": self.requests,
+            "extractions": self.extractions,
+            "hits": hits,
+            "carried_over": self.carried_over,
+            "extract_seconds": round(self.extract_seconds, 3),
+            "saved_seconds": round(hits * mean, 3),
+        }
+        if self.cache:
+            stats.update(self.cache.stats())
+        return stats
+
+
+class TextPages:
+    """The provider interface over page strings already in memory (fixtures, synthetic corpora)."""
+
+    def __init__(self, texts):
+        self.texts = list(texts)
+        self.cache = None
+        self.requests = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def close(self):
+        pass
+
+    def __len__(self):
+        return len(self.texts)
+
+    def text(self, page_index: int) -> str:
+        self.requests += 1
+        return self.texts[page_index]
+
+    def prefetch(self, page_indexes):
+        pass
+
+    def page_map(self):
+        from src.utils.page_map import PageMap, heads_from_texts
+
+        return PageMap.discover(heads_from_texts(self.texts))
+
+    def page_hashes(self) -> list:
+        from src.utils.page_hash import text_page_hash
+
+        return [text_page_hash(text) for text in self.texts]
+
+    def lines(self, page_index: int) -> list:
+        return [line.strip() for line in (self.text(page_index) or "").splitlines() if line.strip()]
+
+    def stats(self) -> dict:
+        return {"requests": self.requests, "extractions": 0, "hits": self.requests, "carried_over": 0,
+                "extract_seconds": 0.0, "saved_seconds": 0.0}
+
+
+def open_pages(pdf_path: Path, pages: PageTextProvider = None):
+    """Reuse a shared provider when given, otherwise open a private one for this call."""
+    if pages is not None:
+        return nullcontext(pages)
+    return PageTextProvider(pdf_path)
@@ -1,5 +1,6 @@
 import re
 from datetime import datetime
+from src.utils.citation_parser import parse_citation_line
 
 # ----------------------------
 # Basic Helpers
@@ -29,8 +30,14 @@ def extract_color(text: str) -> str:
 # ----------------------------
 def extract_bible_citation(text: str) -> str:
     """Extract short Bible citation from a line"""
-    pattern = r"\b(?:[1-3]?\s?[A-Za-z]+)\s\d{1,3}:\d{1,3}(?:–\d{1,3})?(?:;\s?[1-3]?\s?[A-Za-z]+\s\d{1,3}:\d{1,3}(?:–\d{1,3})?)*"
-    match = re.search(pattern, text)
-    if match:
-        return match.group(0)
-    return ""
+    citations = parse_citation_line(text)
+    if not citations:
+        return ""
+    # The first reading, printed the way the calendar does: "Zep 2:3; 3:12-13"
+    parts = []
+    for c in citations:
+        if c.reading != citations[0].reading or c.alternate:
+            continue
+        text = str(c)
+        parts.append(text[len(c.label) + 1:] if parts else text)
+    return "; ".join(parts)
@@ -0,0 +1,247 @@
+import random
+import argparse
+from pathlib import Path
+
+from src.proper_of_time import compute_years
+from src.utils.citation_parser import BOOKS, ONE_CHAPTER_BOOKS
+from src.utils.day_parser import MONTHS
+
+# ----------------------------------------------------------
+# Page text in the USCCB layout, for any years and sizes
+# ----------------------------------------------------------
+# Each page is what pdfplumber returns for a calendar page: an optional "MONTH YYYY"
+# header, then per day "N Ddd Feast color", an optional rank line, an optional
+# "[Optional Memorial]" line and one or more citation lines, and at the bottom
+# optional footnotes under a separator and the page number. Pages are joined with
+# form feeds on disk, as pdftotext does.
+
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "SUN"]
+PSALTER_WEEKS = ["I", "II", "III", "IV"]
+READING_BOOKS = sorted(set(BOOKS) - {"Ps"})
+MEMORIALS = [
+    "Saint Hilary, Bishop and Doctor of the Church", "Saint Agnes, Virgin and Martyr",
+    "Saint Anthony, Abbot", "Saint Blaise, Bishop and Martyr", "Saint Turibius of Mogrovejo, Bishop",
+    "Saint Stanislaus, Bishop and Martyr", "Saint Bede the Venerable, Priest and Doctor of the Church",
+    "Saint Anthony of Padua, Priest and Doctor of the Church", "Saint Bruno, Priest",
+    "Saint Martin de Porres, Religious", "Saint Lucy, Virgin and Martyr", "Blessed Virgin Mary",
+]
+FOOTNOTES = [
+    "The following readings may be used on any day this week, especially in Years B and C",
+    "When the Ascension of the Lord is celebrated on the following Sunday, the Second Reading",
+    "If necessary, the Chrism Mass may be celebrated on a suitable day before Holy Thursday.",
+    "Optional Memorials are indicated by the use of italics within brackets.",
+]
+RUNNING_HEADER = "Liturgical Calendar for the Dioceses of the United States of America {year}"
+PAGE_BREAK = "\f"
+
+
+def _verses(rng: random.Random) -> str:
+    first = rng.randint(1, 30)
+    text = f"{first}-{first + rng.randint(2, 12)}"
+    if rng.random() < 0.3:
+        text += f", {first + rng.randint(14, 20)}{rng.choice(['', 'a', 'b'])}"
+    return text
+
+
+def _reading(rng: random.Random) -> str:
+    book = rng.choice(READING_BOOKS)
+    if book in ONE_CHAPTER_BOOKS:
+        return f"{book} {_verses(rng)}"
+    chapter = rng.randint(1, 28)
+    text = f"{book} {chapter}:{_verses(rng)}"
+    roll = rng.random()
+    if roll < 0.08:
+        # Crosses into the next chapter, printed with an em dash
+        text = f"{book} {chapter}:{rng.randint(20, 30)}—{chapter + 1}:{rng.randint(2, 9)}"
+    elif roll < 0.16:
+        text += f"; {chapter + 1}:{_verses(rng)}"
+    elif roll < 0.26:
+        text += f" or {chapter}:{_verses(rng)}"
+    return text
+
+
+def citation_lines(rng: random.Random, record, lectionary: int, psalter: str) -> list:
+    """Citation lines of one day: two readings on weekdays, three on Sundays and solemnities."""
+    sunday = record.date.weekday() == 6
+    count = 3 if sunday or record.feast_rank == "Solemnity" else 2
+    masses = ["Vigil", "Day"] if record.feast_rank == "Solemnity" and rng.random() < 0.3 else [None]
+    lines = []
+    for i, mass in enumerate(masses):
+        readings = "/".join(_reading(rng) for _ in range(count))
+        number = f"{lectionary + i}{rng.choice(['A', 'B']) if rng.random() < 0.05 else ''}"
+        line = f"{mass}: {readings} ({number})" if mass else f"{readings} ({number})"
+        lines.append(line)
+    if psalter:
+        lines[-1] += f" Pss {psalter}"
+    return lines
+
+
+class SyntheticCalendar:
+    """Generated page texts plus what a parser should recover from them.
+
+    days[year] holds the DayRecords the text was written from, with feast_rank and
+    liturgical_color as printed; citations[year] maps ISO dates to the citation
+    lines of that day as written, before noise and mojibake.
+    """
+
+    def __init__(self):
+        self.pages = []
+        self.days = {}
+        self.citations = {}
+        self.first_page = {}
+
+    def year_pages(self, year: int) -> list:
+        """The pages of one year, so a many-year corpus can be parsed year by year."""
+        starts = sorted(self.first_page.values()) + [len(self.pages)]
+        first = self.first_page[year]
+        return self.pages[first:next(s for s in starts if s > first)]
+
+    def write(self, path: Path):
+        Path(path).write_text(PAGE_BREAK.join(self.pages), encoding="utf-8")
+
+
+def read_pages(path: Path) -> list:
+    """Page texts of a corpus written by SyntheticCalendar.write (or pdftotext)."""
+    return Path(path).read_text(encoding="utf-8").split(PAGE_BREAK)
+
+
+# ----------------------------------------------------------
+# Noise and mojibake
+# ----------------------------------------------------------
+def mojibake(line: str) -> str:
+    """The line as UTF-8 bytes misread as cp1252: "—" becomes "â€”", a no-break space "Â "."""
+    return line.encode("utf-8").decode("cp1252", errors="ignore")
+
+
+def _noisy(rng: random.Random, lines: list, noise: float) -> list:
+    noisy = []
+    for line in lines:
+        if rng.random() < noise:
+            line = " " * rng.randint(1, 3) + line + " " * rng.randint(0, 3)
+        if rng.random() < noise:
+            noisy.append("")
+        if rng.random() < noise and "/" in line and not line[:1].isdigit():
+            # A long citation line wrapped after a reading
+            head, _, tail = line.partition("/")
+            noisy += [head + "/", tail]
+            continue
+        noisy.append(line)
+    return noisy
+
+
+# ----------------------------------------------------------
+# Generator
+# ----------------------------------------------------------
+def generate(years, seed: int = 0, days_per_page: int = 16, noise: float = 0.0, mojibake_rate: float = 0.0,
+             footnotes: float = 0.1, memorials: float = 0.2, lead_pages: int = 0) -> SyntheticCalendar:
+    """Page text for every day of `years`, built from the rule-based calendar.
+
+    noise is the chance per line of stray spaces, blank lines or a wrapped citation,
+    and per page of a running header; mojibake_rate the chance per line of being
+    mangled by a cp1252 round trip; footnotes the chance per page of a footnote
+    block. lead_pages blank front-matter pages come first, like the PDF's title
+    and introduction pages. The same arguments always give the same text.
+    """
+    rng = random.Random(seed)
+    corpus = SyntheticCalendar()
+    corpus.pages += [f"Front matter page {i + 1}\n{i + 1}" for i in range(lead_pages)]
+    footnote_number = 0
+
+    for year, records in compute_years(list(years)).items():
+        corpus.first_page[year] = len(corpus.pages)
+        corpus.days[year] = []
+        corpus.citations[year] = {}
+        page = []
+        days_on_page = 0
+        lectionary = 1
+        # December 31 must end its year's last page: the next year starts a fresh one
+        for index, record in enumerate(records):
+            d = record.date
+            if d.day == 1:
+                page.append(f"{MONTHS[d.month - 1].upper()} {year}")
+
+            color = record.liturgical_color.lower()
+            lines = []
+            name = record.feast_primary_name
+            weekday = WEEKDAYS[d.weekday()]
+            memorial = None
+            if "Weekday" in name and rng.random() < memorials:
+                memorial = rng.choice(MEMORIALS)
+                color = f"{color}/{'red' if 'Martyr' in memorial else 'white'}"
+            lines.append(f"{d.day} {weekday} {name} {color}")
+            rank = record.feast_rank
+            if rank:
+                if rank == "Solemnity" and record.is_holy_day_of_obligation:
+                    rank = "Solemnity [Holyday of Obligation]"
+                lines.append(rank)
+            if memorial:
+                lines.append(f"[{memorial}]")
+
+            psalter = None
+            if record.feast_rank in ("Solemnity", "Feast"):
+                psalter = "Prop"
+            elif d.weekday() == 6:
+                psalter = PSALTER_WEEKS[(d.toordinal() // 7) % 4]
+            cites = citation_lines(rng, record, lectionary, psalter)
+            lectionary += len(cites)
+            lines += cites
+
+            corpus.days[year].append(record.copy(feast_rank=rank, liturgical_color=color.capitalize()))
+            corpus.citations[year][d.isoformat()] = cites
+            page += lines
+            days_on_page += 1
+
+            if days_on_page >= days_per_page or index == len(records) - 1:
+                corpus.pages.append(_finish_page(rng, page, len(corpus.pages), year, noise, mojibake_rate,
+                                                 footnotes, footnote_number))
+                footnote_number += 1
+                page = []
+                days_on_page = 0
+    return corpus
+
+
+def _finish_page(rng, lines, page_index, year, noise, mojibake_rate, footnotes, footnote_number) -> str:
+    lines = list(lines)
+    if rng.random() < footnotes:
+        # Footnotes run to the bottom of the page, under a rule
+        lines += ["_____", f"{footnote_number % 40 + 1} {rng.choice(FOOTNOTES)}"]
+    if noise and rng.random() < noise:
+        lines.insert(0, RUNNING_HEADER.format(year=year))
+    lines = _noisy(rng, lines, noise) if noise else lines
+    if mojibake_rate:
+        lines = [mojibake(line) if rng.random() < mojibake_rate else line for line in lines]
+    lines.append(str(page_index + 1))
+    return "\n".join(lines)
+
+
+# ----------------------------------------------------------
+# CLI Entry
+# ----------------------------------------------------------
+def parse_years(text: str) -> list:
+    first, _, last = text.partition("-")
+    return list(range(int(first), int(last or first) + 1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate USCCB-style calendar page text for stress tests")
+    parser.add_argument("years", type=parse_years, help="A year or a range such as 2026-2125")
+    parser.add_argument("--out", required=True, help="Text file; pages are separated by form feeds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--days-per-page", type=int, default=16, help="Day entries per page (large = huge pages)")
+    parser.add_argument("--noise", type=float, default=0.0, help="Chance per line of stray spaces, blanks or wraps")
+    parser.add_argument("--mojibake", type=float, default=0.0, help="Chance per line of a cp1252 round trip")
+    parser.add_argument("--footnotes", type=float, default=0.1, help="Chance per page of a footnote block")
+    parser.add_argument("--lead-pages", type=int, default=0, help="Front-matter pages before the calendar")
+    args = parser.parse_args()
+
+    corpus = generate(args.years, seed=args.seed, days_per_page=args.days_per_page, noise=args.noise,
+                      mojibake_rate=args.mojibake, footnotes=args.footnotes, lead_pages=args.lead_pages)
+    corpus.write(args.out)
+    days = sum(len(d) for d in corpus.days.values())
+    size = Path(args.out).stat().st_size
+    print(f"✅ {len(corpus.days)} years, {days:,} days on "
+          f"{len(corpus.pages):,} pages ({size / 1e6:.1f} MB) → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import re
+from collections import namedtuple
+
+# ----------------------------------------------------------
+# Token kinds shared by the day-data and citation extractors
+# ----------------------------------------------------------
+DAY = "DAY"
+RANK = "RANK"
+MONTH_HEADER = "MONTH_HEADER"
+SEPARATOR = "SEPARATOR"
+FOOTNOTE = "FOOTNOTE"
+CITATION = "CITATION"
+OTHER = "OTHER"
+
+Token = namedtuple("Token", ["kind", "groups"])
+
+MONTH_NAMES = "January|February|March|April|May|June|July|August|September|October|November|December"
+COLOR_NAMES = "white|red|green|violet|black|rose|gold"
+
+# "30 Mon Monday of Holy Week violet" → day, optional weekday word, feast, color(s)
+DAY_ENTRY_PATTERN = re.compile(
+    rf"^(\d{{1,2}})\s+(?:(\w+)\s+)?(.+?)\s+((?:{COLOR_NAMES})(?:\s*(?:/|or)\s*(?:{COLOR_NAMES}))*)$",
+    re.IGNORECASE,
+)
+# Citation tables only need "N Ddd" at the start of the line
+DAY_WEEKDAY_PATTERN = re.compile(r"^(\d{1,2})\s+(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\b", re.IGNORECASE)
+MONTH_HEADER_PATTERN = re.compile(rf"^({MONTH_NAMES})\s+(\d{{4}})$", re.IGNORECASE)
+SEPARATOR_PATTERN = re.compile(r"^(?:[-=_]{3,}|[-–—]+)$")
+# "7 The following readings may be used..." / "4 Optional Memorials are..." / "Notes:"
+FOOTNOTE_PATTERN = re.compile(r"^\d{1,2}\s+[A-Z][a-z]+\s+(?:[a-z]|[A-Z][a-z]+\s+[a-z])")
+NOTES_PATTERN = re.compile(r"^(Notes?|Footnotes?)[:\s]*$", re.IGNORECASE)
+# "Is 2:1-5/Rom 13:11-14/..." / anything with a lectionary number "(204)" / "1 Jn 2:18-21/"
+CITATION_PATTERN = re.compile(r"^[A-Z][a-zA-Z0-9\s,:;—\-/]+/[A-Z]|\(\d+\)|[A-Z][a-z]+\s\d+:\d+[-–]\d+/")
+LECTIONARY_PATTERN = re.compile(r"\((\d+)\)")
+RANK_PATTERN = re.compile(r"(Feast|Memorial|Solemnity|Optional Memorial)", re.IGNORECASE)
+
+WEEKDAYS = {"mon", "tue", "wed", "thu", "fri", "sat", "sun"}
+COLORS = set(COLOR_NAMES.split("|"))
+COLOR_FIELD_PATTERN = re.compile(rf"(?:{COLOR_NAMES})(?:\s*(?:/|or)\s*(?:{COLOR_NAMES}))*", re.IGNORECASE)
+
+_OTHER = Token(OTHER, ())
+_SEPARATOR = Token(SEPARATOR, ())
+
+
+def classify_line(line: str) -> Token:
+    """Classify one stripped line into a Token, trying only the patterns its first character allows.
+
+    DAY groups are (day, weekday, feast, color); weekday is None when the line has no
+    "Mon".."Sun" abbreviation, and feast/color are None when it does not end in a color.
+    CITATION groups hold the first lectionary number, if any.
+    """
+    if not line:
+        return _OTHER
+    if "\t" in line:
+        return _classify_fields(line)
+    first = line[0]
+
+    if first.isdigit():
+        entry = DAY_ENTRY_PATTERN.match(line)
+        weekday = DAY_WEEKDAY_PATTERN.match(line)
+        if entry or weekday:
+            day = int((entry or weekday).group(1))
+            return Token(DAY, (
+                day,
+                weekday.group(2) if weekday else None,
+                entry.group(3) if entry else None,
+                entry.group(4) if entry else None,
+            ))
+        if FOOTNOTE_PATTERN.match(line):
+            return Token(FOOTNOTE, (line.split(None, 1)[0],))
+    elif first in "-=_–—":
+        if SEPARATOR_PATTERN.match(line):
+            return _SEPARATOR
+    else:
+        month = MONTH_HEADER_PATTERN.match(line)
+        if month:
+            return Token(MONTH_HEADER, (month.group(1).capitalize(), int(month.group(2))))
+        if first in "NnFf" and NOTES_PATTERN.match(line):
+            return Token(FOOTNOTE, (line.rstrip(": "),))
+
+    if CITATION_PATTERN.search(line):
+        lectionary = LECTIONARY_PATTERN.search(line)
+        return Token(CITATION, (lectionary.group(1) if lectionary else None,))
+    rank = RANK_PATTERN.search(line)
+    if rank:
+        return Token(RANK, (rank.group(1),))
+    return _OTHER
+
+
+def _classify_fields(line: str) -> Token:
+    """Day rows from layout extraction arrive as day<TAB>weekday<TAB>feast<TAB>color.
+
+    Rows of the expected shape become DAY tokens without a regex; anything else, or
+    a feast ending in a color word the text pattern would fold into the color, is
+    classified as the plain line so both extraction modes agree.
+    """
+    fields = line.split("\t")
+    day, weekday = fields[0], fields[1]
+    if day.isdigit() and len(day) <= 2 and weekday.lower() in WEEKDAYS and len(fields) <= 4:
+        if len(fields) == 2:
+            return Token(DAY, (int(day), weekday, None, None))
+        if len(fields) == 4 and COLOR_FIELD_PATTERN.fullmatch(fields[3]):
+            feast = fields[2]
+            last = feast.rsplit(None, 1)[-1].lower() if feast.strip() else ""
+            if last and last not in COLORS and last != "or" and not last.endswith("/"):
+                return Token(DAY, (int(day), weekday, feast, fields[3]))
+    return classify_line(" ".join(fields))
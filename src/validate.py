@@ -1,81 +1,683 @@
 # src/validate.py
+import os
+import re
 import csv
+import json
+import time
+import argparse
 from pathlib import Path
-from datetime import datetime
+from datetime import date
+from itertools import islice
+from collections import Counter, namedtuple
+from functools import lru_cache
 from .schema import SCHEMAS
 
 QC_REPORT = Path("reports/qc_2026.md")
+CHUNK_ROWS = 50_000
+MAX_SAMPLES = 5
+MAX_RANGES = 20
+
+# -------------------- SCHEMA COMPILER -------------------- #
+
+RANGE_SPEC = re.compile(r"^(\d+)\s*[–-]\s*(\d+)$")
+ENUM_SPEC = re.compile(r"^enum\[(.*)\]$")
+WEEKDAY_DATE_SPEC = re.compile(r"^date \((Mon|Tue|Wed|Thu|Fri|Sat|Sun)\)$")
+YEAR_MONTH_PATTERN = re.compile(r"\d{4}-(?:0[1-9]|1[0-2])")
+DUAL_SEPARATOR = re.compile(r"\s*/\s*|\s+or\s+")
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+WEEKDAY_ABBREVIATIONS = [d[:3] for d in WEEKDAYS]
+
+
+def _is_iso_date(value: str) -> bool:
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        return False
+    try:
+        date.fromisoformat(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _weekday_date(weekday: int):
+    def check(value):
+        return _is_iso_date(value) and date.fromisoformat(value).weekday() == weekday
+    return check
+
+
+def _dual_of(allowed: set):
+    # "Dual" admits combinations such as "Green/white" or "Violet or rose"
+    parts = {a.lower() for a in allowed}
+
+    def check(value):
+        items = DUAL_SEPARATOR.split(value.lower())
+        return len(items) > 1 and all(item in parts for item in items)
+    return check
+
+
+def _expand_weekday_range(first: str, last: str) -> set:
+    # "Sun–Sat" means every weekday, written out or abbreviated
+    order = WEEKDAY_ABBREVIATIONS[6:] + WEEKDAY_ABBREVIATIONS[:6]
+    names = order[order.index(first):order.index(last) + 1]
+    return set(names) | {WEEKDAYS[WEEKDAY_ABBREVIATIONS.index(n)] for n in names}
+
+
+class FieldCheck:
+    """A field spec compiled once.
+
+    Enum-like specs become a set of allowed strings, everything else a predicate;
+    when both are set the predicate only sees values outside the set. Columns are
+    checked on their distinct values, so a repeated value costs one set insertion
+    instead of one Python call.
+    """
+
+    __slots__ = ("spec", "allowed", "predicate", "allow_blank")
+
+    def __init__(self, spec, allowed=None, predicate=None, allow_blank=False):
+        self.spec = spec
+        self.allowed = frozenset(allowed) if allowed is not None else None
+        self.predicate = predicate
+        self.allow_blank = allow_blank
+
+    def __call__(self, value) -> bool:
+        if self.allowed is not None and value in self.allowed:
+            return True
+        return self.predicate is not None and bool(self.predicate(value))
+
+    def invalid_values(self, values) -> set:
+        """Distinct non-empty values of a column that fail the check."""
+        distinct = set(values)
+        distinct.discard("")
+        if self.allowed is not None:
+            distinct -= self.allowed
+        predicate = self.predicate
+        if predicate is None:
+            return distinct
+        return {v for v in distinct if not predicate(v)}
+
+
+@lru_cache(maxsize=None)
+def compile_field(spec: str) -> FieldCheck:
+    """Turn a SCHEMAS type string into a FieldCheck; unknown specs are an error."""
+    if spec == "string" or spec.startswith("string ("):
+        return FieldCheck(spec, predicate=lambda v: v.strip() != "")
+    if spec == "int":
+        return FieldCheck(spec, predicate=str.isdigit)
+    if spec == "date":
+        return FieldCheck(spec, predicate=_is_iso_date)
+    if spec == "YYYY-MM":
+        return FieldCheck(spec, predicate=lambda v: YEAR_MONTH_PATTERN.fullmatch(v) is not None)
+
+    match = WEEKDAY_DATE_SPEC.match(spec)
+    if match:
+        return FieldCheck(spec, predicate=_weekday_date(WEEKDAY_ABBREVIATIONS.index(match.group(1))))
+
+    match = RANGE_SPEC.match(spec)
+    if match:
+        low, high = int(match.group(1)), int(match.group(2))
+        return FieldCheck(spec, allowed={str(n) for n in range(low, high + 1)})
+
+    match = ENUM_SPEC.match(spec)
+    if match or "|" in spec:
+        allowed = set()
+        allow_blank = False
+        dual = False
+        for item in (match.group(1) if match else spec).split("|"):
+            item = item.strip()
+            weekdays = re.match(r"^(\w{3})\s*[–-]\s*(\w{3})$", item)
+            if item == "blank":
+                allow_blank = True
+            elif item == "Dual":
+                dual = True
+            elif weekdays and weekdays.group(1) in WEEKDAY_ABBREVIATIONS:
+                allowed |= _expand_weekday_range(weekdays.group(1), weekdays.group(2))
+            else:
+                allowed.add(item)
+        predicate = _dual_of(allowed) if dual else None
+        return FieldCheck(spec, allowed=allowed, predicate=predicate, allow_blank=allow_blank)
+
+    raise ValueError(f"Unknown field spec: {spec!r}")
+
 
 def check_type(value, expected_type):
     """Check if a value matches the expected type"""
-    if expected_type == "string":
-        return isinstance(value, str) and value.strip() != ""
-    if expected_type == "int":
-        return value.isdigit()
-    if expected_type == "date":
-        try:
-            datetime.strptime(value, "%Y-%m-%d")
-            return True
-        except Exception:
-            return False
     if isinstance(expected_type, list):  # enum check
         return value in expected_type
-    return True  # fallback
+    return compile_field(expected_type)(value)
+
+
+Issue = namedtuple("Issue", ["rule", "field", "rows", "values"])
+
+
+class CompiledSchema:
+    """Column-at-a-time validator for one SCHEMAS entry."""
+
+    def __init__(self, schema: dict):
+        self.fields = {name: compile_field(spec) for name, spec in schema["fields"].items()}
+        self.specs = dict(schema["fields"])
+        self.required = list(schema.get("required", []))
+        self.primary_key = list(schema.get("primary_key", []))
+        self.row_count = schema.get("row_count")
+
+    def header_issues(self, header) -> list:
+        present = set(header or [])
+        return [Issue("missing_column", req, [], []) for req in self.required if req not in present]
+
+    def chunk_issues(self, header, columns, first_row: int = 2, seen_keys: dict = None, lines=None) -> list:
+        """Value and primary-key issues for consecutive rows starting at CSV line first_row,
+        or for rows on the given CSV lines (a file with blank lines between its rows).
+
+        seen_keys maps each primary key to the line it was first seen on and carries
+        duplicate detection across chunks of the same file; a key's line becomes None
+        once that first occurrence has been reported.
+        """
+        issues = []
+        by_name = dict(zip(header or [], columns))
+        if lines is None:
+            lines = range(first_row, first_row + (len(columns[0]) if columns else 0))
+
+        for name, check in self.fields.items():
+            column = by_name.get(name)
+            if column is None:
+                continue
+            if name in self.required and not check.allow_blank and "" in column:
+                rows = [lines[i] for i, v in enumerate(column) if v == ""]
+                issues.append(Issue("missing_value", name, rows, [""] * len(rows)))
+            bad = check.invalid_values(column)
+            if bad:
+                found = [i for i, v in enumerate(column) if v in bad]
+                issues.append(Issue("invalid_value", name, [lines[i] for i in found], [column[i] for i in found]))
+
+        key_columns = [by_name[k] for k in self.primary_key if k in by_name]
+        if key_columns and len(key_columns) == len(self.primary_key):
+            # A single-column key is kept as the bare value, which halves the memory of seen_keys
+            keys = key_columns[0] if len(key_columns) == 1 else list(zip(*key_columns))
+            issue = self._duplicate_keys(keys, lines, {} if seen_keys is None else seen_keys)
+            if issue:
+                issues.append(issue)
+        return issues
+
+    def _duplicate_keys(self, keys, lines, seen):
+        chunk = dict(zip(keys, lines))
+        if len(chunk) == len(keys) and seen.keys().isdisjoint(chunk):
+            seen.update(chunk)
+            return None  # every key new; the common case never leaves C
+        found = []
+        for row, key in zip(lines, keys):
+            if key not in seen:
+                seen[key] = row
+                continue
+            first = seen[key]
+            if first is not None:
+                found.append((first, key))
+                seen[key] = None
+            found.append((row, key))
+        found.sort()
+        return Issue("duplicate_key", "+".join(self.primary_key), [r for r, _ in found], [k for _, k in found])
+
+    def row_count_issues(self, n_rows: int) -> list:
+        if self.row_count and not (self.row_count["min"] <= n_rows <= self.row_count["max"]):
+            return [Issue("row_count", "", [], [n_rows])]
+        return []
+
+    def validate_columns(self, header, columns, lines=None) -> list:
+        """Issues for a table given as its header and one sequence per column.
+
+        Row numbers are CSV line numbers, so the first data row is 2; pass `lines`
+        (from read_numbered_columns) when blank lines were dropped from the table.
+        """
+        n_rows = len(columns[0]) if columns else 0
+        return (self.header_issues(header) + self.chunk_issues(header, columns, lines=lines)
+                + self.row_count_issues(n_rows))
+
+    def describe(self, issue: Issue) -> list:
+        """One message per offending row, in the wording of the original QC report."""
+        if issue.rule == "missing_column":
+            return [f"Missing required column: {issue.field}"]
+        if issue.rule == "row_count":
+            return [f"Expected {self.row_count['min']}–{self.row_count['max']} rows, found {issue.values[0]}"]
+        if issue.rule == "missing_value":
+            return [f"Row {r}: Missing value for {issue.field}" for r in issue.rows]
+        if issue.rule == "duplicate_key":
+            values = [", ".join(v) if isinstance(v, tuple) else v for v in issue.values]
+            return [f"Row {r}: Duplicate {issue.field} {v}" for r, v in zip(issue.rows, values)]
+        spec = self.specs[issue.field]
+        return [f"Row {r}: Invalid {issue.field}='{v}' (expected {spec})" for r, v in zip(issue.rows, issue.values)]
+
+
+@lru_cache(maxsize=None)
+def _compiled(csv_name: str) -> CompiledSchema:
+    return CompiledSchema(SCHEMAS[csv_name])
+
+
+def compile_schema(schema) -> CompiledSchema:
+    """Compile a SCHEMAS entry (or its file name); named schemas are compiled once."""
+    if isinstance(schema, str):
+        return _compiled(schema)
+    return CompiledSchema(schema)
+
+
+def _to_columns(rows, width):
+    # Short rows are padded so every column has one entry per row
+    if rows and min(map(len, rows)) < width:
+        rows = [row + [""] * (width - len(row)) if len(row) < width else row for row in rows]
+    columns = [list(col) for col in zip(*rows)] if rows else [[] for _ in range(width)]
+    return columns[:width]
+
+
+def _numbered_rows(reader):
+    # (CSV line a row starts on, row) for every row; blank lines are skipped but still counted
+    line = reader.line_num + 1
+    for row in reader:
+        if row:
+            yield line, row
+        line = reader.line_num + 1
+
+
+def read_numbered_columns(file_path):
+    """Header, columns and the CSV line number of every row, transposed in one step."""
+    with open(file_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        numbered = list(_numbered_rows(reader))
+    lines = [line for line, _ in numbered]
+    return header, _to_columns([row for _, row in numbered], len(header or [])), lines
+
+
+def read_columns(file_path):
+    """Header and columns of a CSV, transposed in one step instead of row by row."""
+    header, columns, _ = read_numbered_columns(file_path)
+    return header, columns
+
+
+def iter_column_chunks(file_path, chunk_rows: int = CHUNK_ROWS):
+    """Yield the header, then (CSV line numbers, columns) for every block of chunk_rows rows."""
+    with open(file_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        yield header
+        width = len(header or [])
+        rows = _numbered_rows(reader)
+        while True:
+            block = list(islice(rows, chunk_rows))
+            if not block:
+                return
+            yield [line for line, _ in block], _to_columns([row for _, row in block], width)
+
 
 def validate_csv(file_path, schema):
     """Validate a single CSV file against schema definition"""
+    compiled = compile_schema(schema)
+    header, columns, lines = read_numbered_columns(file_path)
     errors = []
-    with open(file_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        headers = reader.fieldnames
+    for issue in compiled.validate_columns(header, columns, lines):
+        errors.extend(compiled.describe(issue))
+    return errors
 
-        # ✅ Check required fields
-        for req in schema.get("required", []):
-            if req not in headers:
-                errors.append(f"Missing required column: {req}")
 
-        # ✅ Row checks
-        for i, row in enumerate(reader, start=2):  # row 2 = first data row
-            for field, expected in schema["fields"].items():
-                val = row.get(field, "")
+# -------------------- AGGREGATION -------------------- #
 
-                if not val:
-                    # only complain if it's required
-                    if field in schema.get("required", []):
-                        errors.append(f"Row {i}: Missing value for {field}")
-                    continue
+class RuleSummary:
+    """Every occurrence of one (rule, field) in a file, kept to a fixed size.
 
-                if not check_type(val, expected):
-                    errors.append(f"Row {i}: Invalid {field}='{val}' (expected {expected})")
+    Rows are merged into ranges and values into counts; past max_ranges ranges and
+    max_samples distinct values only the totals keep growing.
+    """
 
-    return errors
+    __slots__ = ("rule", "field", "expected", "count", "ranges", "ranges_omitted",
+                 "samples", "other_values", "max_samples", "max_ranges")
+
+    def __init__(self, rule, field, expected="", max_samples=MAX_SAMPLES, max_ranges=MAX_RANGES):
+        self.rule = rule
+        self.field = field
+        self.expected = expected
+        self.count = 0
+        self.ranges = []
+        self.ranges_omitted = 0
+        self.samples = {}
+        self.other_values = 0
+        self.max_samples = max_samples
+        self.max_ranges = max_ranges
+
+    def add(self, rows, values):
+        self.count += len(rows) or 1
+        ranges = self.ranges
+        for row in rows:
+            if ranges and ranges[-1][1] + 1 == row:
+                ranges[-1][1] = row
+            elif len(ranges) < self.max_ranges:
+                ranges.append([row, row])
+            else:
+                self.ranges_omitted += 1
+        samples = self.samples
+        for value in values:
+            value = ", ".join(value) if isinstance(value, tuple) else str(value)
+            if value in samples:
+                samples[value] += 1
+            elif len(samples) < self.max_samples:
+                samples[value] = 1
+            else:
+                self.other_values += 1
+
+    def to_dict(self) -> dict:
+        # Duplicate keys report an earlier first occurrence late, so ranges are re-merged
+        merged = []
+        for low, high in sorted(self.ranges):
+            if merged and low <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], high)
+            else:
+                merged.append([low, high])
+        return {
+            "rule": self.rule,
+            "field": self.field,
+            "expected": self.expected,
+            "count": self.count,
+            "row_ranges": merged,
+            "rows_omitted": self.ranges_omitted,
+            "samples": [{"value": v, "count": n} for v, n in self.samples.items()],
+            "other_values": self.other_values,
+        }
+
+
+def _expected(compiled: CompiledSchema, issue: Issue) -> str:
+    if issue.rule == "invalid_value":
+        return compiled.specs[issue.field]
+    if issue.rule == "row_count":
+        return f"{compiled.row_count['min']}–{compiled.row_count['max']} rows"
+    return ""
+
+
+def validate_file(file_path, dataset: str, chunk_rows: int = CHUNK_ROWS,
+                  max_samples: int = MAX_SAMPLES, max_ranges: int = MAX_RANGES) -> dict:
+    """Stream one CSV through its compiled schema and summarise the issues.
+
+    Memory holds one chunk of rows, the primary keys seen so far and the capped
+    summaries, so it does not grow with the number of errors. Failures to read the
+    file are reported in the result rather than raised.
+    """
+    start = time.perf_counter()
+    compiled = compile_schema(dataset)
+    summaries = {}
+
+    def record(issues):
+        for issue in issues:
+            key = (issue.rule, issue.field)
+            if key not in summaries:
+                summaries[key] = RuleSummary(issue.rule, issue.field, _expected(compiled, issue), max_samples, max_ranges)
+            summaries[key].add(issue.rows, issue.values)
 
+    n_rows = 0
+    error = None
+    try:
+        chunks = iter_column_chunks(file_path, chunk_rows)
+        header = next(chunks)
+        record(compiled.header_issues(header))
+        seen_keys = {}
+        for lines, columns in chunks:
+            record(compiled.chunk_issues(header, columns, seen_keys=seen_keys, lines=lines))
+            n_rows += len(columns[0]) if columns else 0
+        record(compiled.row_count_issues(n_rows))
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        error = f"{type(e).__name__}: {e}"
 
-def main():
-    report_lines = ["# QC Report for 2026 CSVs", ""]
+    issues = [summary.to_dict() for summary in summaries.values()]
+    return {
+        "path": str(file_path),
+        "dataset": dataset,
+        "status": "error" if error else ("failed" if issues else "passed"),
+        "error": error,
+        "rows": n_rows,
+        "issue_count": sum(issue["count"] for issue in issues),
+        "issues": issues,
+        "seconds": round(time.perf_counter() - start, 4),
+    }
 
-    data_dir = Path("data")
-    data_dir.mkdir(exist_ok=True)
 
-    for csv_name, schema in SCHEMAS.items():
-        file_path = data_dir / csv_name
-        if not file_path.exists():
-            report_lines.append(f"❌ {csv_name} not found")
-            continue
+# -------------------- DISCOVERY -------------------- #
 
-        errors = validate_csv(file_path, schema)
-        if errors:
-            report_lines.append(f"❌ {csv_name} has {len(errors)} issues:")
-            report_lines.extend([f"   - {e}" for e in errors])
+def _name_pattern(file_name: str) -> str:
+    return re.sub(r"\d{4}", "{year}", file_name.lower())
+
+
+_SCHEMA_BY_PATTERN = {_name_pattern(name): name for name in SCHEMAS}
+
+
+def schema_name_for(file_name: str):
+    """The SCHEMAS entry for a CSV name of any year or case, e.g. day_data.csv -> DAY_DATA.csv."""
+    return _SCHEMA_BY_PATTERN.get(_name_pattern(file_name))
+
+
+def discover(roots) -> dict:
+    """CSV files under roots (files, data dirs or trees of year dirs) grouped by outcome.
+
+    Hidden directories such as .build and .cache are not searched. A directory that
+    holds any known dataset is expected to hold all of them.
+    """
+    tasks, skipped, by_dir = [], [], {}
+    for root in map(Path, roots):
+        if root.is_file():
+            paths = [root]
+        elif root.is_dir():
+            paths = sorted(p for p in root.rglob("*.csv") if not any(part.startswith(".") for part in p.relative_to(root).parts))
         else:
-            report_lines.append(f"✅ {csv_name} passed validation")
+            paths = []
+            by_dir.setdefault(root, set())
+        for path in paths:
+            dataset = schema_name_for(path.name)
+            if dataset is None:
+                skipped.append(str(path))
+                continue
+            tasks.append((path, dataset))
+            by_dir.setdefault(path.parent, set()).add(dataset)
+
+    missing = [str(directory / name) for directory, found in by_dir.items() for name in SCHEMAS if name not in found]
+    return {"tasks": tasks, "missing": missing, "skipped": skipped}
+
+
+# -------------------- IN-MEMORY RECORDS -------------------- #
+
+class RecordValidationError(ValueError):
+    """Rows of a dataset broke its schema before they were written."""
+
+    def __init__(self, dataset: str, issues: list, messages: list):
+        self.dataset = dataset
+        self.issues = issues
+        self.messages = messages
+        shown = "; ".join(messages[:MAX_SAMPLES])
+        more = f" (+{len(messages) - MAX_SAMPLES} more)" if len(messages) > MAX_SAMPLES else ""
+        super().__init__(f"{dataset} failed validation with {len(messages)} issues: {shown}{more}")
+
+
+def records_to_columns(records, header) -> list:
+    """Columns of the strings csv.writer would write for DayRecords, dicts or plain rows."""
+    rows = []
+    for record in records:
+        if hasattr(record, "to_row"):
+            record = record.to_row()
+        elif isinstance(record, dict):
+            record = [record.get(name) for name in header]
+        rows.append(["" if value is None else str(value) for value in record])
+    return _to_columns(rows, len(header))
+
+
+def _resolve_dataset(dataset: str) -> str:
+    name = dataset if dataset in SCHEMAS else schema_name_for(Path(dataset).name)
+    if name is None:
+        raise ValueError(f"No schema for dataset {dataset!r}")
+    return name
+
+
+def validate_records(dataset: str, records, header=None) -> list:
+    """Issues for in-memory rows of a dataset, without writing or reading a file.
+
+    dataset is a SCHEMAS name or any file name that maps to one (day_data.csv,
+    weekly_index_2031.csv). Rows follow header, or the schema's field order when
+    header is None; dict rows and DayRecords are matched by field name.
+    """
+    compiled = compile_schema(_resolve_dataset(dataset))
+    header = list(header) if header is not None else list(compiled.specs)
+    return compiled.validate_columns(header, records_to_columns(records, header))
+
+
+def check_records(dataset: str, records, header=None):
+    """Like validate_records, but raises RecordValidationError on the first bad dataset."""
+    issues = validate_records(dataset, records, header)
+    if issues:
+        compiled = compile_schema(_resolve_dataset(dataset))
+        messages = [message for issue in issues for message in compiled.describe(issue)]
+        raise RecordValidationError(dataset, issues, messages)
+
+
+# -------------------- QC RUN -------------------- #
+
+def validate_paths(roots, processes: int = None, chunk_rows: int = CHUNK_ROWS, max_samples: int = MAX_SAMPLES,
+                   max_ranges: int = MAX_RANGES, on_result=None) -> dict:
+    """Validate every dataset under roots on a process pool.
+
+    Each file result is passed to on_result as soon as its worker finishes, so
+    progress streams out while the slower files are still running.
+    """
+    found = discover(roots)
+    # Largest files first so one big file does not start last
+    tasks = sorted(found["tasks"], key=lambda t: -t[0].stat().st_size)
+    processes = max(1, min(processes or os.cpu_count() or 1, len(tasks) or 1))
+
+    start = time.perf_counter()
+    results = []
+    if processes == 1:
+        for path, dataset in tasks:
+            results.append(validate_file(path, dataset, chunk_rows, max_samples, max_ranges))
+            if on_result:
+                on_result(results[-1])
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [pool.submit(validate_file, path, dataset, chunk_rows, max_samples, max_ranges) for path, dataset in tasks]
+            for future in as_completed(futures):
+                results.append(future.result())
+                if on_result:
+                    on_result(results[-1])
+    wall_seconds = time.perf_counter() - start
+
+    results.sort(key=lambda r: r["path"])
+    by_rule = Counter()
+    for result in results:
+        for issue in result["issues"]:
+            by_rule[issue["rule"]] += issue["count"]
+    rows = sum(r["rows"] for r in results)
+    return {
+        "roots": [str(root) for root in roots],
+        "files": results,
+        "missing": found["missing"],
+        "skipped": found["skipped"],
+        "summary": {
+            "processes": processes,
+            "files": len(results),
+            "files_failed": sum(1 for r in results if r["status"] != "passed"),
+            "files_missing": len(found["missing"]),
+            "rows": rows,
+            "issues": sum(by_rule.values()),
+            "issues_by_rule": dict(by_rule),
+            "wall_seconds": round(wall_seconds, 3),
+            "rows_per_second": round(rows / wall_seconds) if wall_seconds else 0,
+        },
+    }
+
+
+# -------------------- REPORTS -------------------- #
+
+def format_rows(issue: dict) -> str:
+    """'2–276, 300' with a note for rows past the range cap."""
+    text = ", ".join(str(low) if low == high else f"{low}–{high}" for low, high in issue["row_ranges"])
+    if issue["rows_omitted"]:
+        text += f" and {issue['rows_omitted']} more"
+    return text
+
+
+def describe_summary(issue: dict) -> str:
+    """One report line for a rule summary, worded like the per-row messages."""
+    rule, field = issue["rule"], issue["field"]
+    if rule == "missing_column":
+        return f"Missing required column: {field}"
+    if rule == "row_count":
+        return f"Expected {issue['expected']}, found {issue['samples'][0]['value']}"
+    if rule == "missing_value":
+        head = f"Missing value for {field}"
+    elif rule == "duplicate_key":
+        head = f"Duplicate {field}"
+    else:
+        head = f"Invalid {field} (expected {issue['expected']})"
+    line = f"{head}: {issue['count']} rows ({format_rows(issue)})"
+    if rule != "missing_value":
+        samples = ", ".join(f"'{s['value']}' ×{s['count']}" for s in issue["samples"])
+        if issue["other_values"]:
+            samples += f", {issue['other_values']} other"
+        line += f"; {samples}"
+    return line
+
+
+def render_markdown(report: dict) -> str:
+    s = report["summary"]
+    lines = [
+        "# QC Report",
+        "",
+        f"Validated {s['files']} files ({s['rows']:,} rows) under {', '.join(report['roots'])} "
+        f"in {s['wall_seconds']:.2f}s on {s['processes']} process{'es' if s['processes'] != 1 else ''}: "
+        f"{s['issues']:,} issues in {s['files_failed']} files, {s['files_missing']} missing.",
+        "",
+    ]
+    for result in report["files"]:
+        if result["status"] == "error":
+            lines.append(f"❌ {result['path']} could not be read: {result['error']}")
+        elif result["issues"]:
+            lines.append(f"❌ {result['path']} has {result['issue_count']} issues:")
+            lines.extend(f"   - {describe_summary(issue)}" for issue in result["issues"])
+        else:
+            lines.append(f"✅ {result['path']} passed validation")
+        lines.append("")
+    for path in report["missing"]:
+        lines.append(f"❌ {path} not found")
+    if report["skipped"]:
+        lines.append(f"ℹ️ {len(report['skipped'])} CSV files without a schema were skipped")
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def write_reports(report: dict, markdown_path: Path, json_path: Path):
+    for path in (markdown_path, json_path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(markdown_path).write_text(render_markdown(report), encoding="utf-8")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+# -------------------- MAIN -------------------- #
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate dataset CSVs against their schemas")
+    parser.add_argument("paths", nargs="*", default=["data"],
+                        help="CSV files, dataset directories or trees of year directories (default: data)")
+    parser.add_argument("--report", default=str(QC_REPORT), help="Markdown report path")
+    parser.add_argument("--json", default=None, help="JSON report path (default: the report path with .json)")
+    parser.add_argument("--processes", type=int, default=None, help="Files validated at the same time (default: CPU count)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="Rows held in memory per file")
+    parser.add_argument("--max-samples", type=int, default=MAX_SAMPLES, help="Distinct values kept per rule")
+    parser.add_argument("--max-ranges", type=int, default=MAX_RANGES, help="Row ranges kept per rule")
+    args = parser.parse_args(argv)
+
+    def progress(result):
+        icon = "✅" if result["status"] == "passed" else "❌"
+        print(f"{icon} {result['path']}: {result['rows']} rows, {result['issue_count']} issues")
 
-        report_lines.append("")
+    report = validate_paths(args.paths, args.processes, args.chunk_rows, args.max_samples, args.max_ranges, progress)
+    markdown_path = Path(args.report)
+    json_path = Path(args.json) if args.json else markdown_path.with_suffix(".json")
+    write_reports(report, markdown_path, json_path)
 
-    QC_REPORT.parent.mkdir(exist_ok=True)
-    QC_REPORT.write_text("\n".join(report_lines), encoding="utf-8")
+    for path in report["missing"]:
+        print(f"❌ {path} not found")
+    print(f"QC report written to {markdown_path} and {json_path}")
 
-    print(f"QC report written to {QC_REPORT}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,85 @@
+import argparse
+import json
+import unittest
+import tempfile
+from pathlib import Path
+from argparse import Namespace
+from unittest.mock import patch
+
+from src.batch import parse_job, parse_year_range, plan_jobs, run_batch, run_job
+from src.proper_of_time import compute_year
+
+
+class TestBatchPlanning(unittest.TestCase):
+    def test_parse_job(self):
+        self.assertEqual(parse_job("2027=pdfs/2027.pdf"), (2027, Path("pdfs/2027.pdf")))
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_job("pdfs/2027.pdf")
+
+    def test_parse_year_range(self):
+        self.assertEqual(list(parse_year_range("2026-2028")), [2026, 2027, 2028])
+        self.assertEqual(list(parse_year_range("2026")), [2026])
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_year_range("2028-2026")
+
+    def test_plan_jobs_directories(self):
+        jobs = plan_jobs([(2027, "b.pdf"), (2026, "a.pdf"), (2026, "reprint.pdf")], Path("out"))
+        self.assertEqual([j["year"] for j in jobs], [2026, 2026, 2027])
+        self.assertEqual([j["out_dir"] for j in jobs], [
+            Path("out/2026-a"), Path("out/2026-reprint"), Path("out/2027"),
+        ])
+
+    def test_plan_jobs_editions_with_the_same_file_name(self):
+        jobs = plan_jobs([(2026, "a/2026.pdf"), (2026, "b/2026.pdf"), (2026, "b/../a/2026.pdf")], Path("out"))
+        dirs = [j["out_dir"] for j in jobs]
+        self.assertEqual(len(dirs), 2)
+        self.assertEqual(len(set(dirs)), 2)
+        self.assertTrue(all(d.name.startswith("2026-2026-") for d in dirs))
+        self.assertEqual(dirs, [j["out_dir"] for j in plan_jobs([(2026, "b/2026.pdf"), (2026, "a/2026.pdf")], Path("out"))])
+
+
+class TestRunBatch(unittest.TestCase):
+    def test_missing_pdf_is_reported_in_index(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out_root = Path(tmp)
+            jobs = plan_jobs([(2031, out_root / "missing.pdf")], out_root)
+            cache_args = Namespace(cache_dir=str(out_root / "cache"), no_cache=True, rebuild_cache=False)
+            index = run_batch(jobs, out_root, cache_args, processes=1)
+
+            self.assertFalse(index["years"][0]["ok"])
+            self.assertEqual(index["throughput"]["years_failed"], 1)
+            saved = json.loads((out_root / "index.json").read_text(encoding="utf-8"))
+            self.assertIn("FileNotFoundError", saved["years"][0]["error"])
+            self.assertIn("2031", (out_root / "index.csv").read_text(encoding="utf-8"))
+
+    def test_computed_year_without_pdf(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out_root = Path(tmp)
+            jobs = plan_jobs([(2031, None)], out_root)
+            cache_args = Namespace(cache_dir=str(out_root / "cache"), no_cache=True, rebuild_cache=False)
+            index = run_batch(jobs, out_root, cache_args, processes=1)
+
+            result = index["years"][0]
+            self.assertTrue(result["ok"])
+            self.assertEqual(result["days"], 365)
+            self.assertNotIn("bible_citations", result["statuses"])
+            self.assertTrue((out_root / "2031" / "weekly_index_2031.csv").exists())
+            self.assertEqual(index["throughput"]["years_computed"], 1)
+
+    def test_cross_check_uses_the_records_just_built(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf = Path(tmp) / "2031.pdf"
+            pdf.write_bytes(b"%PDF-1.4")
+            records = compute_year(2031)
+            summary = {"year": 2031, "values": {"day_data": records[:200]}}
+            # No day_data.csv exists in the output directory: only the in-memory records can be checked
+            with patch("src.batch.build_year", return_value=summary) as build:
+                result = run_job({"year": 2031, "pdf": pdf, "out_dir": Path(tmp) / "2031"}, Namespace(no_cache=True))
+        self.assertEqual(build.call_args.kwargs["keep_values"], ("day_data",))
+        self.assertTrue(result["ok"], result.get("error"))
+        self.assertNotIn("values", result)
+        self.assertEqual((result["cross_check"]["days"], len(result["cross_check"]["missing_dates"])), (200, 165))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+from src.binary_calendar import CalendarFile, write_calendar
+from src.proper_of_time import compute_year
+
+
+class TestBinaryCalendar(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "calendar.litcal"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_of_several_years(self):
+        years = {2027: compute_year(2027), 2028: compute_year(2028)}
+        citations = {date(2027, 5, 6): ["Acts 1 / Eph 1 / Mt 28", "Acts 1 / Jn 15"], date(2028, 1, 1): "Nm 6 / Gal 4 / Lk 2"}
+        write_calendar(self.path, {y: (r, {d: c for d, c in citations.items() if d.year == y}) for y, r in years.items()})
+        with CalendarFile(self.path) as calendar:
+            self.assertEqual(calendar.years, [2027, 2028])
+            self.assertEqual(list(calendar.days(2028)), years[2028])
+            self.assertEqual(calendar.day(date(2027, 12, 25)), years[2027][358])
+            self.assertEqual(calendar.color(date(2027, 12, 25)), "White")
+            self.assertEqual(calendar.citation(date(2027, 5, 6)), "Acts 1 / Eph 1 / Mt 28 | Acts 1 / Jn 15")
+            self.assertEqual(calendar.citation(date(2027, 5, 7)), "")
+
+    def test_dates_outside_the_file(self):
+        records = [r for r in compute_year(2027) if r.date.month != 2]
+        write_calendar(self.path, {2027: (records, {})})
+        with CalendarFile(self.path) as calendar:
+            self.assertIsNone(calendar.day(date(2027, 2, 10)))
+            self.assertNotIn(date(2026, 1, 1), calendar)
+            self.assertIn(date(2027, 3, 1), calendar)
+            self.assertEqual(len(list(calendar.days(2027))), len(records))
+
+    def test_rejects_other_files(self):
+        self.path.write_bytes(b"date,feast\n" * 10)
+        with self.assertRaises(ValueError):
+            CalendarFile(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
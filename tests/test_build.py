@@ -8,8 +8,13 @@ from src.build import (
     next_month_name,
     generate_liturgical_calendar,
     generate_weekly_index,
-    generate_us_holidays
+    generate_us_holidays,
+    build_year,
 )
+from src.metrics import Metrics
+from src.validate import RecordValidationError, check_records
+
+SHIPPED_PDF = Path(__file__).resolve().parents[1] / "USCCB_2026_Feast_Calendar_CLEAN.pdf"
 
 
 class TestHelperFunctions(unittest.TestCase):
@@ -63,5 +68,29 @@ class TestGenerateFunctions(unittest.TestCase):
         self.assertTrue(all("WeekStart" in r for r in rows))
 
 
+class TestValidatedBuild(unittest.TestCase):
+    def test_bad_rows_are_not_written(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "us_holidays_2026.csv"
+            day_data = [["2026-01-01", "Feast A", "", "White", 0, "New Year's Day", 0, 0, 1, 5, 1, 1, 12]]
+            with self.assertRaises(RecordValidationError) as ctx:
+                generate_us_holidays(day_data, out, check=check_records)
+            self.assertFalse(out.exists())
+        self.assertEqual(ctx.exception.dataset, "us_holidays_2026.csv")
+        self.assertEqual(ctx.exception.messages, ["Expected 4–20 rows, found 1"])
+
+    def test_computed_year_passes_validation(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            summary = build_year(2027, None, Path(tmp), jobs=1, validate=True)
+        self.assertEqual(set(summary["statuses"].values()), {"ran"})
+
+    @unittest.skipUnless(SHIPPED_PDF.exists(), "shipped calendar PDF not available")
+    def test_shipped_pdf_passes_validation(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            summary = build_year(2026, SHIPPED_PDF, Path(tmp), jobs=1, validate=True, run_metrics=Metrics(quiet=True))
+        self.assertEqual(set(summary["statuses"].values()), {"ran"})
+        self.assertEqual(summary["days"], 365)
+
+
 if __name__ == "__main__":
     unittest.main()
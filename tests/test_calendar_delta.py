@@ -0,0 +1,110 @@
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from src import metrics
+from src.build import build_year, extract_day_data
+from src.calendar_delta import compare, date_fields, delta_path_for
+from src.model import DayRecord
+from src.utils.day_parser import PageMemo
+from src.utils.page_cache import PageTextCache
+from src.utils.page_hash import PAGE_HASH_FORMAT, changed_pages
+from src.utils.page_text import PageTextProvider, TextPages
+from src.utils.synthetic_calendar import generate
+
+
+class TestDaySplicing(unittest.TestCase):
+    def setUp(self):
+        self.texts = generate([2026], seed=5, noise=0.1, lead_pages=2).pages
+        self.tmp = tempfile.TemporaryDirectory()
+        self.memo_path = Path(self.tmp.name) / "day_pages.pkl"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def parse(self, texts, salt="v1"):
+        memo = PageMemo.load(self.memo_path, salt)
+        run_metrics = metrics.Metrics(quiet=True)
+        with metrics.use(run_metrics):
+            records = extract_day_data(None, 2026, pages=TextPages(texts), memo=memo)
+        memo.save(self.memo_path)
+        return records, run_metrics.counters.get("spliced_pages", 0)
+
+    def test_unchanged_pages_are_spliced_from_the_previous_parse(self):
+        first, spliced = self.parse(self.texts)
+        self.assertEqual(first, extract_day_data(None, 2026, pages=TextPages(self.texts)))
+        self.assertEqual(spliced, 0)
+
+        revised = list(self.texts)
+        page = next(i for i in range(len(revised) // 2, len(revised)) if " green" in revised[i])
+        revised[page] = revised[page].replace(" green", " red", 1)
+        again, spliced = self.parse(revised)
+        self.assertEqual(again, extract_day_data(None, 2026, pages=TextPages(revised)))
+        self.assertNotEqual(again, first)
+        self.assertEqual(changed_pages(TextPages(self.texts).page_hashes(), TextPages(revised).page_hashes()), [page])
+        self.assertEqual(spliced, len(TextPages(revised).page_map().grid_pages(2026)) - 1)
+
+    def test_memo_of_other_parser_code_is_dropped(self):
+        self.parse(self.texts)
+        self.assertTrue(PageMemo.load(self.memo_path, "v1").previous)
+        self.assertEqual(PageMemo.load(self.memo_path, "v2").previous, {})
+
+
+class TestCarryOver(unittest.TestCase):
+    @patch("pdfplumber.open")
+    def test_unchanged_pages_come_from_the_previous_edition(self, mock_pdfplumber):
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf = Path(tmp) / "calendar.pdf"
+            pdf.write_bytes(b"%PDF-1.4 edition one")
+            previous = PageTextCache(pdf, Path(tmp) / "cache")
+            previous.put(0, "JANUARY 2026")
+            previous.put(1, "1 Thu Mary, Mother of God white")
+            pdf.write_bytes(b"%PDF-1.4 edition two")
+            cache = PageTextCache(pdf, Path(tmp) / "cache")
+            cache.set_page_hashes({"format": PAGE_HASH_FORMAT, "hashes": ["b", "a"]})
+            page = MagicMock()
+            page.extract_text.return_value = "1 Thu Mary, Holy Mother of God white"
+            mock_pdfplumber.return_value.__enter__.return_value.pages = [page, MagicMock()]
+
+            with PageTextProvider(pdf, cache=cache) as provider:
+                provider.carry_over(previous, ["a", "c"])
+                self.assertEqual(provider.text(1), "JANUARY 2026")
+                self.assertEqual(provider.text(0), "1 Thu Mary, Holy Mother of God white")
+            self.assertEqual((provider.carried_over, provider.extractions), (1, 1))
+            self.assertEqual(cache.get(1), "JANUARY 2026")
+
+
+class TestDelta(unittest.TestCase):
+    def test_only_changed_fields_are_listed(self):
+        day = DayRecord(date(2026, 3, 8), "THIRD SUNDAY OF LENT", "", "Violet")
+        citations = [{"Date": "2026-03-08", "SourceLine": "Ex 17:3-7/Rom 5:1-2, 5-8/Jn 4:5-42 (28)"}]
+        previous = date_fields([day], citations)
+        current = date_fields([day.copy(liturgical_color="Rose")], citations)
+        self.assertEqual(compare(previous, current), {"2026-03-08": {"color": ["Violet", "Rose"]}})
+        self.assertEqual(compare({}, previous)["2026-03-08"]["citation"], [None, citations[0]["SourceLine"]])
+        self.assertEqual(compare(previous, previous), {})
+
+
+SHIPPED_PDF = Path(__file__).resolve().parents[1] / "USCCB_2026_Feast_Calendar_CLEAN.pdf"
+
+
+@unittest.skipUnless(SHIPPED_PDF.exists(), "shipped calendar PDF not available")
+class TestBuildDelta(unittest.TestCase):
+    def test_first_build_writes_no_delta(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out_dir = Path(tmp)
+            delta_path = delta_path_for(out_dir, 2026)
+            delta_path.write_text("{}", encoding="utf-8")  # left over from another build
+            first = build_year(2026, SHIPPED_PDF, out_dir, jobs=1, run_metrics=metrics.Metrics(quiet=True))
+            self.assertIsNone(first["changed_dates"])
+            self.assertFalse(delta_path.exists())
+            self.assertTrue((out_dir / ".build" / "pages.json").exists())
+            again = build_year(2026, SHIPPED_PDF, out_dir, jobs=1, run_metrics=metrics.Metrics(quiet=True))
+            self.assertEqual(again["changed_dates"], 0)
+            self.assertTrue(delta_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
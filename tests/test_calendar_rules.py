@@ -0,0 +1,42 @@
+import unittest
+from datetime import date
+
+from src.utils.calendar_rules import easter_date, nth_weekday, holy_days_for, us_holidays_for
+
+
+class TestCalendarRules(unittest.TestCase):
+    def test_easter(self):
+        self.assertEqual(easter_date(2026), date(2026, 4, 5))
+        self.assertEqual(easter_date(2027), date(2027, 3, 28))
+        self.assertEqual(easter_date(2038), date(2038, 4, 25))
+
+    def test_thanksgiving(self):
+        self.assertEqual(nth_weekday(2026, 11, 3, 4), date(2026, 11, 26))
+        self.assertEqual(nth_weekday(2027, 11, 3, 4), date(2027, 11, 25))
+
+    def test_2026_tables(self):
+        self.assertEqual(holy_days_for(2026), {
+            "2026-01-01": "Mary, Mother of God",
+            "2026-05-14": "Ascension of the Lord",
+            "2026-11-01": "All Saints",
+            "2026-12-08": "Immaculate Conception",
+            "2026-12-25": "Christmas"
+        })
+        self.assertEqual(us_holidays_for(2026)["2026-11-26"], "Thanksgiving Day")
+
+    def test_us_obligation_rules(self):
+        # Aug 15, 2026 and Jan 1, 2028 are Saturdays; Dec 8, 2030 is a Sunday
+        self.assertNotIn("2026-08-15", holy_days_for(2026))
+        self.assertNotIn("2028-01-01", holy_days_for(2028))
+        self.assertNotIn("2024-01-01", holy_days_for(2024))  # a Monday
+        self.assertIn("2026-11-01", holy_days_for(2026))  # a Sunday keeps its obligation
+        self.assertNotIn("2030-12-08", holy_days_for(2030))
+        self.assertEqual(holy_days_for(2030)["2030-12-09"], "Immaculate Conception")
+
+    def test_other_year(self):
+        self.assertIn("2027-05-06", holy_days_for(2027))
+        self.assertTrue(all(d.startswith("2030-") for d in us_holidays_for(2030)))
+
+
+if __name__ == "__main__":
+    unittest.main()
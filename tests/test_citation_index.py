@@ -0,0 +1,62 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.utils.citation_index import CitationIndex, chapters_in, index_path_for, lectionary_numbers, psalter_week
+
+
+class TestCitationLine(unittest.TestCase):
+    def test_chapters_follow_semicolons_alternatives_and_ranges(self):
+        line = "1 Sm 9:1-4, 17-19; 10:1a/Mk 2:13-17 (310) or 1 Jn 2:29-3:6"
+        self.assertEqual(list(chapters_in(line)), [("1 Sm", 9), ("1 Sm", 10), ("Mk", 2), ("1 Jn", 2), ("1 Jn", 3)])
+
+    def test_lectionary_numbers_and_psalter_week(self):
+        line = "2 Tm 1:1-8 or Ti 1:1-5 (520)/Mk 3:22-30 (317) Pss III"
+        self.assertEqual(lectionary_numbers(line), ["520", "317"])
+        self.assertEqual(psalter_week(line), "III")
+        self.assertIsNone(psalter_week("Nm 6:22-27 (18)"))
+
+
+class TestCitationIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def index_for(self, year):
+        return CitationIndex.from_citations([
+            {"Date": f"{year}-01-02", "SourceLine": "1 Jn 2:22-28/Jn 1:19-28 (205) Pss I"},
+            {"Date": f"{year}-01-03", "SourceLine": "1 Jn 2:29-3:6/Jn 1:29-34 (206)"},
+        ])
+
+    def test_lookups(self):
+        index = self.index_for(2026)
+        self.assertEqual(index.dates_for("1 Jn", 3), ["2026-01-03"])
+        self.assertEqual(index.dates_for("1jn"), ["2026-01-02", "2026-01-03"])
+        self.assertEqual(index.chapters_of("1 Jn"), [2, 3])
+        self.assertEqual(index.dates_for_lectionary(205), ["2026-01-02"])
+        self.assertEqual(index.dates_for_psalter("I"), ["2026-01-02"])
+        self.assertEqual(index.dates_for("Rv", 1), [])
+
+    def test_saved_years_load_as_one_index(self):
+        paths = []
+        for year in (2027, 2026):
+            path = index_path_for(self.dir / f"daily_bible_citations_{year}.csv")
+            self.index_for(year).save(path)
+            paths.append(path)
+        self.assertEqual(paths[0].name, "daily_bible_citations_2027.index.json")
+        index = CitationIndex.load(*paths)
+        self.assertEqual(index.dates_for("Jn", 1), ["2026-01-02", "2026-01-03", "2027-01-02", "2027-01-03"])
+        self.assertEqual(index.dates_for_lectionary("206"), ["2026-01-03", "2027-01-03"])
+
+    def test_rejects_other_formats(self):
+        path = self.dir / "old.index.json"
+        path.write_text('{"format": 0}', encoding="utf-8")
+        with self.assertRaises(ValueError):
+            CitationIndex.load(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from src.utils.citation_parser import canonical_book, parse_citation_line, short_citation
+from src.utils.parsers import extract_bible_citation
+
+
+class TestBookTable(unittest.TestCase):
+    def test_spellings_map_to_one_abbreviation(self):
+        for name in ("Genesis", "Gen", "Gn", "gen."):
+            self.assertEqual(canonical_book(name), "Gn")
+        self.assertEqual(canonical_book("1 John"), "1 Jn")
+        self.assertEqual(canonical_book("1Jn"), "1 Jn")
+        self.assertIsNone(canonical_book("Pss"))
+        self.assertIsNone(canonical_book("Mass"))
+
+
+class TestParseCitationLine(unittest.TestCase):
+    def test_structured_references(self):
+        first, second = parse_citation_line("1 Jn 2:29-3:6/Jn 1:29-34 (206) Pss I")
+        self.assertEqual((first.book, first.chapter, first.verses), ("1 Jn", 2, (("29", "3:6"),)))
+        self.assertEqual(first.last_chapter, 3)
+        self.assertEqual((second.book, second.reading, second.lectionary, second.psalter_week), ("Jn", 1, "206", "I"))
+
+    def test_chapters_verse_lists_and_alternatives(self):
+        citations = parse_citation_line("Is 8:23-9:3/1 Cor 1:10-13, 17/Mt 4:12-23 or 4:12-17 (67) Pss III")
+        self.assertEqual([str(c) for c in citations], ["Is 8:23-9:3", "1 Cor 1:10-13, 17", "Mt 4:12-23", "Mt 4:12-17"])
+        self.assertEqual([c.reading for c in citations], [0, 1, 2, 2])
+        self.assertEqual([c.alternate for c in citations], [False, False, False, True])
+        self.assertEqual({c.lectionary for c in citations}, {"67"})
+
+    def test_lectionary_numbers_apply_to_their_group(self):
+        citations = parse_citation_line("Mt 21:1-11 (37)/Is 50:4-7/Mt 26:14-27:66 (38); or the Mass (887-891)")
+        self.assertEqual([c.lectionary for c in citations], ["37", "38", "38"])
+
+    def test_notes_are_not_references(self):
+        line = "Am 9:11-15/Mt 9:14-17 (382); or, for Independence Day, any readings (Lectionary for Mass Supplement, 947A)"
+        self.assertEqual([c.book for c in parse_citation_line(line)], ["Am", "Mt"])
+        self.assertEqual(parse_citation_line("Pss Prop"), ())
+
+
+class TestShortForms(unittest.TestCase):
+    def test_short_citation(self):
+        self.assertEqual(short_citation("Zep 2:3; 3:12-13/1 Cor 1:26-31/Mt 5:1-12a (70) Pss IV"), "Zep 2 / 1 Cor 1 / Mt 5")
+        self.assertEqual(short_citation("Mal 3:1-4/Heb 2:14-18/Lk 2:22-40 or 2:22-32 (524)"), "Mal 3 / Heb 2 / Lk 2")
+        self.assertEqual(short_citation("2 Tm 1:1-8 or Ti 1:1-5 (520)/Mk 3:22-30 (317)"), "2 Tm 1 / Ti 1 / Mk 3")
+        self.assertEqual(short_citation("Sg 3:1-4b or 2 Cor 5:14-17/Jn 20:1-2, 11-18 (603)"), "Sg 3 / 2 Cor 5 / Jn 20")
+
+    def test_short_citation_keeps_alternates_from_the_same_book(self):
+        line = "Jer 30:1-2, 12-15, 18-22/Mt 14:22-36 or Mt 15:1-2, 10-14 (408)"
+        self.assertEqual(short_citation(line), "Jer 30 / Mt 14 / Mt 15")
+        year_b = "Sir 3:2-6/Lk 2:22-40 or 2:22, 39-40; or, in Year B, Gn 15:1-6; 21:1-3/Heb 11:8 (17)"
+        self.assertEqual(short_citation(year_b), "Sir 3 / Lk 2 / Gn 15 / Heb 11")
+
+    def test_extract_bible_citation(self):
+        self.assertEqual(extract_bible_citation("Zep 2:3; 3:12-13/1 Cor 1:26-31 (70)"), "Zep 2:3; 3:12-13")
+        self.assertEqual(extract_bible_citation("Gen 1:1-5"), "Gen 1:1-5")
+        self.assertEqual(extract_bible_citation("no citation here"), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import io
+import sys
+import json
+import tempfile
+import unittest
+import subprocess
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from src import cli
+from src.utils.citation_index import CitationIndex
+
+
+class TestCli(unittest.TestCase):
+    def test_commands_do_not_import_pdfplumber(self):
+        probe = ("import sys, json\nfrom src.cli import COMMANDS, load_command\n"
+                 "for name in COMMANDS: load_command(name)\n"
+                 "print(json.dumps('pdfplumber' in sys.modules))")
+        out = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True).stdout
+        self.assertFalse(json.loads(out))
+
+    def test_every_command_has_a_main_and_a_budget(self):
+        self.assertEqual(set(cli.IMPORT_BUDGET_MS), set(cli.COMMANDS))
+        for name in cli.COMMANDS:
+            self.assertTrue(callable(cli.load_command(name).main), name)
+
+    def test_dispatch_passes_the_remaining_arguments(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "daily_bible_citations_2026.index.json"
+            CitationIndex.from_citations([{"Date": "2026-01-02", "SourceLine": "1 Jn 2:22-28/Jn 1:19-28 (205)"}]).save(path)
+            out = io.StringIO()
+            argv0 = sys.argv[0]
+            try:
+                with redirect_stdout(out):
+                    cli.main(["query", tmp, "--lectionary", "205"])
+            finally:
+                sys.argv[0] = argv0
+        self.assertIn("2026-01-02", out.getvalue())
+
+    def test_unknown_command_lists_the_commands(self):
+        with self.assertRaises(SystemExit) as ctx:
+            cli.main(["bulid"])
+        self.assertIn("extract-citations", str(ctx.exception.code))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ from src.utils.daily_bible_citation import (
     clean_text,
     shorten_bible_citation,
     extract_daily_bible_citations,
+    main,
 )
 
 
@@ -53,6 +54,43 @@ class TestExtractBibleCitations(unittest.TestCase):
         self.assertIn("BibleCitationShort", rows[0])
         temp_csv.unlink()
 
+    @patch("pdfplumber.open")
+    def test_december_31_keeps_its_citation(self, mock_pdfplumber):
+        december, appendix = MagicMock(), MagicMock()
+        december.extract_text.return_value = """
+        DECEMBER 2027
+        30 Thu Sixth Day within the Octave of the Nativity of the Lord white
+        1 Jn 2:12-17/Lk 2:36-40 (203) Pss Prop
+        31 Fri Seventh Day within the Octave of the Nativity of the Lord white
+        1 Jn 2:18-21/Jn 1:1-18 (204) Pss Prop
+        """
+        appendix.extract_text.return_value = """
+        Appendix Notes On The Calendar
+        """
+        mock_pdfplumber.return_value.__enter__.return_value.pages = [december, appendix]
+
+        temp_csv = Path(tempfile.mktemp(suffix=".csv"))
+        extract_daily_bible_citations(Path("fake.pdf"), temp_csv, year=2027)
+
+        with open(temp_csv, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        temp_csv.unlink()
+
+        self.assertEqual(rows[-1]["Date"], "2027-12-31")
+        self.assertEqual(rows[-1]["SourceLine"], "1 Jn 2:18-21/Jn 1:1-18 (204) Pss Prop")
+
+
+class TestDailyBibleCitationCli(unittest.TestCase):
+    @patch("src.utils.daily_bible_citation.extract_daily_bible_citations")
+    def test_default_output_follows_the_year(self, mock_extract):
+        for argv, out in (
+            (["--year", "2027"], Path("data/daily_bible_citations_2027.csv")),
+            (["--out", "elsewhere.csv"], Path("elsewhere.csv")),
+        ):
+            with self.subTest(argv=argv):
+                main(argv + ["--input-pdf", "calendar.pdf", "--no-cache", "--quiet"])
+                self.assertEqual(mock_extract.call_args.args[1], out)
+
 
 if __name__ == "__main__":
     unittest.main()
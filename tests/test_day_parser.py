@@ -0,0 +1,64 @@
+import unittest
+
+from src.utils.day_parser import DayDataParser, iter_text_lines, parse_day_data
+from src.utils.day_slots import DaySlots
+
+
+PAGES = [
+    """
+    NOVEMBER–DECEMBER 2025
+    30 SUN FIRST SUNDAY OF ADVENT violet
+    """,
+    """
+    MARCH 2026
+    28 Sat Lenten Weekday violet
+    Ez 37:21-28/Jn 11:45-56 (256)
+    29 SUN PALM SUNDAY OF THE PASSION OF THE LORD red
+    """,
+    """
+    30 Mon Monday of Holy Week violet
+    APRIL 2026
+    1 Wed Wednesday of Holy Week violet
+    3 Fri Friday of the Passion of the Lord (Good Friday) red
+    Solemnity
+    """,
+]
+
+
+class TestDayDataParser(unittest.TestCase):
+    def test_single_pass_over_text_pages(self):
+        rows = list(parse_day_data(iter_text_lines(PAGES), 2026))
+        dates = [r.date.isoformat() for r in rows]
+        self.assertEqual(dates, [
+            "2026-03-28", "2026-03-29", "2026-03-30", "2026-03-31",
+            "2026-04-01", "2026-04-02", "2026-04-03",
+        ])
+        # Header on the page applies only from where it appears
+        self.assertEqual(rows[2].feast_primary_name, "Monday of Holy Week")
+        self.assertEqual(rows[2].source_page, 3)
+        # March 31 is missing from the text and is filled from March 30
+        self.assertEqual(rows[3].feast_primary_name, "Monday of Holy Week")
+        self.assertEqual(rows[3].weekday_col, 3)
+        # Rank line is attached to the day above it
+        self.assertEqual(rows[6].feast_rank, "Solemnity")
+        self.assertEqual(rows[6].liturgical_color, "Red")
+
+    def test_resumable_across_feeds(self):
+        parser = DayDataParser(2026)
+        slots = DaySlots(2026)
+        for page_num, line in iter_text_lines(PAGES):
+            for row in parser.feed(page_num, line):
+                slots.place(row)
+        for row in parser.close():
+            slots.place(row)
+        slots.fill()
+        self.assertEqual(slots.rows(), list(parse_day_data(iter_text_lines(PAGES), 2026)))
+
+    def test_stops_after_december_31(self):
+        pages = ["DECEMBER 2026\n31 Thu Seventh Day within the Octave white\n1 Fri Ignored white"]
+        rows = list(parse_day_data(iter_text_lines(pages), 2026))
+        self.assertEqual([r.date.isoformat() for r in rows], ["2026-12-31"])
+
+
+if __name__ == "__main__":
+    unittest.main()
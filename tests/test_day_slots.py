@@ -0,0 +1,71 @@
+import unittest
+from datetime import date
+
+from src import metrics
+from src.model import DayRecord
+from src.utils.day_parser import assemble_day_data, iter_text_lines
+from src.utils.day_slots import DaySlots, INFERRED, PARSED
+
+
+def record(day: date, feast: str, source_page: int = 1) -> DayRecord:
+    return DayRecord(day, feast, "", "Green", source_page=source_page)
+
+
+class TestDaySlots(unittest.TestCase):
+    def test_one_slot_per_day_of_the_year(self):
+        self.assertEqual(len(DaySlots(2026)), 365)
+        self.assertEqual(len(DaySlots(2028)), 366)
+        self.assertEqual(DaySlots(2028).index(date(2028, 12, 31)), 365)
+        with self.assertRaises(ValueError):
+            DaySlots(2026).place(record(date(2025, 12, 31), "Seventh Day within the Octave"))
+
+    def test_parsed_rows_beat_inferred_ones_and_the_first_parsed_row_stays(self):
+        slots = DaySlots(2026)
+        first = record(date(2026, 6, 2), "Tuesday of the Ninth Week")
+        self.assertTrue(slots.place(record(date(2026, 6, 2), "inferred"), INFERRED))
+        self.assertTrue(slots.place(first))
+        self.assertFalse(slots.place(record(date(2026, 6, 2), "printed again", source_page=2)))
+        self.assertFalse(slots.place(record(date(2026, 6, 2), "inferred"), INFERRED))
+        self.assertIs(slots.rows()[0], first)
+        self.assertEqual(slots.origins[slots.index(date(2026, 6, 2))], PARSED)
+        self.assertEqual(slots.duplicates, [date(2026, 6, 2)])
+
+    def test_gaps_are_filled_in_one_sweep_and_reported(self):
+        slots = DaySlots(2026)
+        slots.place(record(date(2026, 3, 1), "SECOND SUNDAY OF LENT", source_page=20))
+        slots.place(record(date(2026, 3, 4), "Lenten Weekday", source_page=21))
+        slots.place(record(date(2026, 3, 6), "Lenten Weekday", source_page=21))
+        self.assertEqual(slots.fill(), 3)
+        self.assertEqual(slots.inferred(), [date(2026, 3, 2), date(2026, 3, 3), date(2026, 3, 5)])
+        rows = slots.rows()
+        self.assertEqual([r.date.day for r in rows], [1, 2, 3, 4, 5, 6])
+        self.assertEqual((rows[1].feast_primary_name, rows[1].source_page, rows[1].weekday_col),
+                         ("SECOND SUNDAY OF LENT", 21, 2))
+        self.assertEqual(slots.fill(), 0)
+
+    def test_parser_reports_inferred_days(self):
+        page = "JANUARY 2026\n1 Thu Mary, Mother of God white\n4 SUN THE EPIPHANY OF THE LORD white"
+        m = metrics.Metrics(quiet=True)
+        with metrics.use(m):
+            slots = assemble_day_data(iter_text_lines([page]), 2026)
+        self.assertEqual(len(slots.rows()), 4)
+        self.assertEqual(m.info["inferred_days"], {"2026": ["2026-01-02", "2026-01-03"]})
+        self.assertEqual(m.counters["gap_filled_days"], 2)
+
+    def test_inferred_days_get_their_own_date_flags(self):
+        page = ("AUGUST 2026\n7 Fri Friday of the Eighteenth Week in Ordinary Time green\n"
+                "10 Mon Saint Lawrence, Deacon and Martyr red\n"
+                "DECEMBER 2026\n25 Fri THE NATIVITY OF THE LORD (CHRISTMAS) white\n27 SUN THE HOLY FAMILY white")
+        with metrics.use(metrics.Metrics(quiet=True)):
+            slots = assemble_day_data(iter_text_lines([page]), 2026)
+        first_friday, after = (slots.records[slots.index(date(2026, 8, d))] for d in (7, 8))
+        self.assertEqual((first_friday.is_first_friday, after.is_first_friday, after.is_first_saturday), (1, 0, 0))
+        christmas, after = (slots.records[slots.index(date(2026, 12, d))] for d in (25, 26))
+        self.assertEqual((christmas.is_holy_day_of_obligation, christmas.us_holiday_name), (1, "Christmas Day"))
+        self.assertEqual((after.is_holy_day_of_obligation, after.us_holiday_name), (0, ""))
+        self.assertEqual((after.feast_primary_name, after.weekday_col), ("THE NATIVITY OF THE LORD (CHRISTMAS)", 7))
+        self.assertIn(date(2026, 12, 26), slots.inferred())
+
+
+if __name__ == "__main__":
+    unittest.main()
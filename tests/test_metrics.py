@@ -0,0 +1,96 @@
+import io
+import json
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src import metrics
+from src.build import build_year
+from src.metrics import Metrics
+from src.utils.day_parser import iter_text_lines, parse_day_data
+
+
+class TestMetrics(unittest.TestCase):
+    def test_phases_nest_and_report_self_time(self):
+        m = Metrics()
+        with m.phase("stage"):
+            with m.phase("parse"):
+                m.count("lines", 3)
+            with m.phase("parse"):
+                m.count("lines")
+        data = m.to_dict()
+        self.assertEqual(data["phases"]["stage.parse"]["calls"], 2)
+        self.assertEqual(data["counters"], {"stage.parse.lines": 4})
+        stage = data["phases"]["stage"]
+        self.assertAlmostEqual(stage["self_seconds"], stage["seconds"] - data["phases"]["stage.parse"]["seconds"],
+                               places=5)
+        self.assertEqual([name for name, _ in m.children("stage")], ["parse"])
+
+    def test_threads_keep_their_own_phase_stack(self):
+        m = Metrics()
+
+        def stage(name):
+            with m.phase(name):
+                m.count("rows")
+
+        with m.phase("main"):
+            workers = [threading.Thread(target=stage, args=(name,)) for name in ("a", "b")]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        self.assertEqual(set(m.phases), {"main", "a", "b"})
+        self.assertEqual(m.counters, {"a.rows": 1, "b.rows": 1})
+
+    def test_quiet_silences_log_and_use_restores(self):
+        before = metrics.current()
+        out = io.StringIO()
+        with redirect_stdout(out), metrics.use(Metrics(quiet=True)) as m:
+            metrics.log("✅ saved")
+            self.assertIs(metrics.current(), m)
+        self.assertEqual(out.getvalue(), "")
+        self.assertIs(metrics.current(), before)
+
+    def test_log_writes_each_line_in_one_call(self):
+        out = MagicMock()
+        m = Metrics()
+        with patch("sys.stdout", out):
+            workers = [threading.Thread(target=m.log, args=(f"stage {i} done",)) for i in range(8)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        writes = sorted(call.args[0] for call in out.write.call_args_list)
+        self.assertEqual(writes, sorted(f"stage {i} done\n" for i in range(8)))
+
+    def test_day_parser_counts_gap_filled_days(self):
+        m = Metrics()
+        lines = ["JANUARY 2026", "1 Thu Mary, Mother of God white", "Solemnity", "Nm 6:22-27 (18)",
+                 "4 SUN THE EPIPHANY OF THE LORD white", "5 Mon Saint John Neumann white"]
+        with metrics.use(m):
+            records = list(parse_day_data(iter_text_lines(["\n".join(lines)]), 2026))
+        self.assertEqual(len(records), 5)
+        self.assertEqual(m.counters["day_lines"], 3)
+        self.assertEqual(m.counters["rank_lines"], 1)
+        self.assertEqual(m.counters["gap_filled_days"], 2)
+        self.assertEqual(m.counters["unmatched_lines"], 1)
+
+
+class TestBuildMetrics(unittest.TestCase):
+    def test_build_year_reports_stage_phases(self):
+        m = Metrics(quiet=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            summary = build_year(2027, None, Path(tmp), jobs=1, run_metrics=m)
+            m.save(Path(tmp) / "metrics.json")
+            saved = json.loads((Path(tmp) / "metrics.json").read_text())
+        for path in ("day_data.compute", "day_data.write", "weekly_index.write", "sqlite"):
+            self.assertIn(path, summary["metrics"]["phases"])
+        self.assertEqual(set(saved["stages"]), set(summary["statuses"]))
+        self.assertEqual(saved["year"], 2027)
+
+
+if __name__ == "__main__":
+    unittest.main()
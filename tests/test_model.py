@@ -0,0 +1,36 @@
+import unittest
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from src.model import DayRecord, as_day_records, write_day_data_csv, read_day_data_csv
+
+
+class TestDayRecord(unittest.TestCase):
+    def setUp(self):
+        self.row = ["2026-01-02", "Feast B", "", "Green", "1", "New Year's Day", "0", "0", "1", "6", "2", "1", "15"]
+
+    def test_from_row_types(self):
+        record = DayRecord.from_row(self.row)
+        self.assertEqual(record.date, date(2026, 1, 2))
+        self.assertEqual(record.is_holy_day_of_obligation, 1)
+        self.assertEqual(record.us_holiday_name, "New Year's Day")
+        self.assertEqual(record.source_page, 15)
+        self.assertEqual(record.to_row()[0], "2026-01-02")
+
+    def test_csv_round_trip(self):
+        records = as_day_records([self.row])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "DAY_DATA.csv"
+            write_day_data_csv(records, path)
+            self.assertEqual(read_day_data_csv(path), records)
+
+    def test_copy(self):
+        record = DayRecord.from_row(self.row)
+        copy = record.copy(date=date(2026, 1, 3), display_date_number=3)
+        self.assertEqual(copy.feast_primary_name, "Feast B")
+        self.assertEqual(record.date, date(2026, 1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.utils.page_cache import PageTextCache, layout_cache_kwargs
+from src.utils.page_layout import layout_text, FOOTNOTE_RULE
+from src.utils.tokenizer import classify_line, DAY
+
+
+def glyphs(text: str, x0: float, top: float, width: float = 6.0) -> list:
+    """One char dict per character, spaces included, as pdfplumber reports them."""
+    chars = []
+    for i, ch in enumerate(text):
+        left = x0 + i * width
+        chars.append({"text": ch, "x0": left, "x1": left + width, "top": top})
+    return chars
+
+
+class FakePage:
+    width, height = 612, 792
+
+    def __init__(self, chars, rects=(), text="full page text"):
+        self.chars = chars
+        self.rects = list(rects)
+        self.lines = []
+        self.text = text
+
+    def within_bbox(self, bbox):
+        x0, top, x1, bottom = bbox
+        return FakePage([c for c in self.chars if x0 <= c["x0"] and c["x1"] <= x1 and top <= c["top"] < bottom])
+
+    def extract_text(self):
+        return self.text
+
+
+class TestLayoutText(unittest.TestCase):
+    def test_day_rows_keep_their_columns_and_footnotes_are_cut(self):
+        chars = (glyphs(" ", 72, 36) + glyphs("JANUARY 2026", 72, 74)
+                 + glyphs("1", 72, 92) + glyphs("Thu", 108, 92) + glyphs("Mary, Mother of God", 144, 92)
+                 + glyphs("white", 510, 92) + glyphs("2", 258.5, 90, width=3)
+                 + glyphs("Solemnity", 72, 107)
+                 + glyphs("7 The following readings may be used", 72, 700) + glyphs("14", 300, 744))
+        rule = {"x0": 72.0, "x1": 216.0, "top": 690.0, "height": 0.6}
+        text = layout_text(FakePage(chars, rects=[rule]))
+        self.assertEqual(text.splitlines(), [
+            "JANUARY 2026", "1\tThu\tMary, Mother of God2\twhite", "Solemnity", FOOTNOTE_RULE,
+        ])
+
+    def test_pages_without_day_rows_fall_back_to_extract_text(self):
+        page = FakePage(glyphs("ABBREVIATIONS OF THE BOOKS OF THE BIBLE", 72, 74), text="ABBREVIATIONS")
+        self.assertEqual(layout_text(page), "ABBREVIATIONS")
+
+
+class TestLayoutTokens(unittest.TestCase):
+    def test_split_day_rows_classify_like_the_joined_line(self):
+        for fields in (
+            ["30", "Mon", "Monday of Holy Week", "violet"],
+            ["9", "Tue", "Advent Weekday", "violet/white"],
+            ["4", "SUN", "THE EPIPHANY OF THE LORD", "white"],
+            ["9", "Tue"],
+            ["12", "Fri", "Our Lady of Guadalupe"],
+            ["3", "Sat", "Saturday Mass in white or", "white"],
+            ["5", "Octave", "Day", "white"],
+        ):
+            with self.subTest(fields=fields):
+                self.assertEqual(classify_line("\t".join(fields)), classify_line(" ".join(fields)))
+        self.assertEqual(classify_line("1\tThu\tMary, Mother of God\twhite"),
+                         (DAY, (1, "Thu", "Mary, Mother of God", "white")))
+
+    def test_layout_pages_cache_apart_from_text_pages(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pdf = Path(tmp) / "calendar.pdf"
+            pdf.write_bytes(b"%PDF-1.4")
+            text = PageTextCache(pdf, Path(tmp) / "cache")
+            layout = PageTextCache(pdf, Path(tmp) / "cache", extract_kwargs=layout_cache_kwargs(True))
+        self.assertNotEqual(text.root, layout.root)
+        self.assertIsNone(layout_cache_kwargs(False))
+
+
+if __name__ == "__main__":
+    unittest.main()
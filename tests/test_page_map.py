@@ -0,0 +1,53 @@
+import unittest
+
+from src.build import extract_day_data
+from src.utils.page_map import PageMap, heads_from_texts, GRID, FEAST_LIST, OTHER, UNKNOWN
+from src.utils.page_text import TextPages
+from src.utils.synthetic_calendar import generate
+
+
+class TestPageMap(unittest.TestCase):
+    def setUp(self):
+        self.heads = [
+            "",
+            "ABBREVIATIONS OF THE BOOKS OF THE BIBLE\nOLD TESTAMENT",
+            "PROPER CALENDAR FOR THE DIOCESES OF\nTHE UNITED STATES OF AMERICA",
+            "",
+            "21 SUN FOURTH SUNDAY OF ADVENT violet\nIs 7:10-14/Rom 1:1-7/Mt 1:18-24 (10) Pss I",
+            "JANUARY 2026\n1 Thu SOLEMNITY OF MARY, THE HOLY MOTHER OF GOD white",
+            "Solemnity\nActs 2:14a, 36-41/1 Pt 2:20b-25/Jn 10:1-10 (49) Pss IV",
+            None,
+            "FEBRUARY 2026\n1\tSUN\tFOURTH SUNDAY IN ORDINARY TIME\tgreen",
+            "APPENDIX / APÉNDICE",
+        ]
+
+    def test_pages_are_classified_from_their_header_strips(self):
+        page_map = PageMap.discover(self.heads)
+        self.assertEqual(page_map.kinds, [OTHER, OTHER, FEAST_LIST, FEAST_LIST, GRID, GRID, GRID, UNKNOWN, GRID, OTHER])
+        self.assertEqual(page_map.months, {"January 2026": 5, "February 2026": 8})
+        self.assertEqual(page_map.feast_list_pages(), [2, 3, 7])
+
+    def test_grid_pages_start_at_the_first_header_of_the_year(self):
+        page_map = PageMap.discover(self.heads)
+        self.assertEqual(page_map.grid_pages(2026), [5, 6, 7, 8])
+        self.assertEqual(page_map.grid_pages(2027), [4, 5, 6, 7, 8])
+
+    def test_round_trips_through_its_cache_dict(self):
+        page_map = PageMap.discover(self.heads)
+        again = PageMap.from_dict(page_map.to_dict())
+        self.assertEqual((again.kinds, again.months), (page_map.kinds, page_map.months))
+        self.assertIsNone(PageMap.from_dict({"format": -1, "kinds": [], "months": {}}))
+
+    def test_day_data_reads_only_mapped_pages(self):
+        corpus = generate([2026], seed=2, noise=0.1, lead_pages=3)
+        pages = TextPages(corpus.pages)
+        self.assertEqual(pages.page_map().grid_pages(2026)[0], 3)
+        self.assertEqual(heads_from_texts(["a\nb\n\nc\nd"]), ["a\nb\nc"])
+        records = extract_day_data(None, 2026, pages=pages)
+        self.assertEqual(records, extract_day_data(None, 2026, start_page=0, pages=TextPages(corpus.pages)))
+        self.assertEqual(len(records), 365)
+        self.assertEqual(pages.requests, len(corpus.pages) - 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import tempfile
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+from src.utils.page_text import PageTextProvider
+from src.utils.page_cache import PageTextCache
+
+
+class TestPageTextProvider(unittest.TestCase):
+    @patch("pdfplumber.open")
+    def test_each_page_extracted_once(self, mock_pdfplumber):
+        pages = [MagicMock(), MagicMock()]
+        pages[0].extract_text.return_value = "JANUARY 2026\n 1 Thu \n\n"
+        pages[1].extract_text.return_value = None
+        mock_pdfplumber.return_value.__enter__.return_value.pages = pages
+
+        with PageTextProvider(Path("fake.pdf")) as provider:
+            self.assertEqual(len(provider), 2)
+            self.assertEqual(provider.lines(0), ["JANUARY 2026", "1 Thu"])
+            self.assertEqual(provider.lines(0), ["JANUARY 2026", "1 Thu"])
+            self.assertEqual(provider.lines(1), [])
+            stats = provider.stats()
+
+        mock_pdfplumber.assert_called_once()
+        self.assertEqual(pages[0].extract_text.call_count, 1)
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["extractions"], 2)
+        self.assertEqual(stats["hits"], 1)
+
+
+class TestPageTextCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.pdf = Path(self.tmp.name) / "calendar.pdf"
+        self.pdf.write_bytes(b"%PDF-1.4 edition one")
+        self.cache_dir = Path(self.tmp.name) / "cache"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @patch("pdfplumber.open")
+    def test_warm_run_skips_pdfplumber(self, mock_pdfplumber):
+        page = MagicMock()
+        page.extract_text.return_value = "JANUARY 2026"
+        mock_pdfplumber.return_value.__enter__.return_value.pages = [page]
+
+        with PageTextProvider(self.pdf, cache=PageTextCache(self.pdf, self.cache_dir)) as cold:
+            self.assertEqual(len(cold), 1)
+            self.assertEqual(cold.text(0), "JANUARY 2026")
+        mock_pdfplumber.reset_mock()
+
+        warm_cache = PageTextCache(self.pdf, self.cache_dir)
+        with PageTextProvider(self.pdf, cache=warm_cache) as warm:
+            self.assertEqual(len(warm), 1)
+            self.assertEqual(warm.text(0), "JANUARY 2026")
+        mock_pdfplumber.assert_not_called()
+        self.assertEqual(warm_cache.stats()["cache_hits"], 1)
+
+    def test_new_edition_misses(self):
+        PageTextCache(self.pdf, self.cache_dir).put(0, "old text")
+        self.pdf.write_bytes(b"%PDF-1.4 edition two")
+        cache = PageTextCache(self.pdf, self.cache_dir)
+        self.assertIsNone(cache.get(0))
+        self.assertEqual(cache.stats()["cache_misses"], 1)
+
+    def test_clear(self):
+        cache = PageTextCache(self.pdf, self.cache_dir)
+        cache.put(3, "text")
+        cache.clear()
+        self.assertIsNone(cache.get(3))
+
+
+if __name__ == "__main__":
+    unittest.main()
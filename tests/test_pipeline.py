@@ -0,0 +1,88 @@
+import unittest
+import tempfile
+from pathlib import Path
+
+from src.pipeline import BuildGraph, Stage
+
+
+def make_numbers():
+    return [1, 2, 3]
+
+
+def write_total(numbers, path):
+    path.write_text(str(sum(numbers)))
+    return sum(numbers)
+
+
+class TestBuildGraph(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.source = self.dir / "source.txt"
+        self.source.write_text("v1")
+        self.calls = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def graph(self, scale=1):
+        graph = BuildGraph(self.dir / ".build")
+        total = self.dir / "total.txt"
+
+        def numbers():
+            self.calls.append("numbers")
+            return make_numbers()
+
+        def total_stage(numbers):
+            self.calls.append("total")
+            return write_total([n * scale for n in numbers], total)
+
+        graph.add(Stage("numbers", numbers, inputs=[self.source], persist=True, code=[make_numbers]))
+        graph.add(Stage("total", total_stage, deps=["numbers"], outputs=[total],
+                        params={"scale": scale}, code=[write_total]))
+        return graph
+
+    def test_second_run_skips_everything(self):
+        self.assertEqual(self.graph().run(), {"numbers": "ran", "total": "ran"})
+        self.calls.clear()
+        self.assertEqual(self.graph().run(), {"numbers": "skipped", "total": "skipped"})
+        self.assertEqual(self.calls, [])
+
+    def test_downstream_change_reuses_persisted_value(self):
+        self.graph().run()
+        self.calls.clear()
+        statuses = self.graph(scale=2).run()
+        self.assertEqual(statuses, {"numbers": "skipped", "total": "ran"})
+        self.assertEqual(self.calls, ["total"])
+        self.assertEqual((self.dir / "total.txt").read_text(), "12")
+
+    def test_input_change_reruns(self):
+        self.graph().run()
+        self.source.write_text("v2")
+        self.assertEqual(self.graph().run()["numbers"], "ran")
+
+    def test_deleted_output_reruns(self):
+        self.graph().run()
+        (self.dir / "total.txt").unlink()
+        self.assertEqual(self.graph().run(), {"numbers": "skipped", "total": "ran"})
+
+    def test_depending_on_a_skipped_stage_without_value(self):
+        def graph(label):
+            graph = self.graph()
+            report = self.dir / "report.txt"
+            graph.add(Stage("report", lambda numbers, total=None: report.write_text(label),
+                            deps=["numbers", "total"], outputs=[report], params={"label": label}))
+            return graph
+
+        graph("a").run()
+        self.assertEqual(graph("b").run(), {"numbers": "skipped", "total": "skipped", "report": "ran"})
+        self.assertEqual((self.dir / "report.txt").read_text(), "b")
+
+    def test_unknown_dependency(self):
+        graph = BuildGraph(self.dir / ".build")
+        with self.assertRaises(ValueError):
+            graph.add(Stage("total", write_total, deps=["missing"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from datetime import date
+
+from src.proper_of_time import year_anchors, compute_year, compute_years, cross_check
+
+
+def by_date(records):
+    return {r.date: r for r in records}
+
+
+class TestAnchors(unittest.TestCase):
+    def test_2026(self):
+        a = year_anchors(2026)
+        self.assertEqual(a.epiphany, date(2026, 1, 4))
+        self.assertEqual(a.baptism, date(2026, 1, 11))
+        self.assertEqual(a.ash_wednesday, date(2026, 2, 18))
+        self.assertEqual(a.pentecost, date(2026, 5, 24))
+        self.assertEqual(a.advent_start, date(2026, 11, 29))
+        self.assertEqual(a.holy_family, date(2026, 12, 27))
+
+    def test_late_epiphany_moves_baptism_to_monday(self):
+        a = year_anchors(2023)
+        self.assertEqual(a.epiphany, date(2023, 1, 8))
+        self.assertEqual(a.baptism, date(2023, 1, 9))
+
+    def test_christmas_on_sunday(self):
+        self.assertEqual(year_anchors(2022).holy_family, date(2022, 12, 30))
+
+
+class TestComputeYear(unittest.TestCase):
+    def test_whole_year(self):
+        self.assertEqual(len(compute_year(2026)), 365)
+        self.assertEqual(len(compute_year(2028)), 366)
+
+    def test_sundays_and_colors(self):
+        days = by_date(compute_year(2026))
+        self.assertEqual(days[date(2026, 1, 18)].feast_primary_name, "SECOND SUNDAY IN ORDINARY TIME")
+        self.assertEqual(days[date(2026, 3, 15)].liturgical_color, "Violet or rose")
+        self.assertEqual(days[date(2026, 11, 8)].feast_primary_name, "THIRTY-SECOND SUNDAY IN ORDINARY TIME")
+        self.assertEqual(days[date(2026, 3, 29)].liturgical_color, "Red")
+        self.assertEqual(days[date(2026, 5, 14)].is_holy_day_of_obligation, 1)
+        self.assertEqual(days[date(2026, 1, 2)].is_first_friday, 1)
+
+    def test_transfers(self):
+        days = by_date(compute_year(2024))
+        self.assertEqual(days[date(2024, 4, 8)].feast_primary_name, "THE ANNUNCIATION OF THE LORD")
+        self.assertEqual(days[date(2024, 12, 8)].feast_primary_name, "SECOND SUNDAY OF ADVENT")
+        self.assertTrue(days[date(2024, 12, 9)].feast_primary_name.startswith("THE IMMACULATE CONCEPTION"))
+        # St Joseph in Holy Week moves to the Saturday before Palm Sunday
+        days = by_date(compute_year(2035))
+        self.assertTrue(days[date(2035, 3, 17)].feast_primary_name.startswith("SAINT JOSEPH"))
+
+    def test_batch_matches_single_years(self):
+        batch = compute_years(range(1999, 2002))
+        self.assertEqual(list(batch), [1999, 2000, 2001])
+        self.assertEqual(batch[2000], compute_year(2000))
+
+
+class TestCrossCheck(unittest.TestCase):
+    def test_computed_year_agrees_with_itself(self):
+        report = cross_check(compute_year(2027), 2027)
+        self.assertEqual(report["name_mismatches"], 0)
+        self.assertEqual(report["color_mismatches"], 0)
+        self.assertEqual(sum(report["fields"].values()), 0)
+        self.assertGreater(report["proper_days"], 60)
+
+    def test_mismatches_are_reported(self):
+        records = compute_year(2027)
+        easter = date(2027, 3, 28)
+        records = [r.copy(liturgical_color="Green") if r.date == easter else r for r in records[:-1]]
+        report = cross_check(records, 2027)
+        self.assertEqual(report["color_mismatches"], 1)
+        self.assertEqual(report["missing_dates"], ["2027-12-31"])
+        self.assertEqual(report["samples"][0]["date"], "2027-03-28")
+
+    def test_printed_obligation_is_checked(self):
+        records = compute_year(2026)
+        assumption = date(2026, 8, 15)
+        rank = "Solemnity [not a Holyday of Obligation this year]"
+        printed = [r.copy(feast_rank=rank) if r.date == assumption else r for r in records]
+        self.assertEqual(cross_check(printed, 2026)["fields"]["is_holy_day_of_obligation"], 0)
+        wrong = [r.copy(feast_rank=rank, is_holy_day_of_obligation=0) if r.date == date(2026, 12, 25) else r
+                 for r in records]
+        self.assertEqual(cross_check(wrong, 2026)["fields"]["is_holy_day_of_obligation"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from datetime import date, timedelta
+
+from src.seasons import SeasonIndex, season_for, liturgical_week_for, LiturgicalWeek
+
+
+class TestSeasonIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = SeasonIndex(2026, 2026)
+
+    def test_season_boundaries_2026(self):
+        self.assertEqual(self.index.season_for(date(2026, 1, 11)), "Christmas")
+        self.assertEqual(self.index.season_for(date(2026, 1, 12)), "Ordinary Time")
+        self.assertEqual(self.index.season_for(date(2026, 2, 18)), "Lent")
+        self.assertEqual(self.index.season_for(date(2026, 4, 2)), "Paschal Triduum")
+        self.assertEqual(self.index.season_for(date(2026, 4, 5)), "Easter")
+        self.assertEqual(self.index.season_for(date(2026, 5, 24)), "Easter")
+        self.assertEqual(self.index.season_for(date(2026, 5, 25)), "Ordinary Time")
+        self.assertEqual(self.index.season_for(date(2026, 11, 29)), "Advent")
+        self.assertEqual(self.index.season_for(date(2026, 12, 25)), "Christmas")
+
+    def test_weeks_match_the_printed_calendar(self):
+        self.assertEqual(self.index.liturgical_week_for(date(2026, 1, 12)), LiturgicalWeek("Ordinary Time", 1))
+        self.assertEqual(self.index.liturgical_week_for(date(2026, 2, 19)), LiturgicalWeek("Lent", 0))
+        self.assertEqual(self.index.liturgical_week_for(date(2026, 3, 15)), LiturgicalWeek("Lent", 4))
+        self.assertEqual(self.index.liturgical_week_for(date(2026, 6, 14)), LiturgicalWeek("Ordinary Time", 11))
+        self.assertEqual(self.index.liturgical_week_for(date(2026, 11, 23)), LiturgicalWeek("Ordinary Time", 34))
+        self.assertEqual(self.index.liturgical_week_for(date(2026, 12, 13)), LiturgicalWeek("Advent", 3))
+
+    def test_previous_christmas_is_covered(self):
+        self.assertEqual(self.index.season_for(date(2025, 12, 29)), "Christmas")
+        with self.assertRaises(ValueError):
+            self.index.season_for(date(2025, 12, 1))
+        with self.assertRaises(ValueError):
+            self.index.season_for(date(2027, 1, 1))
+
+    def test_multi_year_index_agrees_with_single_years(self):
+        index = SeasonIndex(2020, 2030)
+        day = date(2020, 1, 1)
+        while day <= date(2030, 12, 31):
+            self.assertEqual(index.liturgical_week_for(day), SeasonIndex(day.year, day.year).liturgical_week_for(day))
+            day += timedelta(days=11)
+
+    def test_module_functions_outside_default_range(self):
+        self.assertEqual(season_for(date(2026, 3, 1)), "Lent")
+        self.assertEqual(liturgical_week_for(date(2250, 12, 1)).season, "Advent")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.proper_of_time import compute_year
+from src.sqlite_export import export_sqlite
+
+
+def dataset(year, citations=()):
+    return {
+        "year": year, "source": "computed", "day_data": compute_year(year),
+        "citations": [{"Date": d, "BibleCitationShort": c, "SourceLine": c} for d, c in citations],
+        "weeks": [], "us_holidays": [],
+        "major_feasts": [{"FeastDate": "Mar 25", "FeastName": "Annunciation of the Blessed Virgin Mary", "Category": "Marian Feasts"}],
+    }
+
+
+class TestSqliteExport(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = Path(self.tmp.name) / "calendar.sqlite"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def query(self, sql, *params):
+        conn = sqlite3.connect(self.db)
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def test_years_side_by_side_and_replaced(self):
+        counts = export_sqlite(self.db, [dataset(2027), dataset(2028)], batch_size=100)
+        self.assertEqual((counts["years"], counts["days"]), (2, 365 + 366))
+        export_sqlite(self.db, [dataset(2027)])
+        self.assertEqual(self.query("SELECT year, COUNT(*) FROM days GROUP BY year"), [(2027, 365), (2028, 366)])
+        self.assertEqual(self.query("SELECT date FROM major_feasts ORDER BY year"), [("2027-03-25",), ("2028-03-25",)])
+
+    def test_season_index_and_full_text(self):
+        export_sqlite(self.db, [dataset(2027, [("2027-02-01", "Heb 11 / Mk 5"), ("2027-02-03", "Heb 12 / Mt 5:1-12")])])
+        self.assertEqual(self.query("SELECT season FROM days WHERE date = '2027-02-10'"), [("Lent",)])
+        indexes = {row[0] for row in self.query("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertTrue({"days_season", "days_rank", "days_color"} <= indexes)
+        plan = " ".join(str(r) for r in self.query("EXPLAIN QUERY PLAN SELECT * FROM days WHERE season = 'Lent'"))
+        self.assertIn("days_season", plan)
+        matches = self.query("SELECT date FROM citations WHERE id IN "
+                             "(SELECT rowid FROM citations_fts WHERE citations_fts MATCH '\"Mt 5\"')")
+        self.assertEqual(matches, [("2027-02-03",)])
+        names = self.query("SELECT d.date FROM days d WHERE d.rowid IN "
+                           "(SELECT rowid FROM days_fts WHERE days_fts MATCH 'ascension')")
+        self.assertEqual(names, [("2027-05-06",)])
+
+
+if __name__ == "__main__":
+    unittest.main()
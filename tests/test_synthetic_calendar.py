@@ -0,0 +1,69 @@
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from src.build import extract_day_data
+from src.utils.daily_bible_citation import clean_text, extract_daily_bible_citations
+from src.utils.page_text import TextPages
+from src.utils.synthetic_calendar import generate, mojibake, read_pages
+
+
+def day_keys(records):
+    return [(r.date, r.feast_primary_name, r.feast_rank, r.liturgical_color) for r in records]
+
+
+class TestSyntheticCalendar(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def citations(self, corpus, year):
+        with redirect_stdout(io.StringIO()):
+            rows = extract_daily_bible_citations(None, self.dir / f"c{year}.csv", pages=TextPages(corpus.pages),
+                                                 year=year)
+        return {row["Date"]: row["SourceLine"] for row in rows}
+
+    def test_same_seed_same_text(self):
+        self.assertEqual(generate([2026], seed=3).pages, generate([2026], seed=3).pages)
+        self.assertNotEqual(generate([2026], seed=3).pages, generate([2026], seed=4).pages)
+
+    def test_write_and_read_back(self):
+        corpus = generate([2026, 2027], days_per_page=30)
+        corpus.write(self.dir / "corpus.txt")
+        self.assertEqual(read_pages(self.dir / "corpus.txt"), corpus.pages)
+
+    def test_clean_corpus_parses_to_what_was_written(self):
+        corpus = generate([2026, 2027], seed=1, lead_pages=3)
+        for year in (2026, 2027):
+            records = extract_day_data(None, year, start_page=0, pages=TextPages(corpus.pages))
+            self.assertEqual(day_keys(records), day_keys(corpus.days[year]))
+
+            expected = {d: "; ".join(clean_text(line) for line in lines) for d, lines in corpus.citations[year].items()}
+            found = self.citations(corpus, year)
+            self.assertEqual(found, {d: expected[d] for d in found})
+            self.assertGreater(len(found), 350)
+
+    def test_citations_survive_mojibake(self):
+        corpus = generate([2026], seed=2, mojibake_rate=0.5)
+        self.assertTrue(any("â€" in page for page in corpus.pages))
+        expected = {d: "; ".join(clean_text(line) for line in lines) for d, lines in corpus.citations[2026].items()}
+        found = self.citations(corpus, 2026)
+        self.assertEqual(found, {d: expected[d] for d in found})
+
+    def test_every_date_survives_noise(self):
+        corpus = generate([2026], seed=5, noise=0.1, days_per_page=200)
+        records = extract_day_data(None, 2026, start_page=0, pages=TextPages(corpus.pages))
+        self.assertEqual([r.date for r in records], [r.date for r in corpus.days[2026]])
+
+    def test_mojibake_is_the_cp1252_misreading(self):
+        self.assertEqual(mojibake("Mt 26:14—27:66"), "Mt 26:14â€”27:66")
+        self.assertEqual(mojibake("plain"), "plain")
+
+
+if __name__ == "__main__":
+    unittest.main()
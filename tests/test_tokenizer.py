@@ -0,0 +1,39 @@
+import unittest
+
+from src.utils.tokenizer import (
+    classify_line,
+    DAY, RANK, MONTH_HEADER, SEPARATOR, FOOTNOTE, CITATION, OTHER,
+)
+
+
+class TestClassifyLine(unittest.TestCase):
+    def test_day_entry(self):
+        token = classify_line("30 Mon Monday of Holy Week violet")
+        self.assertEqual(token.kind, DAY)
+        self.assertEqual(token.groups, (30, "Mon", "Monday of Holy Week", "violet"))
+
+    def test_day_without_color(self):
+        token = classify_line("8 Mon THE IMMACULATE CONCEPTION OF THE")
+        self.assertEqual(token.kind, DAY)
+        self.assertEqual(token.groups, (8, "Mon", None, None))
+
+    def test_month_header(self):
+        self.assertEqual(classify_line("APRIL 2026"), (MONTH_HEADER, ("April", 2026)))
+        self.assertEqual(classify_line("NOVEMBER–DECEMBER 2025").kind, OTHER)
+
+    def test_citations(self):
+        self.assertEqual(classify_line("1 Jn 2:18-21/Jn 1:1-18 (204) Pss Prop"), (CITATION, ("204",)))
+        self.assertEqual(classify_line("Is 42:1-7/Jn 12:1-11 (257)").kind, CITATION)
+        self.assertEqual(classify_line("or, for the Optional Memorial, Gn 1:26-2:3/Mt 13:54-58 (559)").kind, CITATION)
+
+    def test_rank_separator_footnote(self):
+        self.assertEqual(classify_line("Solemnity [Holyday of Obligation]"), (RANK, ("Solemnity",)))
+        self.assertEqual(classify_line("-----").kind, SEPARATOR)
+        self.assertEqual(classify_line("7 The following readings may be used (250).").kind, FOOTNOTE)
+        self.assertEqual(classify_line("4 Optional Memorials are indicated by italics.").kind, FOOTNOTE)
+        self.assertEqual(classify_line("Notes:").kind, FOOTNOTE)
+        self.assertEqual(classify_line("[Saint Nicholas, Bishop]").kind, OTHER)
+
+
+if __name__ == "__main__":
+    unittest.main()
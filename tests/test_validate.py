@@ -0,0 +1,198 @@
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+from datetime import date, timedelta
+
+from src.validate import (
+    compile_field, compile_schema, check_type, validate_csv, read_columns,
+    RuleSummary, schema_name_for, validate_file, validate_paths, render_markdown,
+    validate_records, check_records, RecordValidationError,
+)
+from src.model import DayRecord
+
+
+class TestCompileField(unittest.TestCase):
+    def test_enum_and_flag_specs(self):
+        check = compile_field("enum[Advent|Christmas|Lent|Paschal Triduum|Easter|Ordinary Time]")
+        self.assertTrue(check("Ordinary Time"))
+        self.assertFalse(check("Ordinary"))
+        self.assertTrue(compile_field("0|1")("1"))
+        self.assertFalse(compile_field("0|1")("2"))
+
+    def test_numeric_range(self):
+        check = compile_field("1–31")
+        self.assertTrue(check("1"))
+        self.assertTrue(check("31"))
+        self.assertFalse(check("32"))
+        self.assertFalse(check("01"))
+
+    def test_dates(self):
+        self.assertTrue(compile_field("date")("2026-02-28"))
+        self.assertFalse(compile_field("date")("2026-02-29"))
+        self.assertFalse(compile_field("date")("2026-2-28"))
+        self.assertTrue(compile_field("date (Sun)")("2026-01-04"))
+        self.assertFalse(compile_field("date (Sun)")("2026-01-05"))
+        self.assertTrue(compile_field("YYYY-MM")("2026-12"))
+        self.assertFalse(compile_field("YYYY-MM")("2026-13"))
+
+    def test_weekday_range_and_blank(self):
+        check = compile_field("enum[Sun–Sat]")
+        self.assertTrue(check("Sunday"))
+        self.assertTrue(check("Wed"))
+        self.assertFalse(check("Funday"))
+        self.assertTrue(compile_field("enum[Solemnity|Feast|blank]").allow_blank)
+
+    def test_dual_colors(self):
+        check = compile_field("enum[White|Red|Green|Violet|Rose|Dual]")
+        self.assertTrue(check("Green/white"))
+        self.assertTrue(check("Violet or rose"))
+        self.assertFalse(check("Violet or black"))
+        self.assertFalse(check("Dual"))
+
+    def test_unknown_spec_raises(self):
+        with self.assertRaises(ValueError):
+            compile_field("timestamp")
+
+    def test_check_type_keeps_list_enums(self):
+        self.assertTrue(check_type("a", ["a", "b"]))
+        self.assertFalse(check_type("c", ["a", "b"]))
+        self.assertFalse(check_type("2026-13-01", "date"))
+
+
+class TestCompiledSchema(unittest.TestCase):
+    SCHEMA = {
+        "fields": {"Date": "date", "Flag": "0|1", "Rank": "enum[Feast|blank]"},
+        "required": ["Date", "Flag", "Rank", "Note"],
+        "primary_key": ["Date"],
+        "row_count": {"min": 1, "max": 3},
+    }
+
+    def test_column_rules(self):
+        header = ["Date", "Flag", "Rank"]
+        columns = [
+            ["2026-01-01", "2026-01-01", "2026-01-02", "bad"],
+            ["1", "", "2", "0"],
+            ["Feast", "", "Feast", "Memorial"],
+        ]
+        issues = {(i.rule, i.field): i for i in compile_schema(self.SCHEMA).validate_columns(header, columns)}
+        self.assertEqual(set(issues), {
+            ("missing_column", "Note"),
+            ("missing_value", "Flag"),
+            ("invalid_value", "Date"),
+            ("invalid_value", "Flag"),
+            ("invalid_value", "Rank"),
+            ("duplicate_key", "Date"),
+            ("row_count", ""),
+        })
+        self.assertEqual(issues[("missing_value", "Flag")].rows, [3])
+        self.assertEqual(issues[("invalid_value", "Flag")].values, ["2"])
+        self.assertEqual(issues[("duplicate_key", "Date")].rows, [2, 3])
+
+    def test_validate_csv_messages(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "t.csv"
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["Date", "Flag", "Rank", "Note"])
+                writer.writerow(["2026-01-01", "3", "", "x"])
+                writer.writerow(["2026-01-02", "0"])
+            header, columns = read_columns(path)
+            self.assertEqual(columns[3], ["x", ""])
+            errors = validate_csv(path, self.SCHEMA)
+        self.assertEqual(errors, ["Row 2: Invalid Flag='3' (expected 0|1)"])
+
+
+def write_csv(path, header, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+class TestStreamingValidation(unittest.TestCase):
+    def test_schema_names_match_any_year_and_case(self):
+        self.assertEqual(schema_name_for("day_data.csv"), "DAY_DATA.csv")
+        self.assertEqual(schema_name_for("weekly_index_2031.csv"), "weekly_index_2026.csv")
+        self.assertIsNone(schema_name_for("index.csv"))
+
+    def test_rule_summary_stays_bounded(self):
+        summary = RuleSummary("invalid_value", "Flag", max_samples=2, max_ranges=2)
+        summary.add([2, 3, 4, 10, 20, 21], ["a", "a", "b", "c", "d", "a"])
+        result = summary.to_dict()
+        self.assertEqual(result["count"], 6)
+        self.assertEqual(result["row_ranges"], [[2, 4], [10, 10]])
+        self.assertEqual(result["rows_omitted"], 2)
+        self.assertEqual(result["samples"], [{"value": "a", "count": 3}, {"value": "b", "count": 1}])
+        self.assertEqual(result["other_values"], 2)
+
+    def test_chunks_agree_with_whole_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "us_holidays_2026.csv"
+            rows = [[f"2026-01-{d:02d}", "Holiday", "1" if d % 3 else "x"] for d in range(1, 29)]
+            rows.append(["2026-01-02", "Again", "1"])
+            write_csv(path, ["Date", "HolidayName", "IsFederalHoliday"], rows)
+            result = validate_file(path, "us_holidays_2026.csv", chunk_rows=4)
+            whole = compile_schema("us_holidays_2026.csv").validate_columns(*read_columns(path))
+        issues = {i["rule"]: i for i in result["issues"]}
+        self.assertEqual(result["rows"], 29)
+        self.assertEqual(issues["duplicate_key"]["row_ranges"], [[3, 3], [30, 30]])
+        self.assertEqual(issues["invalid_value"]["count"], 9)
+        self.assertEqual(issues["row_count"]["samples"], [{"value": "29", "count": 1}])
+        self.assertEqual({i.rule: len(i.rows) or 1 for i in whole}, {r: i["count"] for r, i in issues.items()})
+
+    def test_rows_after_blank_lines_keep_their_file_line(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "us_holidays_2026.csv"
+            path.write_text("Date,HolidayName,IsFederalHoliday\n2026-01-01,A,1\n\n2026-01-02,B,x\n\n"
+                            "2026-01-01,C,1\n", encoding="utf-8")
+            errors = validate_csv(path, "us_holidays_2026.csv")
+            result = validate_file(path, "us_holidays_2026.csv", chunk_rows=1)
+        self.assertIn("Row 4: Invalid IsFederalHoliday='x' (expected 0|1)", errors)
+        issues = {i["rule"]: i for i in result["issues"]}
+        self.assertEqual(issues["invalid_value"]["row_ranges"], [[4, 4]])
+        self.assertEqual(issues["duplicate_key"]["row_ranges"], [[2, 2], [6, 6]])
+
+    def test_year_directories(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for year in (2026, 2027):
+                (Path(tmp) / str(year)).mkdir()
+                write_csv(Path(tmp) / str(year) / f"us_holidays_{year}.csv", ["Date", "HolidayName", "IsFederalHoliday"],
+                          [[f"{year}-01-01", "New Year's Day", "1"]])
+            write_csv(Path(tmp) / "index.csv", ["Year"], [["2026"]])
+            report = validate_paths([tmp], processes=1)
+        self.assertEqual(report["summary"]["files"], 2)
+        self.assertEqual(report["summary"]["issues_by_rule"], {"row_count": 2})
+        self.assertEqual(len(report["missing"]), 2 * 5)
+        self.assertEqual(len(report["skipped"]), 1)
+        self.assertIn("Expected 4–20 rows, found 1", render_markdown(report))
+
+
+class TestValidateRecords(unittest.TestCase):
+    def test_day_records_by_output_name(self):
+        records = [DayRecord(date(2026, 1, 1) + timedelta(days=n), "Weekday", "Weekday", "Green",
+                             weekday_col=5, display_date_number=1, week_row=1) for n in range(365)]
+        self.assertEqual(validate_records("day_data.csv", records), [])
+        records[10] = records[10].copy(liturgical_color="Plaid", is_first_friday=2)
+        issues = {(i.rule, i.field): i.rows for i in validate_records("day_data.csv", records)}
+        self.assertEqual(issues, {("invalid_value", "liturgical_color"): [12], ("invalid_value", "is_first_friday"): [12]})
+
+    def test_dicts_and_lists(self):
+        weeks = [{"WeekStart": "2026-01-05", "WeekEnd": "2026-01-11", "WeekLabel": "w", "Season": "Lent"}]
+        issues = validate_records("weekly_index_2026.csv", weeks)
+        self.assertEqual([i.rule for i in issues], ["row_count"])
+        rows = [["2026-01-01", "New Year's Day", 1]] * 4
+        issues = validate_records("us_holidays_2030.csv", rows, ["Date", "HolidayName", "IsFederalHoliday"])
+        self.assertEqual([(i.rule, i.rows) for i in issues], [("duplicate_key", [2, 3, 4, 5])])
+
+    def test_check_records_raises(self):
+        with self.assertRaises(RecordValidationError) as ctx:
+            check_records("us_holidays_2026.csv", [{"Date": "2026-13-01", "HolidayName": "X", "IsFederalHoliday": None}])
+        self.assertIn("Invalid Date='2026-13-01'", str(ctx.exception))
+        self.assertIn("Row 2: Missing value for IsFederalHoliday", ctx.exception.messages)
+        with self.assertRaises(ValueError):
+            validate_records("unknown.csv", [])
+
+
+if __name__ == "__main__":
+    unittest.main()